@@ -46,6 +46,17 @@ class Settings:
             "PUBSUB_SCRAPE_PROGRESS_TOPIC",
             "scrape-progress"
         )
+        # Scrape job messages that can never be processed are parked here
+        self.pubsub_scrape_jobs_dlq_topic = os.getenv(
+            "PUBSUB_SCRAPE_JOBS_DLQ_TOPIC",
+            "scrape-jobs-dlq"
+        )
+        
+        # Webhooks are signed with this key when set (X-Krawlr-Signature)
+        self.webhook_signing_secret = os.getenv(
+            "WEBHOOK_SIGNING_SECRET",
+            ""
+        )
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
 import logging
 from typing import Any, Callable, Optional
+
+import orjson
 from google.cloud import pubsub_v1
 from google.api_core import retry
 from app.core.config import get_settings
@@ -13,6 +16,33 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+@functools.lru_cache(maxsize=64)
+def _progress_fields(stage: str, progress_percent: int, message: str) -> bytes:
+    """
+    Encode the stage fields of a progress message, without the opening brace.
+    
+    Workers report a fixed set of stages, so each is only encoded once.
+    
+    Args:
+        stage: Scraping stage
+        progress_percent: Progress percentage (0-100)
+        message: Progress message
+        
+    Returns:
+        The JSON object's members and closing brace
+    """
+    return orjson.dumps({
+        "stage": stage,
+        "progress_percent": progress_percent,
+        "message": message
+    })[1:]
+
+
+def _progress_prefix(job_id: str) -> bytes:
+    """Encode the start of a progress message for a job, up to its stage fields."""
+    return b'{"job_id":' + orjson.dumps(job_id) + b','
+
+
 class PubSubClient:
     """Google Cloud Pub/Sub client wrapper."""
     
@@ -35,6 +65,10 @@ class PubSubClient:
             self.project_id, 
             settings.pubsub_scrape_progress_topic
         )
+        self.scrape_jobs_dlq_topic = self.publisher.topic_path(
+            self.project_id, 
+            settings.pubsub_scrape_jobs_dlq_topic
+        )
         
         logger.info(f"PubSubClient initialized for project: {self.project_id}")
     
@@ -68,7 +102,7 @@ class PubSubClient:
         }
         
         # Convert to JSON bytes
-        data = json.dumps(message_data).encode("utf-8")
+        data = orjson.dumps(message_data)
         
         # Publish with retry
         future = self.publisher.publish(
@@ -79,7 +113,9 @@ class PubSubClient:
             priority=priority
         )
         
-        message_id = future.result()
+        # Publisher futures are concurrent.futures.Future subclasses; awaiting
+        # them this way leaves the event loop free for other work meanwhile
+        message_id = await asyncio.wrap_future(future)
         logger.info(f"Published scrape job {job_id} to Pub/Sub: {message_id}")
         return message_id
     
@@ -91,7 +127,8 @@ class PubSubClient:
         status: str,
         duration_seconds: float,
         data_quality_score: Optional[float] = None,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        webhook_url: Optional[str] = None
     ) -> str:
         """
         Publish scrape completion notification.
@@ -104,6 +141,8 @@ class PubSubClient:
             duration_seconds: Scrape duration
             data_quality_score: Optional data quality score
             error: Optional error message if failed
+            webhook_url: The job's webhook URL, so the webhook service
+                doesn't have to read the job back from Firestore
             
         Returns:
             Message ID from Pub/Sub
@@ -115,10 +154,11 @@ class PubSubClient:
             "status": status,
             "duration_seconds": duration_seconds,
             "data_quality_score": data_quality_score,
-            "error": error
+            "error": error,
+            "webhook_url": webhook_url
         }
         
-        data = json.dumps(message_data).encode("utf-8")
+        data = orjson.dumps(message_data)
         
         future = self.publisher.publish(
             self.scrape_completed_topic,
@@ -127,7 +167,7 @@ class PubSubClient:
             status=status
         )
         
-        message_id = future.result()
+        message_id = await asyncio.wrap_future(future)
         logger.info(f"Published completion for job {job_id}: {message_id}")
         return message_id
     
@@ -150,14 +190,7 @@ class PubSubClient:
         Returns:
             Message ID from Pub/Sub
         """
-        message_data = {
-            "job_id": job_id,
-            "stage": stage,
-            "progress_percent": progress_percent,
-            "message": message
-        }
-        
-        data = json.dumps(message_data).encode("utf-8")
+        data = _progress_prefix(job_id) + _progress_fields(stage, progress_percent, message)
         
         future = self.publisher.publish(
             self.scrape_progress_topic,
@@ -165,14 +198,78 @@ class PubSubClient:
             job_id=job_id
         )
         
-        message_id = future.result()
+        message_id = await asyncio.wrap_future(future)
         logger.debug(f"Published progress for job {job_id}: {progress_percent}%")
         return message_id
     
+    async def publish_scrape_progress_batch(
+        self,
+        job_id: str,
+        updates: list[tuple[str, int, str]]
+    ) -> list[str]:
+        """
+        Publish several progress updates for a job in one go.
+        
+        All messages are handed to the publisher before waiting on any of
+        them, so the client's batching sends them together.
+        
+        Args:
+            job_id: Job identifier
+            updates: (stage, progress_percent, message) tuples, in order
+            
+        Returns:
+            Message IDs from Pub/Sub
+        """
+        # The job_id part is encoded once for the whole batch
+        prefix = _progress_prefix(job_id)
+        futures = [
+            self.publisher.publish(
+                self.scrape_progress_topic,
+                prefix + _progress_fields(stage, progress_percent, message),
+                job_id=job_id
+            )
+            for stage, progress_percent, message in updates
+        ]
+        
+        message_ids = await asyncio.gather(*map(asyncio.wrap_future, futures))
+        logger.debug(f"Published {len(message_ids)} progress updates for job {job_id}")
+        return message_ids
+    
+    async def publish_dead_letter(
+        self,
+        data: bytes,
+        reason: str,
+        attributes: Optional[dict[str, str]] = None
+    ) -> str:
+        """
+        Park a scrape job message that can't be processed on the dead-letter topic.
+        
+        Args:
+            data: Original message payload, unchanged
+            reason: Why the message was rejected
+            attributes: Original message attributes
+            
+        Returns:
+            Message ID from Pub/Sub
+        """
+        future = self.publisher.publish(
+            self.scrape_jobs_dlq_topic,
+            data,
+            **{**(attributes or {}), "reason": reason}
+        )
+        
+        message_id = await asyncio.wrap_future(future)
+        logger.warning(f"Dead-lettered scrape job message: {reason}")
+        return message_id
+    
     def subscribe_to_scrape_jobs(
         self,
         callback: Callable[[pubsub_v1.subscriber.message.Message], None],
-        subscription_name: str = "scrape-jobs-worker"
+        subscription_name: str = "scrape-jobs-worker",
+        flow_control: Optional[pubsub_v1.types.FlowControl] = None,
+        scheduler: Optional[pubsub_v1.subscriber.scheduler.Scheduler] = None,
+        await_callbacks_on_shutdown: bool = False,
+        max_delivery_attempts: int = 5
     ) -> pubsub_v1.subscriber.futures.StreamingPullFuture:
         """
         Subscribe to scrape jobs topic.
@@ -180,6 +277,12 @@ class PubSubClient:
         Args:
             callback: Function to handle incoming messages
             subscription_name: Subscription identifier
+            flow_control: Optional limits on outstanding messages/bytes
+            scheduler: Optional scheduler that runs the callbacks
+            await_callbacks_on_shutdown: If True, the future only resolves after
+                cancel() once running callbacks have finished
+            max_delivery_attempts: Deliveries of a message before Pub/Sub moves
+                it to the dead-letter topic (applied when the subscription is created)
             
         Returns:
             Streaming pull future
@@ -195,7 +298,12 @@ class PubSubClient:
                 request={
                     "name": subscription_path,
                     "topic": self.scrape_jobs_topic,
-                    "ack_deadline_seconds": 600  # 10 minutes for long scrapes
+                    "ack_deadline_seconds": 600,  # 10 minutes for long scrapes
+                    # Nacked jobs are redelivered until they run out of attempts
+                    "dead_letter_policy": {
+                        "dead_letter_topic": self.scrape_jobs_dlq_topic,
+                        "max_delivery_attempts": max_delivery_attempts
+                    }
                 }
             )
             logger.info(f"Created subscription: {subscription_name}")
@@ -205,7 +313,10 @@ class PubSubClient:
         # Subscribe with callback
         streaming_pull_future = self.subscriber.subscribe(
             subscription_path,
-            callback
+            callback,
+            flow_control=flow_control or (),
+            scheduler=scheduler,
+            await_callbacks_on_shutdown=await_callbacks_on_shutdown
         )
         
         logger.info(f"Subscribed to {subscription_name}")
@@ -214,7 +325,9 @@ class PubSubClient:
     def subscribe_to_scrape_completed(
         self,
         callback: Callable[[pubsub_v1.subscriber.message.Message], None],
-        subscription_name: str = "scrape-completed-webhook"
+        subscription_name: str = "scrape-completed-webhook",
+        flow_control: Optional[pubsub_v1.types.FlowControl] = None,
+        scheduler: Optional[pubsub_v1.subscriber.scheduler.Scheduler] = None
     ) -> pubsub_v1.subscriber.futures.StreamingPullFuture:
         """
         Subscribe to scrape completed topic for webhooks.
@@ -222,6 +335,8 @@ class PubSubClient:
         Args:
             callback: Function to handle incoming messages
             subscription_name: Subscription identifier
+            flow_control: Optional limits on outstanding messages/bytes
+            scheduler: Optional scheduler that runs the callbacks
             
         Returns:
             Streaming pull future
@@ -237,7 +352,13 @@ class PubSubClient:
                 request={
                     "name": subscription_path,
                     "topic": self.scrape_completed_topic,
-                    "ack_deadline_seconds": 60
+                    "ack_deadline_seconds": 60,
+                    # Webhooks nacked while their host's circuit is open come
+                    # back after a backoff instead of straight away
+                    "retry_policy": {
+                        "minimum_backoff": {"seconds": 10},
+                        "maximum_backoff": {"seconds": 600}
+                    }
                 }
             )
             logger.info(f"Created subscription: {subscription_name}")
@@ -246,7 +367,9 @@ class PubSubClient:
         
         streaming_pull_future = self.subscriber.subscribe(
             subscription_path,
-            callback
+            callback,
+            flow_control=flow_control or (),
+            scheduler=scheduler
         )
         
         logger.info(f"Subscribed to {subscription_name}")
@@ -257,7 +380,8 @@ class PubSubClient:
         topics = [
             self.scrape_jobs_topic,
             self.scrape_completed_topic,
-            self.scrape_progress_topic
+            self.scrape_progress_topic,
+            self.scrape_jobs_dlq_topic
         ]
         
         for topic_path in topics:
@@ -266,6 +390,20 @@ class PubSubClient:
                 logger.info(f"Created topic: {topic_path}")
             except Exception as e:
                 logger.debug(f"Topic {topic_path} already exists: {e}")
+        
+        # Messages published to a topic without subscriptions are dropped, so
+        # dead letters need one to be kept for inspection
+        dlq_subscription = self.subscriber.subscription_path(
+            self.project_id,
+            f"{settings.pubsub_scrape_jobs_dlq_topic}-sub"
+        )
+        try:
+            self.subscriber.create_subscription(
+                request={"name": dlq_subscription, "topic": self.scrape_jobs_dlq_topic}
+            )
+            logger.info(f"Created subscription: {dlq_subscription}")
+        except Exception as e:
+            logger.debug(f"Subscription {dlq_subscription} already exists: {e}")
 
 
 # Singleton instance
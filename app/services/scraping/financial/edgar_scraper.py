@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import threading
+import time
+from contextlib import asynccontextmanager
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Optional
 import re
 import os
 
+if TYPE_CHECKING:
+    import httpx
+
 # PRIVATE COMPANY ALLOWLIST - Known unicorns that should NEVER match to public tickers
 PRIVATE_COMPANY_ALLOWLIST = {
     "stripe": {"domain": "stripe.com", "valuation": "$65B+", "name": "Stripe, Inc."},
@@ -29,6 +37,18 @@ PRIVATE_COMPANY_ALLOWLIST = {
     "plaid": {"domain": "plaid.com", "valuation": "$13.4B+", "name": "Plaid Inc."},
 }
 
+# Form 4 filings fetched in parallel; SEC fair-access policy allows 10 requests/second
+SEC_FETCH_CONCURRENCY = 8
+# Form 4 fetches started per second, process-wide, leaving headroom under the
+# SEC limit for the other EDGAR calls a scrape makes
+SEC_REQUESTS_PER_SECOND = 8
+# Next free start time; a thread lock rather than an AsyncLimiter, whose
+# waiters belong to one event loop, so callers on any loop share the budget
+_sec_next_slot = 0.0
+_sec_slot_lock = threading.Lock()
+# Stop once this many Form 4 filings have yielded insider rows
+MAX_FORM4_FILINGS = 20
+
 
 def is_private_unicorn(company_name: str) -> dict | None:
     """
@@ -109,20 +129,19 @@ async def verify_company_domain(ticker: str, expected_domain: str) -> bool:
         return False
 
 
-async def verify_has_sec_filings(ticker: str) -> bool:
+async def verify_has_sec_filings(ticker: str, client: Optional[httpx.AsyncClient] = None) -> bool:
     """
     Verify that a ticker actually has SEC filings (i.e., is a real public US company).
     This prevents routing private companies or foreign stocks to EDGAR.
     
     Args:
         ticker: Stock ticker symbol
+        client: Optional shared httpx.AsyncClient
         
     Returns:
         True if company has SEC filings, False otherwise
     """
     try:
-        import httpx
-        
         print(f"[EDGAR] 🔍 Verifying SEC filings for ticker: {ticker}")
         
         # Try to get company facts from SEC API
@@ -138,9 +157,9 @@ async def verify_has_sec_filings(ticker: str) -> bool:
             'User-Agent': 'Mozilla/5.0 (compatible; CompanyResearch/1.0; +http://example.com)'
         }
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with _borrow_http_client(client, timeout=10.0) as http:
             # Try to get CIK for this ticker
-            response = await client.get(cik_url, params=params, headers=headers, follow_redirects=True)
+            response = await http.get(cik_url, params=params, headers=headers, follow_redirects=True)
             
             # If we get a 404 or error, no SEC filings exist
             if response.status_code == 404:
@@ -248,13 +267,31 @@ except ImportError as e:
 logger = logging.getLogger(__name__)
 
 
-async def resolve_company_ticker(company_name: str) -> dict | None:
+@asynccontextmanager
+async def _borrow_http_client(client: Optional[httpx.AsyncClient] = None, timeout: float = 10.0):
+    """
+    Yield the caller's shared httpx client, or a short-lived one if none was given.
+    
+    Passing a long-lived client lets batch callers reuse pooled connections
+    (and their TLS sessions) across many lookups.
+    """
+    if client is not None:
+        yield client
+        return
+    
+    import httpx
+    async with httpx.AsyncClient(timeout=timeout) as own_client:
+        yield own_client
+
+
+async def resolve_company_ticker(company_name: str, client: Optional[httpx.AsyncClient] = None) -> dict | None:
     """
     Resolve a company name to its ticker symbol using multiple strategies.
     Includes domain verification and private unicorn detection.
     
     Args:
         company_name: Company name (e.g., "Apple", "Microsoft Corporation")
+        client: Optional shared httpx.AsyncClient to reuse for lookups
         
     Returns:
         Dictionary with ticker and metadata, or None if private unicorn
@@ -278,7 +315,7 @@ async def resolve_company_ticker(company_name: str) -> dict | None:
     ticker_info = await _lookup_ticker_from_csv(company_name)
     if ticker_info:
         # Verify this ticker actually has SEC filings
-        has_filings = await verify_has_sec_filings(ticker_info['ticker'])
+        has_filings = await verify_has_sec_filings(ticker_info['ticker'], client=client)
         if not has_filings:
             print(f"[EDGAR] ✗ Rejecting CSV match - no SEC filings (likely private/foreign)")
             return None
@@ -287,10 +324,10 @@ async def resolve_company_ticker(company_name: str) -> dict | None:
         return ticker_info
     
     # Strategy 2: Try Yahoo Finance search (most reliable)
-    ticker_info = await _search_yahoo_finance(company_name)
+    ticker_info = await _search_yahoo_finance(company_name, client=client)
     if ticker_info:
         # Verify this ticker actually has SEC filings
-        has_filings = await verify_has_sec_filings(ticker_info['ticker'])
+        has_filings = await verify_has_sec_filings(ticker_info['ticker'], client=client)
         if not has_filings:
             print(f"[EDGAR] ✗ Rejecting Yahoo match - no SEC filings (likely private/foreign)")
             return None
@@ -299,7 +336,7 @@ async def resolve_company_ticker(company_name: str) -> dict | None:
         return ticker_info
     
     # Strategy 3: Try SEC EDGAR CIK search
-    ticker_info = await _search_edgar_cik(company_name)
+    ticker_info = await _search_edgar_cik(company_name, client=client)
     if ticker_info:
         print(f"[EDGAR] ✓ Found via EDGAR CIK: {ticker_info['ticker']}")
         return ticker_info
@@ -367,14 +404,12 @@ async def _lookup_ticker_from_csv(company_name: str) -> dict | None:
         return None
 
 
-async def _search_yahoo_finance(company_name: str) -> dict | None:
+async def _search_yahoo_finance(company_name: str, client: Optional[httpx.AsyncClient] = None) -> dict | None:
     """
     Search for ticker using Yahoo Finance API.
     This is the most reliable method for finding current tickers.
     """
     try:
-        import httpx
-        
         # Yahoo Finance query API
         url = "https://query2.finance.yahoo.com/v1/finance/search"
         params = {
@@ -389,8 +424,8 @@ async def _search_yahoo_finance(company_name: str) -> dict | None:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params, headers=headers)
+        async with _borrow_http_client(client, timeout=10.0) as http:
+            response = await http.get(url, params=params, headers=headers)
             response.raise_for_status()
             data = response.json()
             
@@ -422,62 +457,64 @@ async def _search_yahoo_finance(company_name: str) -> dict | None:
         return None
 
 
-async def _search_edgar_cik(company_name: str) -> dict | None:
+async def _load_company_tickers(client: Optional[httpx.AsyncClient] = None) -> dict:
+    """Download SEC's company_tickers.json."""
+    url = "https://www.sec.gov/files/company_tickers.json"
+    headers = {
+        'User-Agent': 'Krawlr scraper contact@krawlr.com',
+        'Accept-Encoding': 'gzip, deflate',
+        'Host': 'www.sec.gov'
+    }
+    
+    async with _borrow_http_client(client, timeout=15.0) as http:
+        response = await http.get(url, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+
+async def _search_edgar_cik(company_name: str, client: Optional[httpx.AsyncClient] = None) -> dict | None:
     """
     Search SEC EDGAR CIK (Central Index Key) database.
     Official SEC data but slower and less user-friendly.
     """
     try:
-        import httpx
+        data = await _load_company_tickers(client)
         
-        # SEC EDGAR company tickers JSON
-        url = "https://www.sec.gov/files/company_tickers.json"
-        headers = {
-            'User-Agent': 'Krawlr scraper contact@krawlr.com',
-            'Accept-Encoding': 'gzip, deflate',
-            'Host': 'www.sec.gov'
-        }
+        # Search through the data
+        company_lower = company_name.lower().strip()
+        company_clean = re.sub(r'\b(inc|corp|corporation|company|co|ltd|limited)\b\.?', '', company_lower).strip()
         
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Search through the data
-            company_lower = company_name.lower().strip()
-            company_clean = re.sub(r'\b(inc|corp|corporation|company|co|ltd|limited)\b\.?', '', company_lower).strip()
+        best_match = None
+        best_score = 0.0
+        
+        for item in data.values():
+            edgar_name = item['title'].lower().strip()
+            edgar_clean = re.sub(r'\b(inc|corp|corporation|company|co|ltd|limited)\b\.?', '', edgar_name).strip()
             
-            best_match = None
-            best_score = 0.0
+            # Exact match
+            if company_clean == edgar_clean or company_lower == edgar_name:
+                return {
+                    'ticker': item['ticker'],
+                    'company_name': item['title'],
+                    'exchange': 'SEC',
+                    'cik': str(item['cik_str']).zfill(10),
+                    'method': 'edgar_search'
+                }
             
-            for item in data.values():
-                edgar_name = item['title'].lower().strip()
-                edgar_clean = re.sub(r'\b(inc|corp|corporation|company|co|ltd|limited)\b\.?', '', edgar_name).strip()
-                
-                # Exact match
-                if company_clean == edgar_clean or company_lower == edgar_name:
-                    return {
-                        'ticker': item['ticker'],
-                        'company_name': item['title'],
-                        'exchange': 'SEC',
-                        'cik': str(item['cik_str']).zfill(10),
-                        'method': 'edgar_search'
-                    }
-                
-                # Fuzzy match
-                from difflib import SequenceMatcher
-                score = SequenceMatcher(None, company_clean, edgar_clean).ratio()
-                if score > best_score and score > 0.85:
-                    best_score = score
-                    best_match = {
-                        'ticker': item['ticker'],
-                        'company_name': item['title'],
-                        'exchange': 'SEC',
-                        'cik': str(item['cik_str']).zfill(10),
-                        'method': 'edgar_search'
-                    }
-            
-            return best_match
+            # Fuzzy match
+            from difflib import SequenceMatcher
+            score = SequenceMatcher(None, company_clean, edgar_clean).ratio()
+            if score > best_score and score > 0.85:
+                best_score = score
+                best_match = {
+                    'ticker': item['ticker'],
+                    'company_name': item['title'],
+                    'exchange': 'SEC',
+                    'cik': str(item['cik_str']).zfill(10),
+                    'method': 'edgar_search'
+                }
+        
+        return best_match
     
     except Exception as e:
         print(f"[EDGAR] EDGAR CIK search failed: {e}")
@@ -841,6 +878,46 @@ async def identify_company_ticker(company_name: str) -> str | None:
     return ticker_info['ticker'] if ticker_info else None
 
 
+def _form4_insiders(filing) -> list[dict]:
+    """Parse one Form 4 filing into insider/position rows (blocking SEC fetch)."""
+    try:
+        form4 = filing.obj()
+        if not form4:
+            return []
+        
+        summary = form4.get_ownership_summary()
+        if not summary:
+            return []
+        
+        df = summary.to_dataframe()
+        if df is None or df.empty or 'Insider' not in df.columns or 'Position' not in df.columns:
+            return []
+        
+        return [
+            {'insider': str(row['Insider']), 'position': str(row['Position'])}
+            for _, row in df[['Insider', 'Position']].iterrows()
+        ]
+    
+    except Exception:
+        return []
+
+
+async def _sec_pace() -> None:
+    """Wait for the next slot in the process-wide SEC request budget."""
+    global _sec_next_slot
+    with _sec_slot_lock:
+        now = time.monotonic()
+        slot = max(now, _sec_next_slot)
+        _sec_next_slot = slot + 1 / SEC_REQUESTS_PER_SECOND
+    await asyncio.sleep(slot - now)
+
+
+async def _fetch_form4_insiders(filing) -> list[dict]:
+    """Fetch one Form 4 filing's insiders, paced by the SEC rate limit."""
+    await _sec_pace()
+    return await asyncio.to_thread(_form4_insiders, filing)
+
+
 async def get_company_insiders(ticker: str) -> list[dict] | None:
     """Get list of company insiders from Form 4 filings (past 6 months)."""
     try:
@@ -862,8 +939,9 @@ async def get_company_insiders(ticker: str) -> list[dict] | None:
         print(f"[EDGAR] Fetching insiders for ticker: {ticker}")
         
         date_range = (datetime.now() - timedelta(days=6*30)).strftime('%Y-%m-%d:')
-        company = Company(ticker)
-        filings = company.get_filings(form='4', filing_date=date_range)
+        # edgartools is synchronous, so keep its network calls off the event loop
+        company = await asyncio.to_thread(Company, ticker)
+        filings = await asyncio.to_thread(company.get_filings, form='4', filing_date=date_range)
         
         if not filings:
             return []
@@ -871,31 +949,20 @@ async def get_company_insiders(ticker: str) -> list[dict] | None:
         insiders_data = []
         processed_count = 0
         
-        for filing in filings:
-            try:
-                form4 = filing.obj()
-                if not form4:
-                    continue
-                
-                summary = form4.get_ownership_summary()
-                if not summary:
-                    continue
-                
-                df = summary.to_dataframe()
-                if df is not None and not df.empty:
-                    if 'Insider' in df.columns and 'Position' in df.columns:
-                        for _, row in df[['Insider', 'Position']].iterrows():
-                            insiders_data.append({
-                                'insider': str(row['Insider']),
-                                'position': str(row['Position'])
-                            })
-                        processed_count += 1
-                
-                if processed_count >= 20:
-                    break
-                    
-            except Exception:
-                continue
+        # Each filing.obj() is a separate SEC request, so fetch a batch at a time
+        filings_iter = iter(filings)
+        while processed_count < MAX_FORM4_FILINGS:
+            batch = list(islice(filings_iter, SEC_FETCH_CONCURRENCY))
+            if not batch:
+                break
+            
+            batch_rows = await asyncio.gather(
+                *(_fetch_form4_insiders(filing) for filing in batch)
+            )
+            for rows in batch_rows:
+                if rows and processed_count < MAX_FORM4_FILINGS:
+                    insiders_data.extend(rows)
+                    processed_count += 1
         
         # Remove duplicates
         seen = set()
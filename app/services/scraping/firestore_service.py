@@ -1,3 +1,5 @@
+import asyncio
+
 from app.core.database import db
 from datetime import datetime, timezone
 from typing import Dict, Optional, List
@@ -160,7 +162,8 @@ class FirestoreService:
         """
         from datetime import timezone as tz
         company_ref = self.db.collection(self.companies_collection).document(domain)
-        company_ref.set({
+        # Blocking write runs in a thread so callers can overlap other I/O with it
+        await asyncio.to_thread(company_ref.set, {
             'domain': domain,
             'data': result,
             'last_scraped': datetime.now(tz.utc),
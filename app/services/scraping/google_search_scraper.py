@@ -27,7 +27,7 @@ class GoogleSearchScraper:
             'Upgrade-Insecure-Requests': '1'
         }
     
-    async def search_founders(self, company_name: str, limit: int = 10) -> List[Dict[str, str]]:
+    async def search_founders(self, company_name: str, limit: int = 10, client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, str]]:
         """
         Search for founders and executives using LinkedIn.
         Query: site:linkedin.com/in "<company name>" founder OR CEO
@@ -35,7 +35,7 @@ class GoogleSearchScraper:
         print(f"  🔍 Searching for founders and executives of {company_name}...")
         
         query = f'site:linkedin.com/in "{company_name}" founder OR CEO OR "chief executive"'
-        results = await self._search(query, limit=limit)
+        results = await self._search(query, limit=limit, client=client)
         
         founders = []
         for result in results:
@@ -46,7 +46,7 @@ class GoogleSearchScraper:
         print(f"  ✅ Found {len(founders)} founder/executive profile(s)")
         return founders
     
-    async def search_funding(self, company_name: str, limit: int = 10) -> List[Dict[str, str]]:
+    async def search_funding(self, company_name: str, limit: int = 10, client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, str]]:
         """
         Search for funding information.
         Query: "<company name>" funding OR "raised" OR "Series A" OR "Series B"
@@ -54,7 +54,7 @@ class GoogleSearchScraper:
         print(f"  💰 Searching for funding information for {company_name}...")
         
         query = f'"{company_name}" (funding OR raised OR "Series A" OR "Series B" OR "Series C" OR investment OR valuation)'
-        results = await self._search(query, limit=limit)
+        results = await self._search(query, limit=limit, client=client)
         
         funding_info = []
         for result in results:
@@ -65,7 +65,7 @@ class GoogleSearchScraper:
         print(f"  ✅ Found {len(funding_info)} funding mention(s)")
         return funding_info
     
-    async def search_competitors(self, domain: str, limit: int = 10) -> List[Dict[str, str]]:
+    async def search_competitors(self, domain: str, limit: int = 10, client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, str]]:
         """
         Search for competitors using related: operator.
         Query: related:targetwebsite.com
@@ -73,7 +73,7 @@ class GoogleSearchScraper:
         print(f"  🏢 Searching for competitors of {domain}...")
         
         query = f'related:{domain}'
-        results = await self._search(query, limit=limit)
+        results = await self._search(query, limit=limit, client=client)
         
         competitors = []
         for result in results:
@@ -88,7 +88,7 @@ class GoogleSearchScraper:
         print(f"  ✅ Found {len(competitors)} competitor(s)")
         return competitors
     
-    async def search_news(self, company_name: str, limit: int = 10) -> List[Dict[str, str]]:
+    async def search_news(self, company_name: str, limit: int = 10, client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, str]]:
         """
         Search for recent news mentions.
         Uses Google News search.
@@ -97,7 +97,7 @@ class GoogleSearchScraper:
         
         query = f'"{company_name}"'
         # Add tbm=nws for news search
-        results = await self._search(query, limit=limit, search_type='nws')
+        results = await self._search(query, limit=limit, search_type='nws', client=client)
         
         news_items = []
         for result in results:
@@ -113,7 +113,13 @@ class GoogleSearchScraper:
         print(f"  ✅ Found {len(news_items)} news mention(s)")
         return news_items
     
-    async def _search(self, query: str, limit: int = 10, search_type: Optional[str] = None) -> List[Dict[str, str]]:
+    async def _search(
+        self,
+        query: str,
+        limit: int = 10,
+        search_type: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Dict[str, str]]:
         """
         Perform a Google search and extract results.
         Falls back to Brave Search API if Google scraping fails.
@@ -122,6 +128,7 @@ class GoogleSearchScraper:
             query: Search query
             limit: Maximum number of results
             search_type: Optional search type ('nws' for news)
+            client: Optional shared httpx.AsyncClient to reuse connections
         """
         # Try Google first
         try:
@@ -134,7 +141,7 @@ class GoogleSearchScraper:
             # Add delay to avoid rate limiting
             await asyncio.sleep(1)
             
-            response = await http_client.get(url, headers=self.headers)
+            response = await http_client.get(url, headers=self.headers, client=client)
             if response:
                 results = self._parse_search_results(response.text)
                 if results:
@@ -147,15 +154,21 @@ class GoogleSearchScraper:
             print(f"  ⚠️  Google search error: {str(e)}, trying Brave API...")
         
         # Fallback to Brave Search API
-        return await self._search_brave(query, limit)
+        return await self._search_brave(query, limit, client=client)
     
-    async def _search_brave(self, query: str, limit: int = 10) -> List[Dict[str, str]]:
+    async def _search_brave(
+        self,
+        query: str,
+        limit: int = 10,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Dict[str, str]]:
         """
         Fallback search using Brave Search API.
         
         Args:
             query: Search query
             limit: Maximum number of results
+            client: Optional shared httpx.AsyncClient to reuse connections
         """
         if not self.brave_api_key:
             print(f"  ❌ Brave API key not found, cannot fallback")
@@ -172,24 +185,27 @@ class GoogleSearchScraper:
                 "count": min(limit, 20)  # Brave max is 20
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                results = []
-                
-                # Parse Brave API response
-                for item in data.get("web", {}).get("results", []):
-                    results.append({
-                        'title': item.get('title', ''),
-                        'url': item.get('url', ''),
-                        'description': item.get('description', ''),
-                        'source': ''
-                    })
-                
-                print(f"  ✅ Brave API returned {len(results)} results")
-                return results
+            if client is not None:
+                response = await client.get(url, headers=headers, params=params, timeout=10.0)
+            else:
+                async with httpx.AsyncClient(timeout=10.0) as own_client:
+                    response = await own_client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            
+            data = response.json()
+            results = []
+            
+            # Parse Brave API response
+            for item in data.get("web", {}).get("results", []):
+                results.append({
+                    'title': item.get('title', ''),
+                    'url': item.get('url', ''),
+                    'description': item.get('description', ''),
+                    'source': ''
+                })
+            
+            print(f"  ✅ Brave API returned {len(results)} results")
+            return results
         
         except Exception as e:
             print(f"  ❌ Brave API error: {str(e)}")
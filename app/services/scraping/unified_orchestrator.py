@@ -42,6 +42,7 @@ from app.services.scraping.website_scraper import scrape_website
 from app.services.scraping.news import scrape_news_and_press
 from app.services.scraping.competitors import scrape_competitors
 from app.services.scraping.founders import scrape_founders
+from app.services.utils.validators import SecurityValidator, CompanyNameExtractor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -57,199 +58,6 @@ else:
     logger.warning("OPENAI_API_KEY not found - AI enrichment will be disabled")
 
 
-class SecurityValidator:
-    """Validates and sanitizes inputs to prevent security issues"""
-    
-    # Blocked domains (malicious, internal networks, localhost)
-    BLOCKED_DOMAINS = {
-        'localhost', '127.0.0.1', '0.0.0.0', '::1',
-        '192.168.', '10.', '172.16.', '172.31.',  # Private IP ranges
-        'metadata.google.internal',  # Cloud metadata endpoints
-        '169.254.169.254',  # AWS metadata
-    }
-    
-    # Allowed protocols
-    ALLOWED_PROTOCOLS = {'http', 'https'}
-    
-    # Maximum URL length
-    MAX_URL_LENGTH = 2048
-    
-    # Maximum company name length
-    MAX_COMPANY_NAME_LENGTH = 200
-    
-    @classmethod
-    def validate_url(cls, url: str) -> tuple[bool, Optional[str]]:
-        """
-        Validate URL for security issues
-        
-        Returns:
-            (is_valid, error_message)
-        """
-        if not url or not isinstance(url, str):
-            return False, "URL must be a non-empty string"
-        
-        # Check length
-        if len(url) > cls.MAX_URL_LENGTH:
-            return False, f"URL exceeds maximum length of {cls.MAX_URL_LENGTH}"
-        
-        # Parse URL
-        try:
-            parsed = urlparse(url)
-        except Exception as e:
-            return False, f"Invalid URL format: {str(e)}"
-        
-        # Check protocol
-        if parsed.scheme.lower() not in cls.ALLOWED_PROTOCOLS:
-            return False, f"Protocol must be http or https, got: {parsed.scheme}"
-        
-        # Check for missing domain
-        if not parsed.netloc:
-            return False, "URL must include a domain"
-        
-        # Extract domain/IP
-        domain = parsed.netloc.lower()
-        
-        # Remove port if present
-        if ':' in domain:
-            domain = domain.split(':')[0]
-        
-        # Check blocked domains
-        for blocked in cls.BLOCKED_DOMAINS:
-            if blocked in domain:
-                return False, f"Access to {domain} is not allowed"
-        
-        # Check for suspicious patterns
-        suspicious_patterns = [
-            r'\.\./',  # Path traversal
-            r'file://',  # File protocol
-            r'ftp://',  # FTP protocol
-            r'javascript:',  # JS injection
-            r'data:',  # Data URLs
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, url.lower()):
-                return False, f"URL contains suspicious pattern: {pattern}"
-        
-        return True, None
-    
-    @classmethod
-    def sanitize_company_name(cls, name: str) -> str:
-        """
-        Sanitize company name
-        
-        Args:
-            name: Raw company name
-            
-        Returns:
-            Sanitized company name
-        """
-        if not name or not isinstance(name, str):
-            return ""
-        
-        # Truncate to max length
-        name = name[:cls.MAX_COMPANY_NAME_LENGTH]
-        
-        # Remove control characters and excessive whitespace
-        name = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', name)
-        name = re.sub(r'\s+', ' ', name)
-        name = name.strip()
-        
-        return name
-
-
-class CompanyNameExtractor:
-    """Extracts company name from domain"""
-    
-    # Common TLDs to remove
-    TLDS = {
-        '.com', '.co', '.io', '.net', '.org', '.ai', '.app', '.dev',
-        '.tech', '.cloud', '.ly', '.me', '.xyz', '.site', '.online'
-    }
-    
-    # Words to remove from company names
-    STOP_WORDS = {
-        'www', 'api', 'dev', 'staging', 'prod', 'app', 'portal',
-        'dashboard', 'admin', 'beta', 'demo'
-    }
-    
-    @classmethod
-    def extract_from_url(cls, url: str) -> str:
-        """
-        Extract company name from URL
-        
-        Examples:
-            https://google.com -> Google
-            https://stripe.com -> Stripe
-            https://pxxl.app -> PXXL
-            https://www.facebook.com -> Facebook
-            https://api.openai.com -> OpenAI
-        
-        Args:
-            url: Website URL
-            
-        Returns:
-            Extracted company name
-        """
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            
-            # Remove www prefix
-            if domain.startswith('www.'):
-                domain = domain[4:]
-            
-            # Remove port
-            if ':' in domain:
-                domain = domain.split(':')[0]
-            
-            # Split by dots
-            parts = domain.split('.')
-            
-            # Remove TLDs and common subdomains
-            filtered_parts = []
-            for part in parts:
-                # Skip if it's a TLD pattern
-                if any(domain.endswith(tld) for tld in cls.TLDS):
-                    if part == parts[-1] or f".{part}" in cls.TLDS:
-                        continue
-                
-                # Skip stop words
-                if part in cls.STOP_WORDS:
-                    continue
-                
-                filtered_parts.append(part)
-            
-            # Get the main domain part (usually first meaningful part)
-            if filtered_parts:
-                company_name = filtered_parts[0]
-            else:
-                company_name = parts[0] if parts else "Unknown"
-            
-            # Capitalize properly
-            # Handle special cases like "openai" -> "OpenAI"
-            if company_name.lower() == 'openai':
-                return 'OpenAI'
-            elif company_name.lower() == 'github':
-                return 'GitHub'
-            elif company_name.lower() == 'linkedin':
-                return 'LinkedIn'
-            elif company_name.lower() == 'youtube':
-                return 'YouTube'
-            elif company_name.lower() == 'paypal':
-                return 'PayPal'
-            elif company_name.isupper():
-                # Keep all-caps names as-is (e.g., PXXL, IBM)
-                return company_name.upper()
-            else:
-                # Standard capitalization
-                return company_name.capitalize()
-                
-        except Exception as e:
-            logger.error(f"Error extracting company name from URL: {str(e)}")
-            return "Unknown"
-
-
 class QualityScorer:
     """Calculates data quality scores"""
     
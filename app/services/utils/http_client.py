@@ -3,6 +3,8 @@ from typing import Optional, Dict
 import asyncio
 from aiolimiter import AsyncLimiter
 
+from app.services.utils.http_pool import get_pooled_client
+
 class HTTPClient:
     """
     A reusable HTTP client for making web requests.
@@ -29,19 +31,34 @@ class HTTPClient:
             "Upgrade-Insecure-Requests": "1"
         }
     
-    async def get(self, url: str, headers: Optional[Dict] = None, retries: int = 3) -> Optional[httpx.Response]:
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict] = None,
+        retries: int = 3,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Optional[httpx.Response]:
         """
         Fetch a web page (like clicking a link in your browser).
+        
+        Pass a shared client to reuse its pooled connections. Without one,
+        the process-wide pool is used if it is open on this event loop, and
+        otherwise a short-lived client is opened for the request.
         """
         merged_headers = {**self.headers, **(headers or {})}
+        if client is None:
+            client = get_pooled_client()
         
         for attempt in range(retries):
             try:
                 async with self.limiter:
-                    async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                        response = await client.get(url, headers=merged_headers)
-                        response.raise_for_status()
-                        return response
+                    if client is not None:
+                        response = await client.get(url, headers=merged_headers, follow_redirects=True)
+                    else:
+                        async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as own_client:
+                            response = await own_client.get(url, headers=merged_headers)
+                    response.raise_for_status()
+                    return response
             
             except httpx.HTTPStatusError as e:
                 print(f"❌ HTTP error fetching {url}: {e.response.status_code}")
@@ -90,10 +107,14 @@ class HTTPClient:
         
         try:
             async with self.limiter:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(url, json=data, headers=merged_headers)
-                    response.raise_for_status()
-                    return response
+                pooled = get_pooled_client()
+                if pooled is not None:
+                    response = await pooled.post(url, json=data, headers=merged_headers)
+                else:
+                    async with httpx.AsyncClient(timeout=self.timeout) as client:
+                        response = await client.post(url, json=data, headers=merged_headers)
+                response.raise_for_status()
+                return response
         
         except Exception as e:
             print(f"❌ Error posting to {url}: {str(e)}")
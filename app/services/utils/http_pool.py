@@ -0,0 +1,61 @@
+"""
+Pooled HTTP client for long-running services.
+
+An httpx.AsyncClient is tied to the event loop it was opened on, so the pool
+is opened explicitly by a service that owns a persistent loop (the scrape
+worker) and is only handed out to code running on that same loop. Anywhere
+else get_pooled_client() returns None and callers open short-lived clients
+as before.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def open_pool() -> httpx.AsyncClient:
+    """
+    Open the shared client on the running event loop.
+    
+    Returns:
+        The pooled client
+    """
+    global _client, _loop
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            # httpx's default; callers that want redirects followed ask per request
+            follow_redirects=False,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        _loop = asyncio.get_running_loop()
+    return _client
+
+
+def get_pooled_client() -> Optional[httpx.AsyncClient]:
+    """
+    Return the shared client if it was opened on the running event loop.
+    
+    Returns:
+        The pooled client, or None when there is no usable pool here
+    """
+    if _client is None or _client.is_closed:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return _client if loop is _loop else None
+
+
+async def close_pool() -> None:
+    """Close the shared client; must run on the loop that opened it."""
+    global _client, _loop
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _loop = None
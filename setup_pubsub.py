@@ -30,6 +30,7 @@ def main():
         logger.info(f"   - {pubsub.scrape_jobs_topic}")
         logger.info(f"   - {pubsub.scrape_completed_topic}")
         logger.info(f"   - {pubsub.scrape_progress_topic}")
+        logger.info(f"   - {pubsub.scrape_jobs_dlq_topic}")
         logger.info("")
         logger.info("🎯 Next steps:")
         logger.info("   1. Start the API server: uvicorn app.main:app --reload")
@@ -1,20 +1,27 @@
 #!/usr/bin/env python3
 """
-Test script for unified funding scraper.
-Usage: python test_scraper.py <company_name_or_url>
+Test script for the funding and website scrapers.
+Usage: python test_scraper.py <company_name_or_url> [--scraper {funding,website}]
 
 Examples:
     python test_scraper.py "Walmart"
     python test_scraper.py "Apple Inc"
     python test_scraper.py "https://www.tesla.com"
     python test_scraper.py walmart.com
+    python test_scraper.py stripe.com --scraper website
 """
 
+import argparse
 import asyncio
-import json
+import os
 import sys
+from pathlib import Path
 from urllib.parse import urlparse
+
+import orjson
+
 from app.services.scraping.financial.funding_scraper import get_unified_funding_data
+from app.services.scraping.website_scraper import website_scraper
 
 
 def extract_company_name(input_str: str) -> str:
@@ -38,96 +45,166 @@ def extract_company_name(input_str: str) -> str:
     return input_str
 
 
-async def test_scraper(company_input: str):
-    """Test the unified scraper with a company name or URL."""
+def _trunc(text: str, limit: int) -> str:
+    """Truncate text to ``limit`` characters, adding an ellipsis when cut."""
+    return text[:limit] + "..." if len(text) > limit else text
+
+
+def _write_json(output_path: Path, data: dict) -> None:
+    """Write JSON to a temp file, then atomically swap it into place."""
+    # Encode first, so a value orjson rejects never leaves a temp file behind
+    encoded = orjson.dumps(
+        data,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        default=str
+    )
+    tmp_path = output_path.with_suffix(".json.tmp")
+    try:
+        with tmp_path.open("wb", buffering=1 << 20) as f:
+            f.write(encoded)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+async def _scrape_funding(company_input: str) -> tuple[dict, Path]:
+    """Run the unified funding scraper and pick its output path."""
     company_name = extract_company_name(company_input)
+    result = await get_unified_funding_data(company_name)
+    return result, Path(f"{company_name.lower().replace(' ', '_')}_output.json")
+
+
+async def _scrape_website(company_input: str) -> tuple[dict, Path]:
+    """Run the website scraper and pick its output path."""
+    url = company_input if "://" in company_input else f"https://{company_input}"
+    result = await website_scraper.scrape(url, max_pages=50)
+    domain = (result or {}).get('domain', 'unknown')
+    return result, Path(f"website_output_{domain}.json")
+
+
+def _print_funding_summary(result: dict) -> None:
+    """Print the unified funding result summary."""
+    print(f"\n{'='*70}")
+    print(f"✅ SCRAPING RESULTS")
+    print(f"{'='*70}")
+    
+    identity = result.get('identity', {})
+    print(f"\n🏢 COMPANY IDENTITY:")
+    print(f"   Name: {identity.get('name')}")
+    print(f"   Ticker: {identity.get('ticker', 'N/A')}")
+    print(f"   Industry: {identity.get('industry', 'N/A')}")
+    print(f"   Status: {identity.get('status', 'N/A')}")
+    print(f"   Founded: {identity.get('founded_year', 'N/A')}")
+    print(f"   Employees: {identity.get('employees', 'N/A')}")
+    print(f"   Website: {identity.get('website', 'N/A')}")
+    
+    if identity.get('description'):
+        print(f"   Description: {_trunc(identity['description'], 150)}")
+    
+    financials = result.get('financials', {})
+    if financials.get('revenue') or len(financials.get('income_statement', [])) > 0:
+        print(f"\n💰 FINANCIAL DATA:")
+        print(f"   Fiscal Year: {financials.get('fiscal_year', 'N/A')}")
+        print(f"   Revenue: {financials.get('revenue', 'N/A')}")
+        print(f"   Net Income: {financials.get('net_income', 'N/A')}")
+        print(f"   Cash Flow: {financials.get('cash_flow', 'N/A')}")
+        print(f"   Statements: {len(financials.get('income_statement', []))} income, {len(financials.get('balance_sheet', []))} balance, {len(financials.get('cash_flow_statement', []))} cash flow")
+    
+    funding = result.get('funding', {})
+    print(f"\n🚀 FUNDING DATA:")
+    print(f"   Total Raised: {funding.get('total_raised', 'N/A')}")
+    print(f"   Latest Deal: {funding.get('latest_deal_type', 'N/A')}")
+    print(f"   Funding Rounds: {len(funding.get('funding_rounds', []))}")
+    print(f"   Investors: {len(funding.get('investors', []))}")
+    
+    key_metrics = result.get('key_metrics', {})
+    if key_metrics.get('shares_outstanding'):
+        print(f"\n📈 KEY METRICS:")
+        print(f"   Shares Outstanding: {key_metrics.get('shares_outstanding', 'N/A')}")
+        print(f"   Public Float: {key_metrics.get('public_float', 'N/A')}")
+    
+    insiders = result.get('insiders', [])
+    if insiders:
+        lines = [f"\n👥 INSIDERS: {len(insiders)}"]
+        lines.extend(
+            f"   • {insider.get('insider', 'N/A')} - {insider.get('position', 'N/A')}"
+            for insider in insiders[:3]
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    filings = result.get('latest_filings', [])
+    if filings:
+        lines = [f"\n📄 LATEST SEC FILINGS: {len(filings)}"]
+        lines.extend(
+            f"   • {filing.get('form', 'N/A')} - {filing.get('filing_date', 'N/A')}"
+            for filing in filings[:3]
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    competitors = result.get('competitors', [])
+    if competitors:
+        chunks = [f"\n🏆 COMPETITORS: {len(competitors)}"]
+        for comp in competitors[:3]:
+            parts = [f"\n   {comp.get('name', 'Unknown')}"]
+            if (location := comp.get('location')):
+                parts.append(f"      📍 {location}")
+            if (website := comp.get('website')):
+                parts.append(f"      🌐 {website}")
+            if (description := comp.get('description')):
+                parts.append(f"      📝 {_trunc(description, 100)}")
+            chunks.append("\n".join(parts))
+        sys.stdout.write("\n".join(chunks) + "\n")
+
+
+def _print_website_summary(result: dict) -> None:
+    """Print the website scraper result summary."""
+    print(f"\n{'='*70}")
+    print(f"✅ SCRAPING RESULTS")
+    print(f"{'='*70}")
+    
+    print(f"\n🏢 COMPANY IDENTITY:")
+    print(f"   Name: {result.get('company_name', 'N/A')}")
+    print(f"   Domain: {result.get('domain', 'N/A')}")
+    if result.get('description'):
+        print(f"   Description: {_trunc(result['description'], 150)}")
+    
+    print(f"\n🗺️  SITE STRUCTURE:")
+    print(f"   Sitemap URLs: {len(result.get('sitemap_urls', []))}")
+    print(f"   Internal Links: {len(result.get('internal_links', []))}")
+    print(f"   Social Platforms: {len(result.get('social_links', {}))}")
+    print(f"   Products: {len(result.get('products', []))}")
+
+
+SCRAPERS = {
+    "funding": (_scrape_funding, _print_funding_summary),
+    "website": (_scrape_website, _print_website_summary),
+}
+
+
+async def test_scraper(company_input: str, scraper: str = "funding"):
+    """Test a scraper with a company name or URL."""
+    scrape, print_summary = SCRAPERS[scraper]
     
     print(f"\n{'='*70}")
-    print(f"🧪 TESTING UNIFIED SCRAPER")
+    print(f"🧪 TESTING {scraper.upper()} SCRAPER")
     print(f"{'='*70}")
     print(f"📥 Input: {company_input}")
-    print(f"🏢 Company: {company_name}")
+    if scraper == "funding":
+        print(f"🏢 Company: {extract_company_name(company_input)}")
     print(f"{'='*70}\n")
     
     try:
         # Run the scraper
-        result = await get_unified_funding_data(company_name)
+        result, output_path = await scrape(company_input)
         
         if result:
-            # Save to file
-            filename = f"{company_name.lower().replace(' ', '_')}_output.json"
-            with open(filename, 'w') as f:
-                json.dump(result, f, indent=2, default=str)
-            
-            # Print summary
-            print(f"\n{'='*70}")
-            print(f"✅ SCRAPING RESULTS")
-            print(f"{'='*70}")
-            
-            identity = result.get('identity', {})
-            print(f"\n🏢 COMPANY IDENTITY:")
-            print(f"   Name: {identity.get('name')}")
-            print(f"   Ticker: {identity.get('ticker', 'N/A')}")
-            print(f"   Industry: {identity.get('industry', 'N/A')}")
-            print(f"   Status: {identity.get('status', 'N/A')}")
-            print(f"   Founded: {identity.get('founded_year', 'N/A')}")
-            print(f"   Employees: {identity.get('employees', 'N/A')}")
-            print(f"   Website: {identity.get('website', 'N/A')}")
-            
-            if identity.get('description'):
-                desc = identity['description'][:150] + "..." if len(identity['description']) > 150 else identity['description']
-                print(f"   Description: {desc}")
-            
-            financials = result.get('financials', {})
-            if financials.get('revenue') or len(financials.get('income_statement', [])) > 0:
-                print(f"\n💰 FINANCIAL DATA:")
-                print(f"   Fiscal Year: {financials.get('fiscal_year', 'N/A')}")
-                print(f"   Revenue: {financials.get('revenue', 'N/A')}")
-                print(f"   Net Income: {financials.get('net_income', 'N/A')}")
-                print(f"   Cash Flow: {financials.get('cash_flow', 'N/A')}")
-                print(f"   Statements: {len(financials.get('income_statement', []))} income, {len(financials.get('balance_sheet', []))} balance, {len(financials.get('cash_flow_statement', []))} cash flow")
-            
-            funding = result.get('funding', {})
-            print(f"\n🚀 FUNDING DATA:")
-            print(f"   Total Raised: {funding.get('total_raised', 'N/A')}")
-            print(f"   Latest Deal: {funding.get('latest_deal_type', 'N/A')}")
-            print(f"   Funding Rounds: {len(funding.get('funding_rounds', []))}")
-            print(f"   Investors: {len(funding.get('investors', []))}")
-            
-            key_metrics = result.get('key_metrics', {})
-            if key_metrics.get('shares_outstanding'):
-                print(f"\n📈 KEY METRICS:")
-                print(f"   Shares Outstanding: {key_metrics.get('shares_outstanding', 'N/A')}")
-                print(f"   Public Float: {key_metrics.get('public_float', 'N/A')}")
-            
-            insiders = result.get('insiders', [])
-            if insiders:
-                print(f"\n👥 INSIDERS: {len(insiders)}")
-                for insider in insiders[:3]:
-                    print(f"   • {insider.get('insider', 'N/A')} - {insider.get('position', 'N/A')}")
-            
-            filings = result.get('latest_filings', [])
-            if filings:
-                print(f"\n📄 LATEST SEC FILINGS: {len(filings)}")
-                for filing in filings[:3]:
-                    print(f"   • {filing.get('form', 'N/A')} - {filing.get('filing_date', 'N/A')}")
-            
-            competitors = result.get('competitors', [])
-            if competitors:
-                print(f"\n🏆 COMPETITORS: {len(competitors)}")
-                for comp in competitors[:3]:
-                    print(f"\n   {comp.get('name', 'Unknown')}")
-                    if comp.get('location'):
-                        print(f"      📍 {comp['location']}")
-                    if comp.get('website'):
-                        print(f"      🌐 {comp['website']}")
-                    if comp.get('description'):
-                        desc = comp['description'][:100] + "..." if len(comp.get('description', '')) > 100 else comp.get('description', '')
-                        print(f"      📝 {desc}")
+            _write_json(output_path, result)
+            print_summary(result)
             
             print(f"\n{'='*70}")
             print(f"✅ COMPLETED!")
-            print(f"📁 Saved to: {filename}")
+            print(f"📁 Saved to: {output_path.name}")
             print(f"{'='*70}\n")
             
         else:
@@ -141,17 +218,16 @@ async def test_scraper(company_input: str):
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python test_scraper.py <company_name_or_url>")
-        print("\nExamples:")
-        print("  python test_scraper.py 'Walmart'")
-        print("  python test_scraper.py 'Apple Inc'")
-        print("  python test_scraper.py 'https://www.tesla.com'")
-        print("  python test_scraper.py walmart.com")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Test a Krawlr scraper with a company name or URL.",
+        epilog="Example: python test_scraper.py 'Walmart' --scraper funding"
+    )
+    parser.add_argument("company_input", help="company name or website URL")
+    parser.add_argument("--scraper", choices=list(SCRAPERS), default="funding",
+                        help="scraper to run (default: funding)")
+    args = parser.parse_args()
     
-    company_input = sys.argv[1]
-    asyncio.run(test_scraper(company_input))
+    asyncio.run(test_scraper(args.company_input, args.scraper))
 
 
 if __name__ == "__main__":
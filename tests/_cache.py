@@ -0,0 +1,127 @@
+"""
+On-disk result cache for the standalone scraper tests.
+
+Off by default, so every run exercises the current scraper code. Turn it on
+with --cache or KRAWLR_TEST_CACHE=1 to avoid hitting the live data sources
+when re-running a test with the same inputs. Results are pickled under
+.cache/ in the project root, keyed by function name and arguments
+(cached_call) or by an explicit key string (cached), and expire after a TTL.
+Empty and None results are cached too, so known-empty lookups aren't
+repeated.
+
+Every key is salted with a hash of the app/ sources, so editing a scraper
+invalidates its cached results. Bump CACHE_VERSION whenever a scraper's
+output schema changes to drop the old entries from disk too.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+
+from _files import atomic_write_bytes
+
+CACHE_VERSION = 1
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / f"v{CACHE_VERSION}"
+APP_DIR = Path(__file__).parent.parent / "app"
+
+# Set from --cache / --no-cache (configure_from_argv) or KRAWLR_TEST_CACHE=1
+enabled = os.getenv("KRAWLR_TEST_CACHE") == "1"
+
+# Keyword arguments that only carry transport objects (e.g. a shared HTTP
+# client); they are passed through but left out of the cache key
+TRANSPORT_KWARGS = frozenset({"client"})
+
+
+@functools.lru_cache(maxsize=1)
+def _code_salt() -> str:
+    """Hash the app/ sources once per run, so cached results follow code edits."""
+    digest = hashlib.sha1()
+    for path in sorted(APP_DIR.rglob("*.py")):
+        digest.update(str(path.relative_to(APP_DIR)).encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _digest(key: str) -> str:
+    """Hash a cache key together with the code salt."""
+    return hashlib.sha1(f"{_code_salt()}:{key}".encode("utf-8")).hexdigest()
+
+
+def _cache_path(name: str, args: tuple, kwargs: dict) -> Path:
+    """Build the cache file path for a call."""
+    keyed_kwargs = sorted((k, v) for k, v in kwargs.items() if k not in TRANSPORT_KWARGS)
+    return CACHE_DIR / name / f"{_digest(repr((args, keyed_kwargs)))}.pkl"
+
+
+async def cached_call(fn, *args, ttl: int = 3600, **kwargs):
+    """
+    Await ``fn(*args, **kwargs)``, reusing a cached result if one is fresh.
+    
+    All arguments form the cache key except keyword arguments named in
+    TRANSPORT_KWARGS, such as a shared HTTP client.
+    
+    Args:
+        fn: Async function to call
+        *args: Positional arguments for fn
+        ttl: Maximum age of a cached result in seconds
+        **kwargs: Keyword arguments for fn
+        
+    Returns:
+        The (possibly cached) result of fn
+    """
+    if not enabled:
+        return await fn(*args, **kwargs)
+    
+    return await _load_or_compute(_cache_path(fn.__name__, args, kwargs), lambda: fn(*args, **kwargs), ttl)
+
+
+async def cached(key: str, coro_factory, ttl: int = 21600):
+    """
+    Await ``coro_factory()``, reusing a cached result for ``key`` if one is fresh.
+    
+    Use this when the call doesn't map neatly onto one function plus
+    positional arguments, e.g. ``cached(f"founders:{name}:{limit}", lambda: ...)``.
+    
+    Args:
+        key: String identifying the call and every input that affects it
+        coro_factory: Zero-argument callable returning the coroutine to run
+        ttl: Maximum age of a cached result in seconds (default 6 hours)
+        
+    Returns:
+        The (possibly cached) result of the coroutine
+    """
+    if not enabled:
+        return await coro_factory()
+    
+    return await _load_or_compute(CACHE_DIR / "keyed" / f"{_digest(key)}.pkl", coro_factory, ttl)
+
+
+def configure_from_argv(argv: list[str] = sys.argv) -> None:
+    """Strip --cache / --no-cache flags from argv and turn the cache on or off."""
+    global enabled
+    if "--cache" in argv:
+        argv.remove("--cache")
+        enabled = True
+    if "--no-cache" in argv:
+        argv.remove("--no-cache")
+        enabled = False
+
+
+async def _load_or_compute(path: Path, coro_factory, ttl: int):
+    """Return the pickled result at path if fresh, otherwise compute and store it."""
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            return pickle.loads(path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    
+    result = await coro_factory()
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(path, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+    
+    return result
@@ -0,0 +1,168 @@
+"""
+File helpers shared by the standalone scraper tests.
+"""
+
+import os
+import re
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+
+import orjson
+
+# Every JSON output path written so far, for quiet_output() to report
+_written: list[str] = []
+
+# Runs of anything that is not a letter or digit (underscores included)
+_UNSAFE_CHARS = re.compile(r"[\W_]+")
+# The same for ASCII-only stems, which also keep hyphens
+_ASCII_UNSAFE_CHARS = re.compile(r"[^a-z0-9-]+")
+
+
+def safe_filename(name: str, ascii_only: bool = False) -> str:
+    """
+    Convert a company name to a safe filename stem.
+    
+    Unicode letters and digits are kept; everything else collapses to single
+    underscores in one regex pass.
+    
+    Args:
+        name: Company name or other free text
+        ascii_only: Keep only ASCII letters, digits and hyphens
+        
+    Returns:
+        Lowercased, underscore-separated stem
+    """
+    unsafe = _ASCII_UNSAFE_CHARS if ascii_only else _UNSAFE_CHARS
+    return unsafe.sub("_", name.lower()).strip("_")
+
+
+def atomic_write_bytes(path: str | Path, data: bytes) -> None:
+    """
+    Write bytes to a file in one pass, replacing it atomically.
+    
+    The data goes to a sibling .tmp file through a raw fd (no Python io
+    buffering) and is then renamed over the target, so readers never see a
+    half-written file.
+    
+    Args:
+        path: Destination file path
+        data: Encoded file contents
+    """
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def write_json(path: str | Path, data, indent: bool = True) -> None:
+    """
+    Encode data as JSON with orjson and write it atomically.
+    
+    Values orjson can't encode natively (e.g. Decimal) fall back to str().
+    
+    Args:
+        path: Destination file path
+        data: JSON-serializable result
+        indent: Pass False for compact output on multi-MB results
+            (``python -m json.tool`` pretty-prints it on demand)
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    atomic_write_bytes(path, orjson.dumps(data, option=option, default=str))
+    _written.append(str(path))
+
+
+def write_json_split(
+    clean_path: str | Path,
+    full_path: str | Path,
+    data: dict,
+    key: str = "raw_data"
+) -> None:
+    """
+    Write data without ``key`` to clean_path and the complete data to full_path.
+    
+    The shared fields are encoded once: the full file reuses the clean bytes
+    and splices in ``key``'s value, instead of re-encoding everything.
+    
+    Args:
+        clean_path: Destination for the readable copy (``key`` omitted)
+        full_path: Destination for the complete data
+        data: Result dict, usually carrying a large ``raw_data`` blob
+        key: Field kept only in the full file
+    """
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    clean = orjson.dumps({k: v for k, v in data.items() if k != key}, option=option, default=str)
+    atomic_write_bytes(clean_path, clean)
+    _written.extend((str(clean_path), str(full_path)))
+    
+    if key not in data:
+        atomic_write_bytes(full_path, clean)
+        return
+    
+    # Indented JSON never has raw newlines inside strings, so shifting every
+    # line of the nested value by two spaces keeps the layout consistent
+    value = orjson.dumps(data[key], option=option, default=str).replace(b"\n", b"\n  ")
+    entry = orjson.dumps(key) + b": " + value
+    if clean == b"{}":
+        full = b"{\n  " + entry + b"\n}"
+    else:
+        full = clean[:-2] + b",\n  " + entry + b"\n}"
+    atomic_write_bytes(full_path, full)
+
+
+def write_jsonl(
+    path: str | Path,
+    records,
+    meta_path: str | Path | None = None,
+    meta: dict | None = None
+) -> None:
+    """
+    Write records as JSON Lines, with everything else in a sibling JSON file.
+    
+    Each record goes on its own compact line so consumers can parse the file
+    incrementally instead of loading one large array.
+    
+    Args:
+        path: Destination .jsonl file
+        records: Iterable of JSON-serializable records
+        meta_path: Destination for the remaining fields, if any
+        meta: Result fields that aren't part of the records
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    atomic_write_bytes(path, b"".join(orjson.dumps(r, option=option, default=str) + b"\n" for r in records))
+    _written.append(str(path))
+    if meta_path is not None:
+        write_json(meta_path, meta)
+
+
+@contextmanager
+def quiet_output(enabled: bool = True):
+    """
+    Silence stdout inside the block, then print only the JSON paths written.
+    
+    Meant for scripted runs (--quiet): banners, reports and scraper progress
+    go to /dev/null, and every file saved through write_json or
+    write_json_split is printed afterwards, one path per line. stderr is left
+    alone so tracebacks still show.
+    
+    Args:
+        enabled: Pass False to leave output untouched
+    """
+    if not enabled:
+        yield
+        return
+    
+    start = len(_written)
+    try:
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            yield
+    finally:
+        for path in _written[start:]:
+            print(path)
@@ -0,0 +1,45 @@
+"""
+Event loop setup shared by the standalone scraper tests.
+
+The tests are network-bound asyncio workloads, so they run on uvloop when it
+is installed (uvicorn[standard] pulls it in on Linux and macOS) and fall back
+to the default asyncio loop otherwise. On Python 3.12+ tasks are also started
+eagerly, so gathered coroutines that finish without blocking (cache hits,
+early returns) never wait for a loop iteration.
+"""
+
+import asyncio
+
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+
+def loop_factory() -> asyncio.AbstractEventLoop:
+    """
+    Create the event loop the tests run on.
+    
+    Returns:
+        A uvloop (or default asyncio) loop, with the eager task factory
+        installed when the interpreter has one
+    """
+    loop = _new_event_loop()
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
+def run(main):
+    """
+    Run a coroutine to completion, like asyncio.run(), on the loop_factory() loop.
+    
+    Args:
+        main: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
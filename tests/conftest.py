@@ -0,0 +1,12 @@
+"""
+Pytest configuration for the scraper tests.
+
+Puts the project root on sys.path once so test modules can import ``app``.
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
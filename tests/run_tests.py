@@ -2,17 +2,67 @@
 """
 Interactive test runner for all Krawlr scrapers.
 Provides a menu-driven interface to test different scrapers.
+
+Usage:
+    python3 tests/run_tests.py
+    python3 tests/run_tests.py --batch companies.txt
 """
 
-import subprocess
+import argparse
+import asyncio
+import compileall
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from _files import write_json
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+SEP = "=" * 70
+
+# Keep menu output and prompts visible immediately, even when piped or logged
+sys.stdout.reconfigure(line_buffering=True, write_through=True)
+
+# Per-process state for batch mode, populated by _init_batch_worker
+_worker_loop = None
+_get_unified_funding_data = None
+
+
+async def _stream_command(cmd: list[str]) -> int:
+    """Run a command and copy its output to our stdout as it arrives."""
+    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        env=env
+    )
+    
+    stdout_fd = sys.stdout.fileno()
+    while chunk := await proc.stdout.read(4096):
+        os.write(stdout_fd, chunk)
+    
+    return await proc.wait()
+
+
+def run_command(cmd: list[str]) -> int:
+    """Run a test script, streaming its output unbuffered."""
+    sys.stdout.flush()
+    return asyncio.run(_stream_command(cmd))
+
+
+def prompt(text: str) -> str:
+    """Write a prompt straight to the stdout fd, then read a stripped line of input."""
+    sys.stdout.flush()
+    os.write(sys.stdout.fileno(), text.encode())
+    return input("").strip()
 
 
 def print_header():
     """Print the header."""
-    print("\n" + "="*70)
-    print("🚀 KRAWLR SCRAPER TEST RUNNER")
-    print("="*70)
+    print(f"\n{SEP}\n🚀 KRAWLR SCRAPER TEST RUNNER\n{SEP}")
 
 
 def print_menu():
@@ -28,10 +78,8 @@ def print_menu():
 
 def run_edgar_test():
     """Run EDGAR scraper test."""
-    print("\n" + "="*70)
-    print("🏛️  EDGAR SCRAPER TEST")
-    print("="*70)
-    company = input("\n📊 Enter company name (e.g., Apple, Microsoft): ").strip()
+    print(f"\n{SEP}\n🏛️  EDGAR SCRAPER TEST\n{SEP}")
+    company = prompt("\n📊 Enter company name (e.g., Apple, Microsoft): ")
     
     if not company:
         print("❌ Company name required")
@@ -39,15 +87,13 @@ def run_edgar_test():
     
     print(f"\n🚀 Running EDGAR scraper for: {company}")
     cmd = ["python3", "tests/test_edgar_standalone.py", company]
-    subprocess.run(cmd)
+    run_command(cmd)
 
 
 def run_pitchbook_test():
     """Run PitchBook scraper test."""
-    print("\n" + "="*70)
-    print("💼 PITCHBOOK SCRAPER TEST")
-    print("="*70)
-    company = input("\n📊 Enter company name (e.g., Stripe, GitHub, Airbnb): ").strip()
+    print(f"\n{SEP}\n💼 PITCHBOOK SCRAPER TEST\n{SEP}")
+    company = prompt("\n📊 Enter company name (e.g., Stripe, GitHub, Airbnb): ")
     
     if not company:
         print("❌ Company name required")
@@ -55,15 +101,13 @@ def run_pitchbook_test():
     
     print(f"\n🚀 Running PitchBook scraper for: {company}")
     cmd = ["python3", "tests/test_pitchbook_standalone.py", company]
-    subprocess.run(cmd)
+    run_command(cmd)
 
 
 def run_website_test():
     """Run website scraper test."""
-    print("\n" + "="*70)
-    print("🌐 WEBSITE SCRAPER TEST")
-    print("="*70)
-    url = input("\n🔗 Enter website URL (e.g., https://example.com): ").strip()
+    print(f"\n{SEP}\n🌐 WEBSITE SCRAPER TEST\n{SEP}")
+    url = prompt("\n🔗 Enter website URL (e.g., https://example.com): ")
     
     if not url:
         print("❌ URL required")
@@ -71,14 +115,12 @@ def run_website_test():
     
     print(f"\n🚀 Running website scraper for: {url}")
     cmd = ["python3", "tests/test_website_standalone.py", url]
-    subprocess.run(cmd)
+    run_command(cmd)
 
 
 def run_unified_funding_test():
     """Run unified funding scraper test."""
-    print("\n" + "="*70)
-    print("🎯 UNIFIED FUNDING SCRAPER TEST (EDGAR + PitchBook)")
-    print("="*70)
+    print(f"\n{SEP}\n🎯 UNIFIED FUNDING SCRAPER TEST (EDGAR + PitchBook)\n{SEP}")
     print("\nℹ️  This test runs both EDGAR and PitchBook scrapers in parallel")
     print("   and combines the results intelligently.")
     print("\n💡 Tips:")
@@ -86,7 +128,7 @@ def run_unified_funding_test():
     print("   • Private companies (e.g., Stripe, GitHub) - PitchBook data")
     print("   • Best results: Recently IPO'd companies (both sources)")
     
-    company = input("\n📊 Enter company name: ").strip()
+    company = prompt("\n📊 Enter company name: ")
     
     if not company:
         print("❌ Company name required")
@@ -94,17 +136,74 @@ def run_unified_funding_test():
     
     print(f"\n🚀 Running unified funding scraper for: {company}")
     cmd = ["python3", "tests/test_unified_funding_standalone.py", company]
-    subprocess.run(cmd)
+    run_command(cmd)
+
+
+def _warm_bytecode_cache():
+    """Precompile the app package so test subprocesses skip compilation on import."""
+    compileall.compile_dir(str(PROJECT_ROOT / "app"), quiet=1)
+
+
+def _init_batch_worker():
+    """Import the scraper stack and create one event loop per worker process."""
+    global _worker_loop, _get_unified_funding_data
+    
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from app.services.scraping.financial.funding_scraper import get_unified_funding_data
+    
+    _get_unified_funding_data = get_unified_funding_data
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+
+def _run_batch_company(company: str):
+    """Run the unified funding scraper for one company inside a worker."""
+    try:
+        data = _worker_loop.run_until_complete(_get_unified_funding_data(company))
+        return company, data, None
+    except Exception as e:
+        return company, None, str(e)
+
+
+def run_batch(input_file: str):
+    """Run the unified funding scraper for every company listed in a file."""
+    lines = Path(input_file).read_text().splitlines()
+    companies = [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+    
+    if not companies:
+        print(f"❌ No companies found in {input_file}")
+        return
+    
+    workers = min(os.cpu_count() or 1, len(companies))
+    print_header()
+    print(f"\n📦 Batch mode: {len(companies)} companies across {workers} worker(s)")
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as executor:
+        # Scrapes take minutes each, so hand out one company at a time to keep workers busy
+        for company, data, error in executor.map(_run_batch_company, companies):
+            if error:
+                print(f"❌ {company}: {error}")
+                continue
+            
+            output_path = PROJECT_ROOT / f"unified_funding_{company.lower().replace(' ', '_')}.json"
+            write_json(output_path, data)
+            print(f"✅ {company}: saved to {output_path.name}")
 
 
 def main():
     """Main test runner loop."""
+    # Each test runs in its own interpreter, so warm the on-disk bytecode
+    # cache while the user is still reading the menu.
+    warmup = ThreadPoolExecutor(max_workers=1)
+    warmup.submit(_warm_bytecode_cache)
+    warmup.shutdown(wait=False)
+    
     while True:
         print_header()
         print_menu()
         
         try:
-            choice = input("👉 Select test (1-5): ").strip()
+            choice = prompt("👉 Select test (1-5): ")
             
             if choice == "1":
                 run_edgar_test()
@@ -121,15 +220,22 @@ def main():
                 print("\n❌ Invalid choice. Please select 1-5.")
             
             # Wait for user before showing menu again
-            input("\n⏎  Press Enter to continue...")
+            prompt("\n⏎  Press Enter to continue...")
             
         except KeyboardInterrupt:
             print("\n\n👋 Goodbye!")
             sys.exit(0)
         except Exception as e:
             print(f"\n❌ Error: {e}")
-            input("\n⏎  Press Enter to continue...")
+            prompt("\n⏎  Press Enter to continue...")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Krawlr scraper test runner")
+    parser.add_argument("--batch", metavar="FILE", help="file with one company name or ticker per line")
+    args = parser.parse_args()
+    
+    if args.batch:
+        run_batch(args.batch)
+    else:
+        main()
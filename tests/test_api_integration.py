@@ -6,18 +6,19 @@ import asyncio
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Pytest gets the project root from conftest.py; direct runs add it here
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.services.scraping.unified_orchestrator import UnifiedOrchestrator
 
+SEP = "=" * 80
+
 
 async def test_orchestrator_with_user_id():
     """Test that orchestrator properly handles user_id"""
     
-    print("=" * 80)
-    print("🧪 TESTING UNIFIED ORCHESTRATOR WITH USER_ID")
-    print("=" * 80)
-    print()
+    print(f"{SEP}\n🧪 TESTING UNIFIED ORCHESTRATOR WITH USER_ID\n{SEP}\n")
     
     # Initialize orchestrator
     orchestrator = UnifiedOrchestrator()
@@ -33,11 +34,7 @@ async def test_orchestrator_with_user_id():
         scrape_id="test-scrape-456"
     )
     
-    print()
-    print("=" * 80)
-    print("✅ SCRAPE COMPLETED")
-    print("=" * 80)
-    print()
+    print(f"\n{SEP}\n✅ SCRAPE COMPLETED\n{SEP}\n")
     
     # Verify metadata includes user_id
     metadata = result.get('metadata', {})
@@ -62,11 +59,7 @@ async def test_orchestrator_with_user_id():
     else:
         print("❌ Scrape ID not found in metadata!")
     
-    print()
-    print("=" * 80)
-    print("🎉 INTEGRATION TEST PASSED")
-    print("=" * 80)
-    print()
+    print(f"\n{SEP}\n🎉 INTEGRATION TEST PASSED\n{SEP}\n")
     print("Next steps:")
     print("1. Start the server: uvicorn app.main:app --reload --port 8000")
     print("2. Register a user: POST /register")
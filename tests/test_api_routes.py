@@ -5,20 +5,20 @@ import asyncio
 import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Pytest gets the project root from conftest.py; direct runs add it here
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.api.scraping_routes import router
 from app.main import app
 
+SEP = "=" * 80
+
 
 def test_routes():
     """Test that routes are properly registered"""
     
-    print("=" * 80)
-    print("🧪 TESTING SCRAPING API ROUTES")
-    print("=" * 80)
-    print()
+    print(f"{SEP}\n🧪 TESTING SCRAPING API ROUTES\n{SEP}\n")
     
     # List all routes
     print("📋 Registered Routes:")
@@ -29,11 +29,7 @@ def test_routes():
             methods = ','.join(route.methods) if route.methods else 'N/A'
             print(f"   {methods:8s} {route.path}")
     
-    print()
-    print("=" * 80)
-    print("✅ API Routes Configured Successfully!")
-    print("=" * 80)
-    print()
+    print(f"\n{SEP}\n✅ API Routes Configured Successfully!\n{SEP}\n")
     print("🚀 To start the server, run:")
     print("   uvicorn app.main:app --reload --port 8000")
     print()
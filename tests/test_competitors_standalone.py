@@ -12,7 +12,6 @@ Usage:
 import sys
 import os
 import asyncio
-import json
 from datetime import datetime
 
 # Add parent directory to path
@@ -20,14 +19,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from app.services.scraping.competitors import scrape_competitors
 
+from _files import safe_filename, write_json
 
-def safe_filename(company_name: str) -> str:
-    """Convert company name to safe filename."""
-    # Remove special characters and spaces
-    safe_name = ''.join(c if c.isalnum() else '_' for c in company_name.lower())
-    # Remove multiple underscores
-    safe_name = '_'.join(filter(None, safe_name.split('_')))
-    return safe_name
+SEP = "=" * 70
 
 
 async def main():
@@ -42,22 +36,18 @@ async def main():
     max_competitors = int(sys.argv[2]) if len(sys.argv) > 2 else 20
     website_url = sys.argv[3] if len(sys.argv) > 3 else None
     
-    print(f"\n{'='*70}")
-    print(f"COMPETITORS & ALTERNATIVES SCRAPER - STANDALONE TEST")
-    print(f"{'='*70}")
+    print(f"\n{SEP}\nCOMPETITORS & ALTERNATIVES SCRAPER - STANDALONE TEST\n{SEP}")
     print(f"Company: {company_name}")
     print(f"Max Competitors: {max_competitors}")
     if website_url:
         print(f"Website: {website_url}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
     
     # Run scraper
     result = await scrape_competitors(company_name, website_url, max_competitors)
     
     # Print results
-    print(f"\n{'='*70}")
-    print(f"RESULTS")
-    print(f"{'='*70}")
+    print(f"\n{SEP}\nRESULTS\n{SEP}")
     print(f"Total Competitors Found: {result['total_competitors']}")
     print(f"\nBy Source:")
     for source, count in result['sources'].items():
@@ -65,9 +55,7 @@ async def main():
     
     # Show top competitors
     if result['competitors']:
-        print(f"\n{'='*70}")
-        print(f"TOP COMPETITORS (Sorted by Relevance)")
-        print(f"{'='*70}")
+        print(f"\n{SEP}\nTOP COMPETITORS (Sorted by Relevance)\n{SEP}")
         
         for i, comp in enumerate(result['competitors'][:10], 1):
             print(f"\n{i}. {comp['name']}")
@@ -83,12 +71,9 @@ async def main():
     safe_name = safe_filename(company_name)
     output_file = f"competitors_{safe_name}.json"
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    write_json(output_file, result)
     
-    print(f"\n{'='*70}")
-    print(f"✅ Full results saved to: {output_file}")
-    print(f"{'='*70}\n")
+    print(f"\n{SEP}\n✅ Full results saved to: {output_file}\n{SEP}\n")
 
 
 if __name__ == '__main__':
@@ -7,15 +7,26 @@ Usage:
     python tests/test_edgar_standalone.py "Apple"
     python tests/test_edgar_standalone.py "Microsoft Corporation" "Tesla Inc"
     python tests/test_edgar_standalone.py AAPL TSLA --ticker
+    python tests/test_edgar_standalone.py AAPL --ticker --cache
+    python tests/test_edgar_standalone.py AAPL --ticker --full   # keep filing bodies in the JSON
+    python tests/test_edgar_standalone.py AAPL --ticker --render-only   # reprint saved output
 """
 
 import asyncio
+import functools
+import logging
+import os
+import re
 import sys
-import json
+import time
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import httpx
+import orjson
+
+# Pytest gets the project root from conftest.py; direct runs add it here
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.services.scraping.financial.edgar_scraper import (
     get_company_financials,
@@ -25,15 +36,105 @@ from app.services.scraping.financial.edgar_scraper import (
     prepare_revenue_chart_data
 )
 
+import app.services.scraping.financial.edgar_scraper as edgar_scraper
+
+import _cache
+from _cache import cached_call
+from _files import atomic_write_bytes, write_json
+
+logger = logging.getLogger(__name__)
+
+SEP = "=" * 70
+
+# Static banners, encoded once
+HDR_MAIN = f"\n{SEP}\n🚀 EDGAR SCRAPER - STANDALONE TEST\n{SEP}\n".encode()
+HDR_TEST = f"\n{SEP}\n🧪 TESTING EDGAR SCRAPER\n{SEP}\n\n".encode()
+HDR_RESOLVE = f"\n{SEP}\n🔍 TESTING TICKER RESOLUTION\n{SEP}\n\n".encode()
+HDR_FETCH = f"{SEP}\n📊 FETCHING FINANCIAL DATA\n{SEP}\n\n".encode()
+HDR_SUMMARY = f"\n{SEP}\n📈 RESULTS SUMMARY\n{SEP}\n\n".encode()
+HDR_DONE = f"\n{SEP}\n✅ TEST COMPLETED\n{SEP}\n\n".encode()
+HDR_ALL_DONE = f"\n{SEP}\n✅ ALL TESTS COMPLETED\n{SEP}\n\n".encode()
+
+# Filing bodies can run to MBs each; the saved JSON keeps only their length unless --full
+full_output = False
+# Re-render saved edgar_output_*.json files without touching the network
+render_only = False
+
+# Maximum number of companies tested against SEC EDGAR at the same time
+EDGAR_CONCURRENCY = 4
+
+# Short all-caps inputs like AAPL or BRK.B are already tickers, no lookup needed
+TICKER_PATTERN = re.compile(r"[A-Z][A-Z0-9.\-]{0,5}")
+
+
+def emit(data: bytes):
+    """Write pre-encoded output straight to the stdout fd, after any pending prints."""
+    sys.stdout.flush()
+    os.write(sys.stdout.fileno(), data)
+
+
+def _off_loop(fn):
+    """
+    Run an async scraper function on a worker thread with its own event loop.
+    
+    get_company_financials is an async wrapper around the synchronous
+    edgartools client, so awaiting it directly would block the loop and
+    serialize every "concurrent" lookup. get_company_insiders already runs
+    edgartools in threads and is awaited as is.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args):
+        return await asyncio.to_thread(asyncio.run, fn(*args))
+    return wrapper
+
+
+fetch_company_financials = _off_loop(get_company_financials)
+
+# Local copy of SEC's ~1MB ticker list, shared by every run for a day
+SEC_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+SEC_TICKERS_PATH = _cache.CACHE_DIR.parent / "company_tickers.json"
+SEC_TICKERS_TTL = 24 * 3600
+_download_company_tickers = edgar_scraper._load_company_tickers
+
+
+async def _load_local_tickers(client: httpx.AsyncClient | None = None) -> dict:
+    """Serve company_tickers.json from the local copy, downloading it if it's gone."""
+    try:
+        return orjson.loads(await asyncio.to_thread(SEC_TICKERS_PATH.read_bytes))
+    except FileNotFoundError:
+        return await _download_company_tickers(client)
+
+
+async def _prime_ticker_cache(client: httpx.AsyncClient):
+    """Download company_tickers.json if the local copy is stale and point the resolver at it."""
+    try:
+        fresh = time.time() - SEC_TICKERS_PATH.stat().st_mtime < SEC_TICKERS_TTL
+    except FileNotFoundError:
+        fresh = False
+    
+    if not fresh:
+        try:
+            response = await client.get(
+                SEC_TICKERS_URL,
+                headers={'User-Agent': 'Krawlr scraper contact@krawlr.com'}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            print(f"⚠️  Could not prime SEC ticker cache: {e}")
+            return
+        
+        SEC_TICKERS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(SEC_TICKERS_PATH, response.content)
+    
+    edgar_scraper._load_company_tickers = _load_local_tickers
+
 
-async def test_ticker_resolution(company_name: str):
+async def test_ticker_resolution(company_name: str, client: httpx.AsyncClient | None = None):
     """Test ticker resolution from company name."""
-    print(f"\n{'='*70}")
-    print(f"🔍 TESTING TICKER RESOLUTION")
-    print(f"{'='*70}\n")
+    emit(HDR_RESOLVE)
     print(f"Company Name: {company_name}\n")
     
-    ticker_info = await resolve_company_ticker(company_name)
+    ticker_info = await cached_call(resolve_company_ticker, company_name, client=client)
     
     if not ticker_info:
         print(f"❌ Could not resolve ticker for: {company_name}\n")
@@ -48,39 +149,43 @@ async def test_ticker_resolution(company_name: str):
     return ticker_info['ticker']
 
 
-async def test_edgar_scraper(input_value: str, is_ticker: bool = False):
-    """Test EDGAR scraper with company name or ticker."""
-    print(f"\n{'='*70}")
-    print(f"🧪 TESTING EDGAR SCRAPER")
-    print(f"{'='*70}\n")
-    
-    if is_ticker:
-        print(f"Input Type: TICKER")
-        print(f"Ticker: {input_value}\n")
-        result = await get_company_financials(input_value)
-        ticker = input_value
-    else:
-        print(f"Input Type: COMPANY NAME")
-        print(f"Company: {input_value}\n")
-        
-        # First resolve the ticker
-        ticker = await test_ticker_resolution(input_value)
-        if not ticker:
-            return
-        
-        # Then fetch financials
-        print(f"{'='*70}")
-        print(f"📊 FETCHING FINANCIAL DATA")
-        print(f"{'='*70}\n")
-        result = await get_company_financials(ticker)
-    
-    if not result:
-        print(f"❌ No data found\n")
-        return
+def _output_path(ticker: str) -> Path:
+    """Path of the saved JSON output for a ticker."""
+    return Path(f"edgar_output_{ticker.replace('/', '_')}.json")
+
+
+async def _fetch(ticker: str) -> tuple[dict | None, list[dict] | None]:
+    """Fetch financials and Form 4 insiders for a ticker."""
+    # Financials and Form 4 insiders are independent lookups, so fetch them together
+    result, insiders = await asyncio.gather(
+        cached_call(fetch_company_financials, ticker),
+        cached_call(get_company_insiders, ticker)
+    )
+    return result, insiders
+
+
+def _load(ticker: str) -> tuple[dict, list[dict]]:
+    """Load a previously saved result and its insiders from disk."""
+    result = orjson.loads(_output_path(ticker).read_bytes())
+    insiders = result.pop('_insiders', [])
+    return result, insiders
+
+
+def _save(ticker: str, result: dict, insiders: list[dict] | None) -> Path:
+    """Save the result with its insiders so --render-only can replay it."""
+    if not full_output:
+        for filing in result.get('latest_filings', []):
+            if filing.get('content'):
+                filing['content'] = f"<{len(filing['content']):,} characters elided>"
     
-    print(f"\n{'='*70}")
-    print(f"📈 RESULTS SUMMARY")
-    print(f"{'='*70}\n")
+    output_path = _output_path(ticker)
+    write_json(output_path, {**result, '_insiders': insiders or []})
+    return output_path
+
+
+def _render(result: dict, insiders: list[dict] | None):
+    """Print the results summary for fetched EDGAR data."""
+    emit(HDR_SUMMARY)
     
     # Basic company info
     print(f"🏢 Company: {result.get('name', 'N/A')}")
@@ -123,7 +228,7 @@ async def test_edgar_scraper(input_value: str, is_ticker: bool = False):
     for i, filing in enumerate(filings[:5], 1):
         print(f"   {i}. {filing['form']} - {filing['filing_date']}")
         print(f"      URL: {filing['url']}")
-        content_len = len(filing.get('content', '')) if filing.get('content') else 0
+        content_len = len(filing.get('content') or '')
         print(f"      Content: {content_len:,} characters")
     
     # Chart data
@@ -141,7 +246,6 @@ async def test_edgar_scraper(input_value: str, is_ticker: bool = False):
     
     # Test insider data
     print(f"\n👥 Testing Insider Data Retrieval...")
-    insiders = await get_company_insiders(ticker)
     if insiders:
         print(f"   ✅ Found {len(insiders)} insiders from Form 4 filings")
         print(f"\n   Top Executives:")
@@ -149,30 +253,78 @@ async def test_edgar_scraper(input_value: str, is_ticker: bool = False):
             print(f"      • {insider['insider']} - {insider['position']}")
     else:
         print(f"   ⚠️  No Form 4 filings found (last 6 months)")
+
+
+async def test_edgar_scraper(
+    input_value: str,
+    is_ticker: bool = False,
+    client: httpx.AsyncClient | None = None
+):
+    """Test EDGAR scraper with company name or ticker."""
+    if not is_ticker and TICKER_PATTERN.fullmatch(input_value):
+        is_ticker = True
+    
+    emit(HDR_TEST)
+    
+    if is_ticker:
+        print(f"Input Type: TICKER")
+        print(f"Ticker: {input_value}\n")
+        ticker = input_value
+    else:
+        print(f"Input Type: COMPANY NAME")
+        print(f"Company: {input_value}\n")
+        
+        # First resolve the ticker
+        ticker = await test_ticker_resolution(input_value, client=client)
+        if not ticker:
+            return
+        
+        emit(HDR_FETCH)
+    
+    if render_only:
+        try:
+            result, insiders = _load(ticker)
+        except FileNotFoundError:
+            print(f"❌ No saved output for {ticker}; run without --render-only first\n")
+            return
+    else:
+        result, insiders = await _fetch(ticker)
+    
+    if not result:
+        print(f"❌ No data found\n")
+        return
+    
+    _render(result, insiders)
     
-    # Save detailed output
-    safe_name = ticker.replace('/', '_')
-    output_file = f"edgar_output_{safe_name}.json"
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2, default=str)
+    if not render_only:
+        output_path = _save(ticker, result, insiders)
+        print(f"\n💾 Full data saved to: {output_path}")
     
-    print(f"\n💾 Full data saved to: {output_file}")
-    print(f"\n{'='*70}")
-    print(f"✅ TEST COMPLETED")
-    print(f"{'='*70}\n")
+    emit(HDR_DONE)
 
 
 async def main():
     """Main test function."""
-    print("\n" + "="*70)
-    print("🚀 EDGAR SCRAPER - STANDALONE TEST")
-    print("="*70)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    
+    emit(HDR_MAIN)
     
     # Parse arguments
     is_ticker_mode = '--ticker' in sys.argv
     if is_ticker_mode:
         sys.argv.remove('--ticker')
     
+    _cache.configure_from_argv()
+    
+    global full_output, render_only
+    if '--full' in sys.argv:
+        sys.argv.remove('--full')
+        full_output = True
+    
+    if '--render-only' in sys.argv:
+        sys.argv.remove('--render-only')
+        render_only = True
+    
     # Get inputs from command line or use defaults
     if len(sys.argv) > 1:
         inputs = sys.argv[1:]
@@ -188,22 +340,36 @@ async def main():
         print(f"     python tests/test_edgar_standalone.py \"Company Name\"")
         print(f"     python tests/test_edgar_standalone.py TICKER --ticker")
     
-    # Test each input
-    for input_value in inputs:
+    # Test inputs concurrently; the shared http_client limiter still paces SEC requests
+    semaphore = asyncio.Semaphore(EDGAR_CONCURRENCY)
+    
+    # One pooled client for every lookup so TCP/TLS setup is paid once per host
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=15.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    ) as client:
+        if _cache.enabled and not (is_ticker_mode or render_only):
+            await _prime_ticker_cache(client)
+        
+        async def run(input_value: str):
+            async with semaphore:
+                await test_edgar_scraper(input_value, is_ticker=is_ticker_mode, client=client)
+        
         try:
-            await test_edgar_scraper(input_value, is_ticker=is_ticker_mode)
-            await asyncio.sleep(1)  # Rate limiting
-        except KeyboardInterrupt:
+            results = await asyncio.gather(
+                *(run(input_value) for input_value in inputs),
+                return_exceptions=True
+            )
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print("\n\n⚠️  Test interrupted by user")
-            break
-        except Exception as e:
-            print(f"\n❌ Error testing {input_value}: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    print("\n" + "="*70)
-    print("✅ ALL TESTS COMPLETED")
-    print("="*70 + "\n")
+        else:
+            # Report failures once, after all output, so tracebacks don't interleave
+            for input_value, outcome in zip(inputs, results):
+                if isinstance(outcome, Exception):
+                    logger.error("❌ Error testing %s: %s", input_value, outcome, exc_info=outcome)
+    
+    emit(HDR_ALL_DONE)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,7 @@ Tests comprehensive team scraping from multiple sources:
 - LinkedIn
 
 Usage:
-    python3 tests/test_founders_standalone.py "COMPANY_NAME" [max_people] [website_url]
+    python3 tests/test_founders_standalone.py "COMPANY_NAME" [max_people] [website_url] [--cache] [--quiet]
     
 Examples:
     python3 tests/test_founders_standalone.py "Stripe"
@@ -18,33 +18,42 @@ Examples:
 """
 
 import sys
-import asyncio
-import json
-import re
+import traceback
 from pathlib import Path
 
+import httpx
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from app.services.scraping.founders import scrape_founders
 
+from _cache import cached, configure_from_argv
+from _files import quiet_output, safe_filename, write_json
+from _loop import run
+
+SEP = "=" * 70
+
 
-async def test_founders_scraper(company_name: str, max_people: int = 20, website_url: str = None):
+async def test_founders_scraper(company_name: str, max_people: int = 20, website_url: str | None = None):
     """Test the founders & leadership scraper."""
     
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"FOUNDERS & LEADERSHIP SCRAPER - STANDALONE TEST")
-    print(f"{'='*70}")
+    print(f"{SEP}")
     print(f"Company: {company_name}")
     print(f"Max People: {max_people}")
     if website_url:
         print(f"Website: {website_url}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
     
     try:
         # Scrape founders
-        data = await scrape_founders(company_name, website_url, max_people)
+        data = await cached(
+            f"founders:{company_name}:{website_url}:{max_people}",
+            lambda: scrape_founders(company_name, website_url, max_people)
+        )
         
         # Print results
         print_results(data, company_name)
@@ -54,110 +63,131 @@ async def test_founders_scraper(company_name: str, max_people: int = 20, website
         
         return data
         
+    except (httpx.HTTPError, TimeoutError) as e:
+        # Network failures are expected from live scraping; no traceback needed
+        print(f"\n❌ Error during scraping: {str(e)}")
+        return None
     except Exception as e:
         print(f"\n❌ Error during scraping: {str(e)}")
-        import traceback
         traceback.print_exc()
         return None
 
 
-def print_results(data: dict, company_name: str):
+def print_results(data: dict, company_name: str) -> None:
     """Print scraping results in a formatted way."""
     
-    print(f"\n{'='*70}")
-    print(f"RESULTS")
-    print(f"{'='*70}")
-    print(f"Total People Found: {data['total_count']}")
+    # Build the report first and write it out once
+    out = []
+    out.append(f"\n{SEP}")
+    out.append(f"RESULTS")
+    out.append(f"{SEP}")
+    out.append(f"Total People Found: {data['total_count']}")
     
-    print(f"\nBy Source:")
+    out.append(f"\nBy Source:")
     for source, count in data['source_counts'].items():
-        print(f"  - {source.title()}: {count}")
+        out.append(f"  - {source.title()}: {count}")
     
-    print(f"\nBy Category:")
-    print(f"  - Founders: {len(data['founders'])}")
-    print(f"  - Executives: {len(data['executives'])}")
-    print(f"  - Leadership: {len(data['leadership'])}")
-    print(f"  - Board: {len(data['board'])}")
+    out.append(f"\nBy Category:")
+    out.append(f"  - Founders: {len(data['founders'])}")
+    out.append(f"  - Executives: {len(data['executives'])}")
+    out.append(f"  - Leadership: {len(data['leadership'])}")
+    out.append(f"  - Board: {len(data['board'])}")
     
     # Print founders
     if data['founders']:
-        print(f"\n{'='*70}")
-        print(f"FOUNDERS ({len(data['founders'])})")
-        print(f"{'='*70}\n")
+        out.append(f"\n{SEP}")
+        out.append(f"FOUNDERS ({len(data['founders'])})")
+        out.append(f"{SEP}\n")
         
         for i, person in enumerate(data['founders'], 1):
-            sources = person.get('sources', [person['source']])
-            print(f"{i}. {person['name']}")
-            print(f"   Role: {person['role']}")
-            print(f"   Sources: {', '.join(sources)} ({len(sources)} source(s))")
-            if person.get('url'):
-                print(f"   URL: {person['url']}")
-            print()
+            name, role, url = person['name'], person['role'], person.get('url')
+            sources = person.get('sources') or (person['source'],)
+            n = len(sources)
+            sources_text = sources[0] if n == 1 else ', '.join(sources)
+            out.append(f"{i}. {name}")
+            out.append(f"   Role: {role}")
+            out.append(f"   Sources: {sources_text} ({n} source(s))")
+            if url:
+                out.append(f"   URL: {url}")
+            out.append("")
     
     # Print executives
     if data['executives']:
-        print(f"\n{'='*70}")
-        print(f"EXECUTIVES ({len(data['executives'])})")
-        print(f"{'='*70}\n")
+        out.append(f"\n{SEP}")
+        out.append(f"EXECUTIVES ({len(data['executives'])})")
+        out.append(f"{SEP}\n")
         
         for i, person in enumerate(data['executives'], 1):
-            sources = person.get('sources', [person['source']])
-            print(f"{i}. {person['name']}")
-            print(f"   Role: {person['role']}")
-            print(f"   Sources: {', '.join(sources)} ({len(sources)} source(s))")
-            if person.get('url'):
-                print(f"   URL: {person['url']}")
-            print()
+            name, role, url = person['name'], person['role'], person.get('url')
+            sources = person.get('sources') or (person['source'],)
+            n = len(sources)
+            sources_text = sources[0] if n == 1 else ', '.join(sources)
+            out.append(f"{i}. {name}")
+            out.append(f"   Role: {role}")
+            out.append(f"   Sources: {sources_text} ({n} source(s))")
+            if url:
+                out.append(f"   URL: {url}")
+            out.append("")
     
     # Print leadership (first 5)
     if data['leadership']:
-        print(f"\n{'='*70}")
-        print(f"LEADERSHIP TEAM (Showing first 5 of {len(data['leadership'])})")
-        print(f"{'='*70}\n")
+        out.append(f"\n{SEP}")
+        out.append(f"LEADERSHIP TEAM (Showing first 5 of {len(data['leadership'])})")
+        out.append(f"{SEP}\n")
         
         for i, person in enumerate(data['leadership'][:5], 1):
-            sources = person.get('sources', [person['source']])
-            print(f"{i}. {person['name']}")
-            print(f"   Role: {person['role']}")
-            print(f"   Sources: {', '.join(sources)} ({len(sources)} source(s))")
-            print()
+            name, role = person['name'], person['role']
+            sources = person.get('sources') or (person['source'],)
+            n = len(sources)
+            sources_text = sources[0] if n == 1 else ', '.join(sources)
+            out.append(f"{i}. {name}")
+            out.append(f"   Role: {role}")
+            out.append(f"   Sources: {sources_text} ({n} source(s))")
+            out.append("")
     
     # Print board (first 5)
     if data['board']:
-        print(f"\n{'='*70}")
-        print(f"BOARD MEMBERS (Showing first 5 of {len(data['board'])})")
-        print(f"{'='*70}\n")
+        out.append(f"\n{SEP}")
+        out.append(f"BOARD MEMBERS (Showing first 5 of {len(data['board'])})")
+        out.append(f"{SEP}\n")
         
         for i, person in enumerate(data['board'][:5], 1):
-            sources = person.get('sources', [person['source']])
-            print(f"{i}. {person['name']}")
-            print(f"   Role: {person['role']}")
-            print(f"   Sources: {', '.join(sources)} ({len(sources)} source(s))")
-            print()
+            name, role = person['name'], person['role']
+            sources = person.get('sources') or (person['source'],)
+            n = len(sources)
+            sources_text = sources[0] if n == 1 else ', '.join(sources)
+            out.append(f"{i}. {name}")
+            out.append(f"   Role: {role}")
+            out.append(f"   Sources: {sources_text} ({n} source(s))")
+            out.append("")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def save_results(data: dict, company_name: str):
+def save_results(data: dict, company_name: str) -> None:
     """Save results to JSON file."""
     
     # Sanitize company name for filename
-    safe_name = re.sub(r'[^a-zA-Z0-9_-]', '_', company_name.lower().replace(' ', '_'))
-    safe_name = re.sub(r'_+', '_', safe_name).strip('_')
+    safe_name = safe_filename(company_name, ascii_only=True)
     
     output_filename = f"founders_{safe_name}.json"
     output_path = project_root / output_filename
     
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
+    write_json(output_path, data)
     
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"✅ Full results saved to: {output_filename}")
-    print(f"{'='*70}")
+    print(f"{SEP}")
 
 
 def main():
     """Main entry point."""
+    configure_from_argv()
+    # --quiet / -q: print only the saved JSON paths
+    quiet = '--quiet' in sys.argv or '-q' in sys.argv
+    sys.argv[1:] = [arg for arg in sys.argv[1:] if arg not in ('--quiet', '-q')]
     if len(sys.argv) < 2:
-        print("Usage: python3 tests/test_founders_standalone.py \"COMPANY_NAME\" [max_people] [website_url]")
+        print("Usage: python3 tests/test_founders_standalone.py \"COMPANY_NAME\" [max_people] [website_url] [--cache] [--quiet]")
         print("\nExamples:")
         print("  python3 tests/test_founders_standalone.py \"Stripe\"")
         print("  python3 tests/test_founders_standalone.py \"Stripe\" 20 \"https://stripe.com\"")
@@ -169,7 +199,8 @@ def main():
     website_url = sys.argv[3] if len(sys.argv) > 3 else None
     
     # Run the test
-    asyncio.run(test_founders_scraper(company_name, max_people, website_url))
+    with quiet_output(quiet):
+        run(test_founders_scraper(company_name, max_people, website_url))
 
 
 if __name__ == "__main__":
@@ -6,142 +6,181 @@ Usage:
     python tests/test_google_search_standalone.py
     python tests/test_google_search_standalone.py "Stripe"
     python tests/test_google_search_standalone.py "Stripe" "OpenAI"
+    python tests/test_google_search_standalone.py "Stripe" --cache
+    python tests/test_google_search_standalone.py "Stripe" "OpenAI" --quiet
 """
 
 import asyncio
 import sys
-import json
+import traceback
 from pathlib import Path
 
+import httpx
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.services.scraping.google_search_scraper import google_search_scraper
 
+from _cache import cached, configure_from_argv
+from _files import quiet_output, write_json
+import _loop
+
+SEP = "=" * 70
+
+# Companies searched at the same time; the shared http_client limiter still paces requests
+GOOGLE_CONCURRENCY = 3
+
+# Companies tested when none are given on the command line
+DEFAULT_COMPANIES = ('Stripe', 'OpenAI')
 
-async def test_google_search(company_name: str):
+
+async def test_google_search(company_name: str, client: httpx.AsyncClient | None = None):
     """Test all Google search functions for a company."""
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"🧪 TESTING GOOGLE SEARCH SCRAPER FOR: {company_name}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
+    
+    # The four searches are independent, so run them together and print afterwards
+    domain = f"{company_name.lower().replace(' ', '')}.com"  # Need a domain for competitor search
+    print(f"🔎 Running founder, funding, competitor and news searches concurrently...\n")
+    searches = await asyncio.gather(
+        cached(f"google:founders:{company_name}", lambda: google_search_scraper.search_founders(company_name, client=client)),
+        cached(f"google:funding:{company_name}", lambda: google_search_scraper.search_funding(company_name, client=client)),
+        cached(f"google:competitors:{domain}", lambda: google_search_scraper.search_competitors(domain, client=client)),
+        cached(f"google:news:{company_name}:10", lambda: google_search_scraper.search_news(company_name, limit=10, client=client)),
+        return_exceptions=True
+    )
     
+    # Build the report first and write it out once
+    out = []
     results = {}
+    for key, outcome in zip(('founders', 'funding', 'competitors', 'news'), searches):
+        if isinstance(outcome, Exception):
+            out.append(f"   ❌ {key} search failed: {outcome}")
+            outcome = []
+        results[key] = outcome
+    founders, funding, competitors, news = results.values()
     
     # Test 1: Search for founders
-    print(f"👥 TEST 1: Searching for founders and executives...")
-    founders = await google_search_scraper.search_founders(company_name)
-    results['founders'] = founders
-    print(f"   ✅ Found {len(founders)} founder/executive profiles\n")
+    out.append(f"\n👥 TEST 1: Searching for founders and executives...")
+    out.append(f"   ✅ Found {len(founders)} founder/executive profiles\n")
     if founders:
         for i, founder in enumerate(founders[:5], 1):
-            print(f"   {i}. {founder.get('name', 'N/A')}")
-            print(f"      Title: {founder.get('title', 'N/A')}")
-            print(f"      LinkedIn: {founder.get('linkedin_url', 'N/A')}")
+            out.append(f"   {i}. {founder.get('name', 'N/A')}")
+            out.append(f"      Title: {founder.get('title', 'N/A')}")
+            out.append(f"      LinkedIn: {founder.get('linkedin_url', 'N/A')}")
     else:
-        print(f"   ⚠️  No founders found")
+        out.append(f"   ⚠️  No founders found")
     
     # Test 2: Search for funding
-    print(f"\n💰 TEST 2: Searching for funding information...")
-    funding = await google_search_scraper.search_funding(company_name)
-    results['funding'] = funding
-    print(f"   ✅ Found {len(funding)} funding mentions\n")
+    out.append(f"\n💰 TEST 2: Searching for funding information...")
+    out.append(f"   ✅ Found {len(funding)} funding mentions\n")
     if funding:
         for i, item in enumerate(funding[:5], 1):
-            print(f"   {i}. {item.get('title', 'N/A')}")
-            print(f"      Amount: {item.get('amount', 'N/A')}")
-            print(f"      Source: {item.get('source', 'N/A')}")
-            print(f"      URL: {item.get('url', 'N/A')}")
+            out.append(f"   {i}. {item.get('title', 'N/A')}")
+            out.append(f"      Amount: {item.get('amount', 'N/A')}")
+            out.append(f"      Source: {item.get('source', 'N/A')}")
+            out.append(f"      URL: {item.get('url', 'N/A')}")
     else:
-        print(f"   ⚠️  No funding information found")
+        out.append(f"   ⚠️  No funding information found")
     
     # Test 3: Search for competitors
-    print(f"\n🏢 TEST 3: Searching for competitors...")
-    # Need a domain for competitor search
-    domain = f"{company_name.lower().replace(' ', '')}.com"
-    competitors = await google_search_scraper.search_competitors(domain)
-    results['competitors'] = competitors
-    print(f"   ✅ Found {len(competitors)} competitors\n")
+    out.append(f"\n🏢 TEST 3: Searching for competitors...")
+    out.append(f"   ✅ Found {len(competitors)} competitors\n")
     if competitors:
         for i, competitor in enumerate(competitors[:10], 1):
-            print(f"   {i}. {competitor.get('name', 'N/A')}")
-            print(f"      Domain: {competitor.get('domain', 'N/A')}")
-            print(f"      Description: {competitor.get('description', 'N/A')[:80]}...")
+            out.append(f"   {i}. {competitor.get('name', 'N/A')}")
+            out.append(f"      Domain: {competitor.get('domain', 'N/A')}")
+            out.append(f"      Description: {competitor.get('description', 'N/A')[:80]}...")
     else:
-        print(f"   ⚠️  No competitors found")
+        out.append(f"   ⚠️  No competitors found")
     
     # Test 4: Search for news
-    print(f"\n📰 TEST 4: Searching for recent news...")
-    news = await google_search_scraper.search_news(company_name, max_results=10)
-    results['news'] = news
-    print(f"   ✅ Found {len(news)} news articles\n")
+    out.append(f"\n📰 TEST 4: Searching for recent news...")
+    out.append(f"   ✅ Found {len(news)} news articles\n")
     if news:
         for i, article in enumerate(news[:5], 1):
-            print(f"   {i}. {article.get('title', 'N/A')}")
-            print(f"      Source: {article.get('source', 'N/A')}")
-            print(f"      Date: {article.get('date', 'N/A')}")
-            print(f"      URL: {article.get('url', 'N/A')}")
-            print(f"      Snippet: {article.get('snippet', 'N/A')[:100]}...")
-            print()
+            out.append(f"   {i}. {article.get('title', 'N/A')}")
+            out.append(f"      Source: {article.get('source', 'N/A')}")
+            out.append(f"      Date: {article.get('date', 'N/A')}")
+            out.append(f"      URL: {article.get('url', 'N/A')}")
+            out.append(f"      Snippet: {article.get('snippet', 'N/A')[:100]}...")
+            out.append("")
     else:
-        print(f"   ⚠️  No news found")
+        out.append(f"   ⚠️  No news found")
     
     # Summary
-    print(f"\n{'='*70}")
-    print(f"📊 SUMMARY FOR {company_name}")
-    print(f"{'='*70}")
-    print(f"   👥 Founders/Executives: {len(results['founders'])}")
-    print(f"   💰 Funding Mentions: {len(results['funding'])}")
-    print(f"   🏢 Competitors: {len(results['competitors'])}")
-    print(f"   📰 News Articles: {len(results['news'])}")
+    out.append(f"\n{SEP}")
+    out.append(f"📊 SUMMARY FOR {company_name}")
+    out.append(f"{SEP}")
+    out.append(f"   👥 Founders/Executives: {len(results['founders'])}")
+    out.append(f"   💰 Funding Mentions: {len(results['funding'])}")
+    out.append(f"   🏢 Competitors: {len(results['competitors'])}")
+    out.append(f"   📰 News Articles: {len(results['news'])}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Save detailed output
     safe_name = company_name.lower().replace(' ', '_')
     output_file = f"google_search_output_{safe_name}.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    write_json(output_file, results)
     
     print(f"\n💾 Full data saved to: {output_file}")
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"✅ TEST COMPLETED FOR {company_name}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
 
 
-async def main():
+async def main(companies: list[str]):
     """Main test function."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("🚀 GOOGLE SEARCH SCRAPER - STANDALONE TEST")
-    print("="*70)
+    print(SEP)
     print("\nℹ️  NOTE: Google may block requests if rate limit is exceeded.")
     print("   Results depend on Google's search results at the time of testing.")
     
-    # Get company names from command line or use defaults
-    if len(sys.argv) > 1:
-        companies = sys.argv[1:]
-    else:
-        # Default test companies
-        companies = ['Stripe', 'OpenAI']
+    # Use the default companies if none were given
+    if not companies:
+        companies = list(DEFAULT_COMPANIES)
         print(f"\nℹ️  No company names provided. Testing with defaults:")
         for company in companies:
             print(f"   - {company}")
         print(f"\n   Usage: python tests/test_google_search_standalone.py \"Company Name\" ...")
     
-    # Test each company
-    for company in companies:
+    # One pooled client for every search so TCP/TLS setup to Google is paid once
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=10.0),
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=8, keepalive_expiry=30.0)
+    ) as client:
+        semaphore = asyncio.Semaphore(GOOGLE_CONCURRENCY)
+        
+        # Each company's report is printed in one go after its searches finish,
+        # so concurrent companies don't interleave their output
+        async def run(company: str):
+            async with semaphore:
+                try:
+                    await test_google_search(company, client=client)
+                except (httpx.HTTPError, TimeoutError) as e:
+                    print(f"\n❌ {company}: {e}")
+                except Exception as e:
+                    print(f"\n❌ Error testing {company}: {e}")
+                    traceback.print_exc()
+        
         try:
-            await test_google_search(company)
-            await asyncio.sleep(3)  # Rate limiting between companies
-        except KeyboardInterrupt:
+            await asyncio.gather(*(run(company) for company in companies))
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print("\n\n⚠️  Test interrupted by user")
-            break
-        except Exception as e:
-            print(f"\n❌ Error testing {company}: {e}")
-            import traceback
-            traceback.print_exc()
     
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("✅ ALL TESTS COMPLETED")
-    print("="*70 + "\n")
+    print(SEP + "\n")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    configure_from_argv()
+    # --quiet / -q: print only the saved JSON paths
+    quiet = '--quiet' in sys.argv or '-q' in sys.argv
+    sys.argv[1:] = [arg for arg in sys.argv[1:] if arg not in ('--quiet', '-q')]
+    with quiet_output(quiet):
+        _loop.run(main(sys.argv[1:]))
@@ -8,12 +8,13 @@ Usage:
     python3 tests/test_news_press_standalone.py "Stripe"
     python3 tests/test_news_press_standalone.py "Apple" 25
     python3 tests/test_news_press_standalone.py "OpenAI" 15 "https://openai.com"
+    python3 tests/test_news_press_standalone.py "Stripe" --cache
+    python3 tests/test_news_press_standalone.py "Stripe" --quiet
+    python3 tests/test_news_press_standalone.py "Stripe" --jsonl
 """
 
 import sys
 import os
-import asyncio
-import json
 from datetime import datetime
 
 # Add parent directory to path
@@ -21,21 +22,22 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from app.services.scraping.news import scrape_news_and_press
 
+from _cache import cached, configure_from_argv
+from _files import quiet_output, safe_filename, write_json, write_jsonl
+from _loop import run
 
-def safe_filename(company_name: str) -> str:
-    """Convert company name to safe filename."""
-    # Remove special characters and spaces
-    safe_name = ''.join(c if c.isalnum() else '_' for c in company_name.lower())
-    # Remove multiple underscores
-    safe_name = '_'.join(filter(None, safe_name.split('_')))
-    return safe_name
+SEP = "=" * 70
+
+# Set by --jsonl: write one article per line plus a .meta.json instead of one JSON file
+jsonl_output = False
 
 
 async def main():
     """Main test function."""
     # Parse arguments
+    configure_from_argv()
     if len(sys.argv) < 2:
-        print("Usage: python3 tests/test_news_press_standalone.py <company_name> [max_articles] [website_url]")
+        print("Usage: python3 tests/test_news_press_standalone.py <company_name> [max_articles] [website_url] [--cache] [--quiet] [--jsonl]")
         print("Example: python3 tests/test_news_press_standalone.py 'Stripe' 20 'https://stripe.com'")
         sys.exit(1)
     
@@ -43,60 +45,76 @@ async def main():
     max_articles = int(sys.argv[2]) if len(sys.argv) > 2 else 20
     website_url = sys.argv[3] if len(sys.argv) > 3 else None
     
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"NEWS & PRESS SCRAPER - STANDALONE TEST")
-    print(f"{'='*70}")
+    print(f"{SEP}")
     print(f"Company: {company_name}")
     print(f"Max Articles: {max_articles}")
     if website_url:
         print(f"Website: {website_url}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
     
     # Run scraper
-    result = await scrape_news_and_press(company_name, website_url, max_articles)
+    result = await cached(
+        f"news:{company_name}:{website_url}:{max_articles}",
+        lambda: scrape_news_and_press(company_name, website_url, max_articles)
+    )
     
-    # Print results
-    print(f"\n{'='*70}")
-    print(f"RESULTS")
-    print(f"{'='*70}")
-    print(f"Total Articles Found: {result['total_articles']}")
-    print(f"\nBy Source:")
+    # Print results, building the report first and writing it out once
+    out = []
+    out.append(f"\n{SEP}")
+    out.append(f"RESULTS")
+    out.append(f"{SEP}")
+    out.append(f"Total Articles Found: {result['total_articles']}")
+    out.append(f"\nBy Source:")
     for source, count in result['sources'].items():
-        print(f"  - {source.replace('_', ' ').title()}: {count}")
+        out.append(f"  - {source.replace('_', ' ').title()}: {count}")
     
     if result.get('date_range'):
-        print(f"\nDate Range:")
-        print(f"  Oldest: {result['date_range']['oldest']}")
-        print(f"  Newest: {result['date_range']['newest']}")
+        out.append(f"\nDate Range:")
+        out.append(f"  Oldest: {result['date_range']['oldest']}")
+        out.append(f"  Newest: {result['date_range']['newest']}")
     
     # Show sample articles
     if result['articles']:
-        print(f"\n{'='*70}")
-        print(f"SAMPLE ARTICLES (Top 5)")
-        print(f"{'='*70}")
+        out.append(f"\n{SEP}")
+        out.append(f"SAMPLE ARTICLES (Top 5)")
+        out.append(f"{SEP}")
         
         for i, article in enumerate(result['articles'][:5], 1):
-            print(f"\n{i}. {article['title']}")
-            print(f"   Source: {article['source']}")
-            print(f"   Type: {article['article_type']}")
-            print(f"   Date: {article['date_string']}")
-            print(f"   Credibility: {article['credibility_score']}/10")
-            print(f"   URL: {article['url']}")
+            out.append(f"\n{i}. {article['title']}")
+            out.append(f"   Source: {article['source']}")
+            out.append(f"   Type: {article['article_type']}")
+            out.append(f"   Date: {article['date_string']}")
+            out.append(f"   Credibility: {article['credibility_score']}/10")
+            out.append(f"   URL: {article['url']}")
             if article.get('description'):
                 desc = article['description'][:150] + '...' if len(article['description']) > 150 else article['description']
-                print(f"   Description: {desc}")
+                out.append(f"   Description: {desc}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Save full results to JSON
     safe_name = safe_filename(company_name)
-    output_file = f"news_press_{safe_name}.json"
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    if jsonl_output:
+        output_file = f"news_press_{safe_name}.jsonl"
+        meta = {k: v for k, v in result.items() if k != 'articles'}
+        write_jsonl(output_file, result['articles'], f"news_press_{safe_name}.meta.json", meta)
+    else:
+        output_file = f"news_press_{safe_name}.json"
+        write_json(output_file, result)
     
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"✅ Full results saved to: {output_file}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    # --quiet / -q: print only the saved JSON paths
+    quiet = '--quiet' in sys.argv or '-q' in sys.argv
+    sys.argv[1:] = [arg for arg in sys.argv[1:] if arg not in ('--quiet', '-q')]
+    if '--jsonl' in sys.argv:
+        sys.argv.remove('--jsonl')
+        jsonl_output = True
+    with quiet_output(quiet):
+        run(main())
@@ -6,13 +6,18 @@ Usage:
     python tests/test_pitchbook_standalone.py
     python tests/test_pitchbook_standalone.py "Stripe"
     python tests/test_pitchbook_standalone.py "OpenAI" "Anthropic" "Databricks"
+    python tests/test_pitchbook_standalone.py "Stripe" --cache
+    python tests/test_pitchbook_standalone.py "Stripe" "OpenAI" --quiet
+    python tests/test_pitchbook_standalone.py "Stripe" --jsonl
 """
 
 import asyncio
 import sys
-import json
+import traceback
 from pathlib import Path
 
+import httpx
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -22,12 +27,27 @@ from app.services.scraping.financial.pitchbook_scraper import (
     scrape_pitchbook_profile
 )
 
+from _cache import cached, configure_from_argv
+from _files import quiet_output, write_json, write_jsonl
+import _loop
+
+SEP = "=" * 70
+
+# Set by --jsonl: write one funding round per line plus a .meta.json instead of one JSON file
+jsonl_output = False
+
+# Companies fetched at the same time; kept low since PitchBook blocks aggressive clients
+PITCHBOOK_CONCURRENCY = 3
+
+# Companies tested when none are given on the command line
+DEFAULT_COMPANIES = ('Stripe', 'OpenAI', 'Anthropic')
+
 
 async def test_pitchbook_search(company_name: str):
     """Test PitchBook URL search."""
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"🔍 TESTING PITCHBOOK URL SEARCH")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
     print(f"Company: {company_name}\n")
     
     url = await search_pitchbook_url(company_name)
@@ -42,13 +62,13 @@ async def test_pitchbook_search(company_name: str):
 
 async def test_pitchbook_scraper(company_name: str):
     """Test PitchBook scraper with a specific company."""
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"🧪 TESTING PITCHBOOK SCRAPER FOR: {company_name}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
     
     # Get company data
     print(f"📊 Fetching PitchBook data for {company_name}...\n")
-    result = await get_company_data(company_name)
+    result = await cached(f"pitchbook:{company_name}", lambda: get_company_data(company_name))
     
     if not result or result.get('error'):
         print(f"❌ {result.get('error', 'No data found')}\n")
@@ -56,117 +76,136 @@ async def test_pitchbook_scraper(company_name: str):
             print(f"💡 {result['suggestion']}\n")
         return
     
-    print(f"\n{'='*70}")
-    print(f"📈 RESULTS SUMMARY")
-    print(f"{'='*70}\n")
+    # Build the report first and write it out once
+    out = []
+    out.append(f"\n{SEP}")
+    out.append(f"📈 RESULTS SUMMARY")
+    out.append(f"{SEP}\n")
     
     # Basic company info
-    print(f"🏢 Company Information:")
-    print(f"   - Name: {result.get('company_name', 'N/A')}")
-    print(f"   - Website: {result.get('website', 'N/A')}")
-    print(f"   - PitchBook URL: {result.get('pitchbook_url', 'N/A')}")
+    out.append(f"🏢 Company Information:")
+    out.append(f"   - Name: {result.get('company_name', 'N/A')}")
+    out.append(f"   - Website: {result.get('website', 'N/A')}")
+    out.append(f"   - PitchBook URL: {result.get('pitchbook_url', 'N/A')}")
     
     # Description
     description = result.get('description')
     if description:
-        print(f"\n📝 Description:")
-        print(f"   {description[:200]}{'...' if len(description) > 200 else ''}")
+        out.append(f"\n📝 Description:")
+        out.append(f"   {description[:200]}{'...' if len(description) > 200 else ''}")
     
     # Company details
-    print(f"\n🏭 Company Details:")
-    print(f"   - Industry: {result.get('industry', 'N/A')}")
-    print(f"   - Headquarters: {result.get('headquarters', 'N/A')}")
-    print(f"   - Founded: {result.get('founded_year', 'N/A')}")
-    print(f"   - Status: {result.get('status', 'N/A')}")
-    print(f"   - Employees: {result.get('employees', 'N/A')}")
-    print(f"   - Revenue: {result.get('revenue', 'N/A')}")
+    out.append(f"\n🏭 Company Details:")
+    out.append(f"   - Industry: {result.get('industry', 'N/A')}")
+    out.append(f"   - Headquarters: {result.get('headquarters', 'N/A')}")
+    out.append(f"   - Founded: {result.get('founded_year', 'N/A')}")
+    out.append(f"   - Status: {result.get('status', 'N/A')}")
+    out.append(f"   - Employees: {result.get('employees', 'N/A')}")
+    out.append(f"   - Revenue: {result.get('revenue', 'N/A')}")
     
     # Funding information
     total_raised = result.get('total_raised')
     latest_deal = result.get('latest_deal_type')
     funding_rounds = result.get('funding_rounds', [])
     
-    print(f"\n💰 Funding Information:")
-    print(f"   - Total Raised: {total_raised if total_raised else 'N/A'}")
-    print(f"   - Latest Deal: {latest_deal if latest_deal else 'N/A'}")
-    print(f"   - Funding Rounds: {len(funding_rounds)}")
+    out.append(f"\n💰 Funding Information:")
+    out.append(f"   - Total Raised: {total_raised if total_raised else 'N/A'}")
+    out.append(f"   - Latest Deal: {latest_deal if latest_deal else 'N/A'}")
+    out.append(f"   - Funding Rounds: {len(funding_rounds)}")
     
     if funding_rounds:
-        print(f"\n   Funding Rounds Details:")
+        out.append(f"\n   Funding Rounds Details:")
         for i, round_data in enumerate(funding_rounds[:5], 1):
-            print(f"   {i}. Deal Type: {round_data.get('deal_type', 'N/A')}")
-            print(f"      Date: {round_data.get('date', 'N/A')}")
-            print(f"      Amount: {round_data.get('amount', 'N/A')}")
-            print(f"      Raised to Date: {round_data.get('raised_to_date', 'N/A')}")
-            print(f"      Post-Val: {round_data.get('post_val', 'N/A')}")
+            out.append(f"   {i}. Deal Type: {round_data.get('deal_type', 'N/A')}")
+            out.append(f"      Date: {round_data.get('date', 'N/A')}")
+            out.append(f"      Amount: {round_data.get('amount', 'N/A')}")
+            out.append(f"      Raised to Date: {round_data.get('raised_to_date', 'N/A')}")
+            out.append(f"      Post-Val: {round_data.get('post_val', 'N/A')}")
     
     # Investors
     investors = result.get('investors', [])
-    print(f"\n🤝 Investors: {len(investors)}")
+    out.append(f"\n🤝 Investors: {len(investors)}")
     if investors:
         for i, investor in enumerate(investors[:10], 1):
-            print(f"   {i}. {investor}")
+            out.append(f"   {i}. {investor}")
         if len(investors) > 10:
-            print(f"   ... and {len(investors) - 10} more")
+            out.append(f"   ... and {len(investors) - 10} more")
     
     # Competitors
     competitors = result.get('competitors', [])
     
-    print(f"\n🏆 Competitors: {len(competitors)}")
+    out.append(f"\n🏆 Competitors: {len(competitors)}")
     if competitors:
         for i, competitor in enumerate(competitors[:10], 1):
-            print(f"   {i}. {competitor}")
+            out.append(f"   {i}. {competitor}")
         if len(competitors) > 10:
-            print(f"   ... and {len(competitors) - 10} more")
+            out.append(f"   ... and {len(competitors) - 10} more")
+    
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Save detailed output
     safe_name = company_name.lower().replace(' ', '_')
-    output_file = f"pitchbook_output_{safe_name}.json"
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2, default=str)
+    if jsonl_output:
+        output_file = f"pitchbook_output_{safe_name}.jsonl"
+        meta = {k: v for k, v in result.items() if k != 'funding_rounds'}
+        write_jsonl(output_file, funding_rounds, f"pitchbook_output_{safe_name}.meta.json", meta)
+    else:
+        output_file = f"pitchbook_output_{safe_name}.json"
+        write_json(output_file, result)
     
     print(f"\n💾 Full data saved to: {output_file}")
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"✅ TEST COMPLETED FOR {company_name}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
 
 
-async def main():
+async def main(companies: list[str]):
     """Main test function."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("🚀 PITCHBOOK SCRAPER - STANDALONE TEST")
-    print("="*70)
+    print(SEP)
     print("\n⚠️  Note: PitchBook may block scraping requests.")
     print("   Results depend on PitchBook's anti-bot measures.")
     
-    # Get company names from command line or use defaults
-    if len(sys.argv) > 1:
-        companies = sys.argv[1:]
-    else:
-        # Default test companies
-        companies = ['Stripe', 'OpenAI', 'Anthropic']
+    # Use the default companies if none were given
+    if not companies:
+        companies = list(DEFAULT_COMPANIES)
         print(f"\nℹ️  No company names provided. Testing with defaults:")
         for company in companies:
             print(f"   - {company}")
         print(f"\n   Usage: python tests/test_pitchbook_standalone.py \"Company Name\" ...")
     
-    # Test each company
-    for company in companies:
-        try:
-            await test_pitchbook_scraper(company)
-            await asyncio.sleep(3)  # Rate limiting between companies
-        except KeyboardInterrupt:
-            print("\n\n⚠️  Test interrupted by user")
-            break
-        except Exception as e:
-            print(f"\n❌ Error testing {company}: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    print("\n" + "="*70)
+    # Test companies concurrently; each report is printed in one go once its data arrives
+    semaphore = asyncio.Semaphore(PITCHBOOK_CONCURRENCY)
+    
+    async def run(company: str):
+        async with semaphore:
+            try:
+                await test_pitchbook_scraper(company)
+            except (httpx.HTTPError, TimeoutError) as e:
+                # Blocks and timeouts are expected from PitchBook; no traceback needed
+                print(f"\n❌ {company}: {e}")
+            except Exception as e:
+                print(f"\n❌ Error testing {company}: {e}")
+                traceback.print_exc()
+    
+    try:
+        await asyncio.gather(*(run(company) for company in companies))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n\n⚠️  Test interrupted by user")
+    
+    print("\n" + SEP)
     print("✅ ALL TESTS COMPLETED")
-    print("="*70 + "\n")
+    print(SEP + "\n")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    configure_from_argv()
+    # --quiet / -q: print only the saved JSON paths
+    quiet = '--quiet' in sys.argv or '-q' in sys.argv
+    sys.argv[1:] = [arg for arg in sys.argv[1:] if arg not in ('--quiet', '-q')]
+    if '--jsonl' in sys.argv:
+        sys.argv.remove('--jsonl')
+        jsonl_output = True
+    with quiet_output(quiet):
+        _loop.run(main(sys.argv[1:]))
@@ -7,7 +7,7 @@ Tests the unified profile scraper that combines:
 - Wikipedia page
 
 Usage:
-    python3 tests/test_profile_standalone.py "Company Name" [website_url]
+    python3 tests/test_profile_standalone.py "Company Name" [website_url] [--cache] [--quiet]
     
 Examples:
     python3 tests/test_profile_standalone.py "Stripe"
@@ -16,17 +16,23 @@ Examples:
 """
 
 import sys
-import asyncio
-import json
-import re
+import traceback
 from pathlib import Path
 
+import httpx
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from app.services.scraping.profile.company_profile_scraper import get_company_profile, extract_company_name_from_url
 
+from _cache import cached, configure_from_argv
+from _files import quiet_output, safe_filename, write_json_split
+from _loop import run
+
+SEP = "=" * 70
+
 
 async def test_profile_scraper(company_name_or_url: str, website: str | None = None):
     """Test the company profile scraper."""
@@ -36,43 +42,38 @@ async def test_profile_scraper(company_name_or_url: str, website: str | None = N
     if not website and extracted_website:
         website = extracted_website
     
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"TESTING COMPANY PROFILE SCRAPER")
-    print(f"{'='*70}")
+    print(f"{SEP}")
     print(f"Input: {company_name_or_url}")
     print(f"Company: {company_name}")
     if website:
         print(f"Website: {website}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
     
     try:
         # Get unified profile data
-        data = await get_company_profile(company_name_or_url, website)
+        data = await cached(
+            f"profile:{company_name_or_url}:{website}",
+            lambda: get_company_profile(company_name_or_url, website)
+        )
         
         # Display results
-        print("\n" + "="*70)
+        print("\n" + SEP)
         print("✅ SCRAPING COMPLETE")
-        print("="*70)
+        print(SEP)
         
         # Sanitize company name for filename (remove invalid characters)
-        safe_name = re.sub(r'[^a-zA-Z0-9_-]', '_', company_name.lower().replace(' ', '_'))
-        safe_name = re.sub(r'_+', '_', safe_name).strip('_')  # Remove multiple underscores
+        safe_name = safe_filename(company_name, ascii_only=True)
         
         # Save to file (clean version without raw_data)
         output_filename = f"profile_{safe_name}.json"
         output_path = project_root / output_filename
         
-        # Create clean copy for readability
-        clean_data = {k: v for k, v in data.items() if k != 'raw_data'}
-        clean_data['metadata'] = data.get('metadata', {})
-        
-        with open(output_path, "w") as f:
-            json.dump(clean_data, f, indent=2)
-        
-        # Save full data with raw_data to separate file
+        # Clean copy for readability, full data with raw_data to a separate file;
+        # raw_data is encoded once and spliced into the full file
         full_output_path = project_root / f"profile_{safe_name}_full.json"
-        with open(full_output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        write_json_split(output_path, full_output_path, data)
         
         print(f"\n💾 Data saved to:")
         print(f"   - Clean version: {output_filename}")
@@ -80,17 +81,24 @@ async def test_profile_scraper(company_name_or_url: str, website: str | None = N
         
         return data
         
+    except (httpx.HTTPError, TimeoutError) as e:
+        # Network failures are expected from live scraping; no traceback needed
+        print(f"\n❌ Error during scraping: {str(e)}")
+        return None
     except Exception as e:
         print(f"\n❌ Error during scraping: {str(e)}")
-        import traceback
         traceback.print_exc()
         return None
 
 
 def main():
     """Main entry point."""
+    configure_from_argv()
+    # --quiet / -q: print only the saved JSON paths
+    quiet = '--quiet' in sys.argv or '-q' in sys.argv
+    sys.argv[1:] = [arg for arg in sys.argv[1:] if arg not in ('--quiet', '-q')]
     if len(sys.argv) < 2:
-        print("Usage: python3 tests/test_profile_standalone.py \"Company Name or URL\" [website_url]")
+        print("Usage: python3 tests/test_profile_standalone.py \"Company Name or URL\" [website_url] [--cache] [--quiet]")
         print("\nExamples:")
         print("  python3 tests/test_profile_standalone.py \"Stripe\"")
         print("  python3 tests/test_profile_standalone.py \"tesla.com\"")
@@ -103,7 +111,8 @@ def main():
     website = sys.argv[2] if len(sys.argv) > 2 else None
     
     # Run the test
-    asyncio.run(test_profile_scraper(company_name_or_url, website))
+    with quiet_output(quiet):
+        run(test_profile_scraper(company_name_or_url, website))
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ Standalone test script for the unified funding scraper.
 Tests the combined EDGAR + PitchBook scraper.
 
 Usage:
-    python3 tests/test_unified_funding_standalone.py "Company Name"
+    python3 tests/test_unified_funding_standalone.py "Company Name" [--cache] [--quiet] [--jsonl]
     
 Examples:
     python3 tests/test_unified_funding_standalone.py "Apple"
@@ -12,22 +12,33 @@ Examples:
     python3 tests/test_unified_funding_standalone.py "GitHub"
 """
 
-import asyncio
-import json
 import sys
+import traceback
 from pathlib import Path
 
+import httpx
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from app.services.scraping.financial.funding_scraper import get_unified_funding_data
 
+from _cache import cached, configure_from_argv
+from _files import quiet_output, write_json_split, write_jsonl
+from _loop import run
+
+SEP = "=" * 70
+
+# Set by --jsonl: write one funding round per line plus a .meta.json (without raw_data)
+jsonl_output = False
+
 
 async def main():
     """Test the unified funding scraper."""
     
     # Get company name from command line
+    configure_from_argv()
     if len(sys.argv) < 2:
         print("❌ Error: Company name required")
         print("\nUsage:")
@@ -46,32 +57,40 @@ async def main():
     
     try:
         # Get unified data
-        data = await get_unified_funding_data(company_name)
-        
-        # Save to file (create clean copy without raw_data for readability)
-        output_filename = f"unified_funding_{company_name.lower().replace(' ', '_')}.json"
-        output_path = project_root / output_filename
-        
-        # Create a clean copy without massive raw_data
-        clean_data = {k: v for k, v in data.items() if k != 'raw_data'}
-        clean_data['metadata'] = data.get('metadata', {})
-        
-        with open(output_path, "w") as f:
-            json.dump(clean_data, f, indent=2)
-        
-        # Also save full data with raw_data to separate file
-        full_output_path = project_root / f"unified_funding_{company_name.lower().replace(' ', '_')}_full.json"
-        with open(full_output_path, "w") as f:
-            json.dump(data, f, indent=2)
-        
-        print(f"\n💾 Data saved to:")
-        print(f"   - Clean version: {output_filename}")
-        print(f"   - Full version (with raw_data): {full_output_path.name}")
+        data = await cached(f"unified_funding:{company_name}", lambda: get_unified_funding_data(company_name))
+        
+        safe_name = company_name.lower().replace(' ', '_')
+        
+        if jsonl_output:
+            # Funding rounds one per line; the rest (minus raw_data) alongside
+            output_path = project_root / f"unified_funding_{safe_name}.jsonl"
+            meta_path = project_root / f"unified_funding_{safe_name}.meta.json"
+            funding = data["funding"]
+            meta = {k: v for k, v in data.items() if k != "raw_data"}
+            meta["funding"] = {k: v for k, v in funding.items() if k != "funding_rounds"}
+            write_jsonl(output_path, funding.get("funding_rounds", []), meta_path, meta)
+            
+            print(f"\n💾 Data saved to:")
+            print(f"   - Funding rounds: {output_path.name}")
+            print(f"   - Metadata: {meta_path.name}")
+        else:
+            # Save to file (create clean copy without raw_data for readability)
+            output_filename = f"unified_funding_{safe_name}.json"
+            output_path = project_root / output_filename
+            
+            # Clean copy without massive raw_data, plus full data with raw_data to a
+            # separate file; the shared fields are encoded once for both
+            full_output_path = project_root / f"unified_funding_{safe_name}_full.json"
+            write_json_split(output_path, full_output_path, data)
+            
+            print(f"\n💾 Data saved to:")
+            print(f"   - Clean version: {output_filename}")
+            print(f"   - Full version (with raw_data): {full_output_path.name}")
         
         # Print key metrics
-        print(f"\n{'='*70}")
+        print(f"\n{SEP}")
         print(f"KEY METRICS")
-        print(f"{'='*70}")
+        print(f"{SEP}")
         
         identity = data["identity"]
         financials = data["financials"]
@@ -95,18 +114,28 @@ async def main():
         if funding.get("investors"):
             print(f"👥 Investors: {len(funding['investors'])}")
         
-        print(f"{'='*70}")
+        print(f"{SEP}")
         
         # Exit with success
         print(f"\n✅ Test completed successfully!")
         sys.exit(0)
         
+    except (httpx.HTTPError, TimeoutError) as e:
+        # Network failures are expected from live scraping; no traceback needed
+        print(f"\n❌ Error during scraping: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"\n❌ Error during scraping: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # --quiet / -q: print only the saved JSON paths
+    quiet = '--quiet' in sys.argv or '-q' in sys.argv
+    sys.argv[1:] = [arg for arg in sys.argv[1:] if arg not in ('--quiet', '-q')]
+    if '--jsonl' in sys.argv:
+        sys.argv.remove('--jsonl')
+        jsonl_output = True
+    with quiet_output(quiet):
+        run(main())
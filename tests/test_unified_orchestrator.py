@@ -9,110 +9,166 @@ Examples:
     python3 tests/test_unified_orchestrator.py "https://openai.com"
     python3 tests/test_unified_orchestrator.py "https://github.com"
     python3 tests/test_unified_orchestrator.py "pxxl.app" "PXXL"
+    python3 tests/test_unified_orchestrator.py "https://stripe.com" --quiet
+
+The security and name extraction checks also run under pytest, one test per case:
+    pytest tests/test_unified_orchestrator.py
 """
 
 import sys
-import json
-import asyncio
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.services.scraping.unified_orchestrator import (
-    get_complete_company_intelligence,
-    SecurityValidator,
-    CompanyNameExtractor
+# Only the lightweight validators are imported up front; the orchestrator
+# (and every scraper behind it) is loaded by test_orchestrator when needed
+from app.services.utils.validators import SecurityValidator, CompanyNameExtractor
+
+from _files import quiet_output, write_json
+from _loop import run
+
+SEP = "=" * 80
+PARTY = "🎉" * 40
+
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+# (url, expected_valid, description)
+_SECURITY_CASES = (
+    ("https://stripe.com", True, "Valid HTTPS URL"),
+    ("http://google.com", True, "Valid HTTP URL"),
+    ("https://localhost", False, "Blocked localhost"),
+    ("https://127.0.0.1", False, "Blocked IP"),
+    ("https://192.168.1.1", False, "Blocked private IP"),
+    ("ftp://example.com", False, "Invalid protocol"),
+    ("javascript:alert('xss')", False, "XSS attempt"),
+    ("https://example.com/../../../etc/passwd", False, "Path traversal"),
+    (["https://stripe.com"], False, "Non-string input"),
+)
+
+# (url, expected_name)
+_NAME_CASES = (
+    ("https://stripe.com", "Stripe"),
+    ("https://www.google.com", "Google"),
+    ("https://openai.com", "OpenAI"),
+    ("https://github.com", "GitHub"),
+    ("https://pxxl.app", "Pxxl"),
+    ("https://api.stripe.com", "Stripe"),
+    ("https://www.facebook.com", "Facebook"),
 )
 
 
-def print_section(title: str, data: any, max_items: int = 5):
-    """Pretty print a section of data"""
-    print(f"\n{'='*80}")
-    print(f"  {title}")
-    print(f"{'='*80}")
+def format_section(title: str, data: any, max_items: int = 5) -> list[str]:
+    """Format a section of data as report lines"""
+    lines = []
+    lines.append(f"\n{SEP}")
+    lines.append(f"  {title}")
+    lines.append(f"{SEP}")
     
     if isinstance(data, dict):
         for key, value in list(data.items())[:max_items]:
             if isinstance(value, (dict, list)):
-                print(f"  {key}: {type(value).__name__} with {len(value)} items")
+                lines.append(f"  {key}: {type(value).__name__} with {len(value)} items")
             else:
-                print(f"  {key}: {value}")
+                lines.append(f"  {key}: {value}")
         
         if len(data) > max_items:
-            print(f"  ... and {len(data) - max_items} more fields")
+            lines.append(f"  ... and {len(data) - max_items} more fields")
     
     elif isinstance(data, list):
-        print(f"  Total items: {len(data)}")
+        lines.append(f"  Total items: {len(data)}")
         for i, item in enumerate(data[:max_items]):
             if isinstance(item, dict):
                 name = item.get('name') or item.get('title') or f"Item {i+1}"
-                print(f"  - {name}")
+                lines.append(f"  - {name}")
             else:
-                print(f"  - {item}")
+                lines.append(f"  - {item}")
         
         if len(data) > max_items:
-            print(f"  ... and {len(data) - max_items} more items")
+            lines.append(f"  ... and {len(data) - max_items} more items")
     
     else:
-        print(f"  {data}")
+        lines.append(f"  {data}")
+    
+    return lines
 
 
-def test_security_validator():
-    """Test security validation"""
-    print("\n" + "="*80)
-    print("TESTING SECURITY VALIDATOR")
-    print("="*80)
+def run_security_validator(quiet: bool = False) -> int:
+    """
+    Check every _SECURITY_CASES entry against SecurityValidator.
     
-    test_cases = [
-        ("https://stripe.com", True, "Valid HTTPS URL"),
-        ("http://google.com", True, "Valid HTTP URL"),
-        ("https://localhost", False, "Blocked localhost"),
-        ("https://127.0.0.1", False, "Blocked IP"),
-        ("https://192.168.1.1", False, "Blocked private IP"),
-        ("ftp://example.com", False, "Invalid protocol"),
-        ("javascript:alert('xss')", False, "XSS attempt"),
-        ("https://example.com/../../../etc/passwd", False, "Path traversal"),
-    ]
+    Passing cases are only printed when not quiet; mismatches always go to stderr.
     
-    for url, expected_valid, description in test_cases:
+    Returns:
+        Number of mismatches
+    """
+    if not quiet:
+        print("\n" + SEP)
+        print("TESTING SECURITY VALIDATOR")
+        print(SEP)
+    
+    failures = 0
+    for url, expected_valid, description in _SECURITY_CASES:
         is_valid, error = SecurityValidator.validate_url(url)
-        status = "✅" if is_valid == expected_valid else "❌"
-        print(f"{status} {description}: {url}")
-        if not is_valid:
-            print(f"   Error: {error}")
+        if is_valid != expected_valid:
+            failures += 1
+            sys.stderr.write(f"❌ {description}: {url} (error: {error})\n")
+        elif not quiet:
+            print(f"✅ {description}: {url}")
+            if not is_valid:
+                print(f"   Error: {error}")
+    return failures
 
 
-def test_name_extraction():
-    """Test company name extraction"""
-    print("\n" + "="*80)
-    print("TESTING COMPANY NAME EXTRACTION")
-    print("="*80)
+def run_name_extraction(quiet: bool = False) -> int:
+    """
+    Check every _NAME_CASES entry against CompanyNameExtractor.
+    
+    Passing cases are only printed when not quiet; mismatches always go to stderr.
     
-    test_cases = [
-        ("https://stripe.com", "Stripe"),
-        ("https://www.google.com", "Google"),
-        ("https://openai.com", "OpenAI"),
-        ("https://github.com", "GitHub"),
-        ("https://pxxl.app", "Pxxl"),
-        ("https://api.stripe.com", "Stripe"),
-        ("https://www.facebook.com", "Facebook"),
-    ]
+    Returns:
+        Number of mismatches
+    """
+    if not quiet:
+        print("\n" + SEP)
+        print("TESTING COMPANY NAME EXTRACTION")
+        print(SEP)
     
-    for url, expected_name in test_cases:
+    failures = 0
+    for url, expected_name in _NAME_CASES:
         extracted = CompanyNameExtractor.extract_from_url(url)
-        status = "✅" if extracted.lower() == expected_name.lower() else "⚠️"
-        print(f"{status} {url} -> {extracted} (expected: {expected_name})")
+        if extracted.lower() != expected_name.lower():
+            failures += 1
+            sys.stderr.write(f"⚠️ {url} -> {extracted} (expected: {expected_name})\n")
+        elif not quiet:
+            print(f"✅ {url} -> {extracted} (expected: {expected_name})")
+    return failures
+
+
+if pytest is not None:
+    @pytest.mark.parametrize("url,expected_valid,description", _SECURITY_CASES)
+    def test_security_validator(url: str, expected_valid: bool, description: str):
+        is_valid, error = SecurityValidator.validate_url(url)
+        assert is_valid == expected_valid, f"{description}: {url} ({error})"
+    
+    @pytest.mark.parametrize("url,expected_name", _NAME_CASES)
+    def test_name_extraction(url: str, expected_name: str):
+        assert CompanyNameExtractor.extract_from_url(url).lower() == expected_name.lower()
 
 
 async def test_orchestrator(website_url: str, company_name: str = None):
     """Test complete orchestrator"""
-    print("\n" + "="*80)
+    from app.services.scraping.unified_orchestrator import get_complete_company_intelligence
+    
+    print("\n" + SEP)
     print(f"TESTING UNIFIED ORCHESTRATOR")
     print(f"URL: {website_url}")
     if company_name:
         print(f"Company Name: {company_name}")
-    print("="*80)
+    print(SEP)
     
     try:
         # Run orchestrator
@@ -124,91 +180,92 @@ async def test_orchestrator(website_url: str, company_name: str = None):
             timeout=180  # 3 minutes
         )
         
-        # Print results
-        print("\n" + "🎉"*40)
-        print("SUCCESS! Company intelligence gathered")
-        print("🎉"*40)
+        # Print results, building the report first and writing it out once
+        out = []
+        out.append("\n" + PARTY)
+        out.append("SUCCESS! Company intelligence gathered")
+        out.append(PARTY)
         
         # Company info
-        print_section("COMPANY INFORMATION", result.get('company', {}))
+        out.extend(format_section("COMPANY INFORMATION", result.get('company', {})))
         
         # Financials
         financials = result.get('financials', {})
         if financials.get('public_company'):
             income_stmt = financials.get('income_statement') or {}
             balance = financials.get('balance_sheet') or {}
-            print_section("FINANCIALS (Public Company)", {
+            out.extend(format_section("FINANCIALS (Public Company)", {
                 'ticker': financials.get('ticker'),
                 'exchange': financials.get('exchange'),
                 'latest_revenue': income_stmt.get('revenue', {}).get('FY 2024') if isinstance(income_stmt, dict) else None,
                 'total_assets': balance.get('total_assets', {}).get('FY 2024') if isinstance(balance, dict) else None,
-            })
+            }))
         
         # Funding
         funding = result.get('funding', {})
         if funding.get('total_raised_usd'):
-            print_section("FUNDING (Private Company)", {
+            out.extend(format_section("FUNDING (Private Company)", {
                 'total_raised': f"${funding.get('total_raised_usd'):,}",
                 'round_count': funding.get('round_count'),
                 'investor_count': len(funding.get('investors', [])),
-            })
+            }))
         
         # People
         people = result.get('people', {})
-        print(f"\n{'='*80}")
-        print(f"  PEOPLE")
-        print(f"{'='*80}")
-        print(f"  Founders: {len(people.get('founders', []))}")
-        print(f"  Executives: {len(people.get('executives', []))}")
-        print(f"  Board Members: {len(people.get('board_members', []))}")
+        out.append(f"\n{SEP}")
+        out.append(f"  PEOPLE")
+        out.append(f"{SEP}")
+        out.append(f"  Founders: {len(people.get('founders', []))}")
+        out.append(f"  Executives: {len(people.get('executives', []))}")
+        out.append(f"  Board Members: {len(people.get('board_members', []))}")
         
         # Products
         products = result.get('products', [])
-        print_section("PRODUCTS & SERVICES", products, max_items=3)
+        out.extend(format_section("PRODUCTS & SERVICES", products, max_items=3))
         
         # Competitors
         competitors = result.get('competitors', [])
-        print_section("COMPETITORS", competitors, max_items=3)
+        out.extend(format_section("COMPETITORS", competitors, max_items=3))
         
         # News
         news = result.get('news', {})
-        print_section("NEWS & PRESS", {
+        out.extend(format_section("NEWS & PRESS", {
             'total_articles': news.get('total'),
             'date_range': news.get('date_range'),
             'recent_articles': len(news.get('articles', []))
-        })
+        }))
         
         # Online Presence
         online = result.get('online_presence', {})
-        print_section("ONLINE PRESENCE", {
+        out.extend(format_section("ONLINE PRESENCE", {
             'sitemap_pages': online.get('site_analysis', {}).get('sitemap_pages'),
             'social_accounts': len(online.get('social_media', {})),
             'emails': len(online.get('contact_info', {}).get('emails', [])),
             'phones': len(online.get('contact_info', {}).get('phones', [])),
-        })
+        }))
         
         # Metadata
         metadata = result.get('metadata', {})
-        print(f"\n{'='*80}")
-        print(f"  METADATA & QUALITY")
-        print(f"{'='*80}")
-        print(f"  Scrape ID: {metadata.get('scrape_id')}")
-        print(f"  Duration: {metadata.get('scrape_duration_seconds')}s")
-        print(f"  Data Quality Score: {metadata.get('data_quality_score')}/100")
-        print(f"  Timestamp: {metadata.get('scrape_timestamp')}")
+        out.append(f"\n{SEP}")
+        out.append(f"  METADATA & QUALITY")
+        out.append(f"{SEP}")
+        out.append(f"  Scrape ID: {metadata.get('scrape_id')}")
+        out.append(f"  Duration: {metadata.get('scrape_duration_seconds')}s")
+        out.append(f"  Data Quality Score: {metadata.get('data_quality_score')}/100")
+        out.append(f"  Timestamp: {metadata.get('scrape_timestamp')}")
         
         # Scraper status
-        print(f"\n  Scraper Status:")
+        out.append(f"\n  Scraper Status:")
         for scraper, status in metadata.get('scrapers_status', {}).items():
             icon = "✅" if status == "success" else "❌"
-            print(f"    {icon} {scraper}: {status}")
+            out.append(f"    {icon} {scraper}: {status}")
         
         # Save to file
         output_file = f"unified_intelligence_{result['company']['name'].lower().replace(' ', '_')}.json"
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2)
+        write_json(output_file, result)
         
-        print(f"\n💾 Full results saved to: {output_file}")
+        out.append(f"\n💾 Full results saved to: {output_file}")
+        sys.stdout.write("\n".join(out) + "\n")
         
         return result
         
@@ -227,19 +284,19 @@ async def test_orchestrator(website_url: str, company_name: str = None):
         return None
 
 
-async def main():
+async def main(quiet: bool = False):
     """Main test function"""
     # Run security tests
-    test_security_validator()
+    run_security_validator(quiet)
     
     # Run name extraction tests
-    test_name_extraction()
+    run_name_extraction(quiet)
     
     # Get URL from command line
     if len(sys.argv) < 2:
         print("\n❌ Error: Please provide a website URL")
         print("\nUsage:")
-        print("  python3 tests/test_unified_orchestrator.py <website_url> [company_name]")
+        print("  python3 tests/test_unified_orchestrator.py <website_url> [company_name] [--quiet]")
         print("\nExamples:")
         print("  python3 tests/test_unified_orchestrator.py 'https://stripe.com'")
         print("  python3 tests/test_unified_orchestrator.py 'https://openai.com'")
@@ -254,4 +311,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # --quiet / -q: skip passing checks and reports, print only the saved JSON path
+    quiet = '--quiet' in sys.argv or '-q' in sys.argv
+    sys.argv[1:] = [arg for arg in sys.argv[1:] if arg not in ('--quiet', '-q')]
+    with quiet_output(quiet):
+        run(main(quiet))
@@ -16,79 +16,75 @@ Examples:
 """
 
 import sys
-import asyncio
-import json
-import re
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from app.services.scraping.content.website_content_scraper import scrape_website_content
-from app.services.scraping.profile.company_profile_scraper import extract_company_name_from_url
+from _files import safe_filename, write_json, write_jsonl
+from _loop import run
+
+SEP = "=" * 70
 
 
 async def test_website_content_scraper(url: str, max_pages: int = 200):
     """Test the website content scraper."""
+    # Deferred so the usage message doesn't pay for the scraping stack
+    from app.services.scraping.content.website_content_scraper import scrape_website_content
+    from app.services.scraping.profile.company_profile_scraper import extract_company_name_from_url
     
     # Extract company name for filename
     company_name, _ = extract_company_name_from_url(url)
     
-    print(f"\n{'='*70}")
+    print(f"\n{SEP}")
     print(f"TESTING WEBSITE CONTENT SCRAPER")
-    print(f"{'='*70}")
+    print(f"{SEP}")
     print(f"URL: {url}")
     print(f"Max pages: {max_pages}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
     
     try:
         # Scrape website content
         data = await scrape_website_content(url, max_pages)
         
-        print("\n" + "="*70)
+        print("\n" + SEP)
         print("✅ SCRAPING COMPLETE")
-        print("="*70)
+        print(SEP)
         
         # Sanitize company name for filename
-        safe_name = re.sub(r'[^a-zA-Z0-9_-]', '_', company_name.lower().replace(' ', '_'))
-        safe_name = re.sub(r'_+', '_', safe_name).strip('_')
+        safe_name = safe_filename(company_name, ascii_only=True)
         
-        # Save clean version (without some verbose data)
-        output_filename = f"website_content_{safe_name}.json"
-        output_path = project_root / output_filename
+        # The result is written once. The URL lists are the bulk of it, so they're
+        # streamed to one-URL-per-line sidecars; the JSON keeps counts and samples
+        structure = data["structure"]
+        sitemap_path = project_root / f"website_content_{safe_name}_sitemap_urls.jsonl"
+        links_path = project_root / f"website_content_{safe_name}_internal_links.jsonl"
+        write_jsonl(sitemap_path, ({"url": u} for u in structure["sitemap_urls"]))
+        write_jsonl(links_path, ({"url": u} for u in structure["internal_links"]))
         
-        # Create clean copy
-        clean_data = {
-            "url": data["url"],
-            "domain": data["domain"],
+        full_data = {
+            **data,
             "structure": {
-                "total_pages_found": data["structure"]["total_pages_found"],
-                "sitemap_urls_count": len(data["structure"]["sitemap_urls"]),
-                "sitemap_urls_sample": data["structure"]["sitemap_urls"][:10],  # First 10
-                "robots_txt": data["structure"]["robots_txt"],
-                "internal_links_count": len(data["structure"]["internal_links"]),
-                "internal_links_sample": data["structure"]["internal_links"][:10],  # First 10
-                "key_pages": data["structure"]["key_pages"],
+                **{k: v for k, v in structure.items() if k not in ("sitemap_urls", "internal_links")},
+                "sitemap_urls_count": len(structure["sitemap_urls"]),
+                "sitemap_urls_sample": structure["sitemap_urls"][:10],
+                "sitemap_urls_file": sitemap_path.name,
+                "internal_links_count": len(structure["internal_links"]),
+                "internal_links_sample": structure["internal_links"][:10],
+                "internal_links_file": links_path.name,
             },
-            "identity": data["identity"],
-            "products_services": data["products_services"],
-            "contact_info": data["contact_info"],
-            "structured_data": data["structured_data"],
-            "metadata": data["metadata"],
         }
         
-        with open(output_path, "w") as f:
-            json.dump(clean_data, f, indent=2)
-        
-        # Save full data with all URLs
+        # Compact output; pretty-print with `python -m json.tool` when needed
         full_output_path = project_root / f"website_content_{safe_name}_full.json"
-        with open(full_output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        write_json(full_output_path, full_data, indent=False)
         
         print(f"\n💾 Data saved to:")
-        print(f"   - Clean version: {output_filename}")
-        print(f"   - Full version (all URLs): {full_output_path.name}")
+        print(f"   - Results (compact): {full_output_path.name}")
+        print(f"   - Sitemap URLs: {sitemap_path.name}")
+        print(f"   - Internal links: {links_path.name}")
+        print(f"\n   Summary view: jq '{{url, domain, identity, products_services, contact_info}}' {full_output_path.name}")
         
         return data
         
@@ -113,7 +109,7 @@ def main():
     max_pages = int(sys.argv[2]) if len(sys.argv) > 2 else 200
     
     # Run the test
-    asyncio.run(test_website_content_scraper(url, max_pages))
+    run(test_website_content_scraper(url, max_pages))
 
 
 if __name__ == "__main__":
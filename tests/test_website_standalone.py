@@ -6,24 +6,34 @@ Usage:
     python tests/test_website_standalone.py
     python tests/test_website_standalone.py https://stripe.com
     python tests/test_website_standalone.py https://stripe.com https://shopify.com
+    KRAWLR_TEST_CONCURRENCY=2 python tests/test_website_standalone.py https://stripe.com https://shopify.com
 """
 
 import asyncio
+import os
 import sys
-import json
+import traceback
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.services.scraping.website_scraper import website_scraper
+from _files import write_json
+from _loop import run
+
+SEP = "=" * 70
+
+# How many sites are scraped at once (KRAWLR_TEST_CONCURRENCY overrides)
+WEBSITE_CONCURRENCY = int(os.getenv("KRAWLR_TEST_CONCURRENCY", "4"))
 
 
 async def test_website_scraper(url: str):
     """Test website scraper with a specific URL."""
-    print(f"\n{'='*70}")
+    from app.services.scraping.website_scraper import website_scraper
+    
+    print(f"\n{SEP}")
     print(f"🧪 TESTING WEBSITE SCRAPER FOR: {url}")
-    print(f"{'='*70}\n")
+    print(f"{SEP}\n")
     
     # Scrape the website
     print(f"🌐 Starting comprehensive website scrape...\n")
@@ -33,115 +43,118 @@ async def test_website_scraper(url: str):
         print(f"❌ No data extracted from {url}")
         return
     
-    print(f"\n{'='*70}")
-    print(f"📊 RESULTS SUMMARY")
-    print(f"{'='*70}\n")
+    # Build the report first and write it out once, so concurrent runs don't interleave
+    out = []
+    out.append(f"\n{SEP}")
+    out.append(f"📊 RESULTS SUMMARY")
+    out.append(f"{SEP}\n")
     
     # Basic identity
-    print(f"🏢 Company Information:")
-    print(f"   - Name: {result.get('company_name', 'N/A')}")
-    print(f"   - Domain: {result.get('domain', 'N/A')}")
-    print(f"   - Description: {result.get('description', 'N/A')[:100]}...")
+    out.append(f"🏢 Company Information:")
+    out.append(f"   - Name: {result.get('company_name', 'N/A')}")
+    out.append(f"   - Domain: {result.get('domain', 'N/A')}")
+    out.append(f"   - Description: {result.get('description', 'N/A')[:100]}...")
     
     # Visual identity
-    print(f"\n🎨 Visual Identity:")
-    print(f"   - Logo: {result.get('logo_url', 'N/A')}")
-    print(f"   - Favicon: {result.get('favicon_url', 'N/A')}")
+    out.append(f"\n🎨 Visual Identity:")
+    out.append(f"   - Logo: {result.get('logo_url', 'N/A')}")
+    out.append(f"   - Favicon: {result.get('favicon_url', 'N/A')}")
     
     # Contact information
     emails = result.get('emails', [])
     phones = result.get('phones', [])
     addresses = result.get('addresses', [])
     
-    print(f"\n📞 Contact Information:")
-    print(f"   - Emails: {len(emails)}")
+    out.append(f"\n📞 Contact Information:")
+    out.append(f"   - Emails: {len(emails)}")
     if emails:
         for email in emails[:3]:
-            print(f"      • {email}")
+            out.append(f"      • {email}")
     
-    print(f"   - Phones: {len(phones)}")
+    out.append(f"   - Phones: {len(phones)}")
     if phones:
         for phone in phones[:3]:
-            print(f"      • {phone}")
+            out.append(f"      • {phone}")
     
-    print(f"   - Addresses: {len(addresses)}")
+    out.append(f"   - Addresses: {len(addresses)}")
     if addresses:
         for address in addresses[:3]:
-            print(f"      • {address}")
+            out.append(f"      • {address}")
     
     # Social links
     social = result.get('social_links', {})
-    print(f"\n🔗 Social Media:")
-    print(f"   - Platforms: {len(social)}")
+    out.append(f"\n🔗 Social Media:")
+    out.append(f"   - Platforms: {len(social)}")
     for platform, link in social.items():
-        print(f"      • {platform}: {link}")
+        out.append(f"      • {platform}: {link}")
     
     # Site structure
     sitemap_urls = result.get('sitemap_urls', [])
     internal_links = result.get('internal_links', [])
     
-    print(f"\n🗺️  Site Structure:")
-    print(f"   - Sitemap URLs: {len(sitemap_urls)}")
-    print(f"   - Internal Links: {len(internal_links)}")
+    out.append(f"\n🗺️  Site Structure:")
+    out.append(f"   - Sitemap URLs: {len(sitemap_urls)}")
+    out.append(f"   - Internal Links: {len(internal_links)}")
     
     # Products and services
     products = result.get('products', [])
-    print(f"\n📦 Products/Services: {len(products)}")
+    out.append(f"\n📦 Products/Services: {len(products)}")
     if products:
         for i, product in enumerate(products[:5], 1):
-            print(f"   {i}. {product.get('name', 'N/A')}")
-            print(f"      URL: {product.get('url', 'N/A')}")
+            out.append(f"   {i}. {product.get('name', 'N/A')}")
+            out.append(f"      URL: {product.get('url', 'N/A')}")
             if product.get('description'):
                 desc = product['description'][:100]
-                print(f"      Description: {desc}...")
+                out.append(f"      Description: {desc}...")
     
     # PDF documents
     pdfs = result.get('pdf_links', [])
-    print(f"\n📄 PDF Documents: {len(pdfs)}")
+    out.append(f"\n📄 PDF Documents: {len(pdfs)}")
     if pdfs:
         for i, pdf in enumerate(pdfs[:5], 1):
-            print(f"   {i}. {pdf}")
+            out.append(f"   {i}. {pdf}")
     
     # Structured data
     json_ld = result.get('json_ld', [])
     opengraph = result.get('opengraph', {})
     
-    print(f"\n📊 Structured Data:")
-    print(f"   - JSON-LD schemas: {len(json_ld)}")
+    out.append(f"\n📊 Structured Data:")
+    out.append(f"   - JSON-LD schemas: {len(json_ld)}")
     if json_ld:
         for schema in json_ld[:3]:
             schema_type = schema.get('@type', 'Unknown')
-            print(f"      • {schema_type}")
+            out.append(f"      • {schema_type}")
     
-    print(f"   - OpenGraph tags: {len(opengraph)}")
+    out.append(f"   - OpenGraph tags: {len(opengraph)}")
     if opengraph:
         for key, value in list(opengraph.items())[:5]:
-            print(f"      • {key}: {str(value)[:50]}")
+            out.append(f"      • {key}: {str(value)[:50]}")
     
     # Google Maps locations
     google_maps = result.get('google_maps_links', [])
-    print(f"\n📍 Google Maps Locations: {len(google_maps)}")
+    out.append(f"\n📍 Google Maps Locations: {len(google_maps)}")
     if google_maps:
         for i, location in enumerate(google_maps[:3], 1):
-            print(f"   {i}. {location}")
+            out.append(f"   {i}. {location}")
     
     # Save detailed output
     domain = result.get('domain', 'unknown')
     output_file = f"website_output_{domain}.json"
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2, default=str)
-    
-    print(f"\n💾 Full data saved to: {output_file}")
-    print(f"\n{'='*70}")
-    print(f"✅ TEST COMPLETED FOR {url}")
-    print(f"{'='*70}\n")
+    # Compact output for multi-MB results; `python -m json.tool` pretty-prints it
+    write_json(output_file, result, indent=False)
+    
+    out.append(f"\n💾 Full data saved to: {output_file}")
+    out.append(f"\n{SEP}")
+    out.append(f"✅ TEST COMPLETED FOR {url}")
+    out.append(f"{SEP}\n")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def main():
     """Main test function."""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("🚀 WEBSITE IDENTITY SCRAPER - STANDALONE TEST")
-    print("="*70)
+    print(SEP)
     
     # Get URLs from command line or use defaults
     if len(sys.argv) > 1:
@@ -154,27 +167,32 @@ async def main():
             print(f"   - {url}")
         print(f"\n   Usage: python tests/test_website_standalone.py URL1 URL2 ...")
     
-    # Test each URL
-    for url in urls:
-        try:
-            # Ensure URL has scheme
-            if not url.startswith(('http://', 'https://')):
-                url = f"https://{url}"
-            
-            await test_website_scraper(url)
-            await asyncio.sleep(2)  # Rate limiting
-        except KeyboardInterrupt:
-            print("\n\n⚠️  Test interrupted by user")
-            break
-        except Exception as e:
-            print(f"\n❌ Error testing {url}: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    print("\n" + "="*70)
+    # Ensure each URL has a scheme
+    urls = [url if url.startswith(('http://', 'https://')) else f"https://{url}" for url in urls]
+    
+    # Test URLs concurrently; the semaphore stands in for the old fixed delay
+    semaphore = asyncio.Semaphore(WEBSITE_CONCURRENCY)
+    
+    async def run(url: str):
+        async with semaphore:
+            return await test_website_scraper(url)
+    
+    try:
+        results = await asyncio.gather(*(run(url) for url in urls), return_exceptions=True)
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("\n\n⚠️  Test interrupted by user")
+        results = []
+    
+    # One failing site doesn't stop the others; report errors at the end
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            print(f"\n❌ Error testing {url}: {result}")
+            traceback.print_exception(result)
+    
+    print("\n" + SEP)
     print("✅ ALL TESTS COMPLETED")
-    print("="*70 + "\n")
+    print(SEP + "\n")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
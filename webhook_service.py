@@ -7,14 +7,31 @@ Run this as a separate service:
 """
 
 import asyncio
+import hashlib
+import hmac
 import logging
 import signal
 import sys
-import json
+import threading
+import time
 import httpx
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 from typing import Optional
+from urllib.parse import urlparse
 
 from google.cloud import pubsub_v1
+from google.cloud.pubsub_v1.subscriber.scheduler import ThreadScheduler
+
+# The delivery loop runs on uvloop when it's installed (not available on Windows)
+try:
+    import uvloop
+    new_event_loop = uvloop.new_event_loop
+except ImportError:
+    new_event_loop = asyncio.new_event_loop
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +43,62 @@ logger = logging.getLogger(__name__)
 # Import services
 from app.services.pubsub import get_pubsub_client, get_job_queue
 from app.core.database import db
+from app.core.config import get_settings
+
+# Webhook deliveries in flight at once
+WEBHOOK_CONCURRENCY = 20
+
+# Transport errors and 5xx responses are retried with jittered exponential
+# backoff, within an overall per-delivery deadline (seconds)
+WEBHOOK_MAX_ATTEMPTS = 5
+WEBHOOK_DEADLINE = 60
+
+# Each destination host gets at most HOST_RATE_LIMIT requests per second, and
+# is skipped for BREAKER_COOLDOWN seconds after BREAKER_THRESHOLD failed
+# deliveries in a row
+HOST_RATE_LIMIT = 10
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60
+
+# Pub/Sub callbacks run on this many threads (they do blocking Firestore
+# reads), with at most MAX_OUTSTANDING_MESSAGES leased at a time. A message
+# stays leased until its webhook is settled, so this also bounds the queue.
+CALLBACK_WORKERS = 32
+MAX_OUTSTANDING_MESSAGES = 200
+MAX_OUTSTANDING_BYTES = 100 * 1024 * 1024
+
+# How long a user's webhook setting is trusted before Firestore is read again
+USER_WEBHOOK_CACHE_TTL = 300
+
+# How long a delivered (job_id, webhook_url) is remembered to drop Pub/Sub redeliveries
+DELIVERED_TTL = 3600
+
+# Headers shared by every delivery; X-Krawlr-Job-Id (and the signature) are added per job
+_STATIC_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "Krawlr-Webhook/1.0",
+    "X-Krawlr-Event": "scrape.completed"
+}
+
+
+class CircuitOpen(RuntimeError):
+    """A webhook that wasn't attempted because its host's circuit is open."""
+
+
+def _make_payload(job_id: str, domain: str, status: str, data: dict) -> dict:
+    """Build the scrape.completed webhook body for a job."""
+    get = data.get
+    return {
+        "event": "scrape.completed",
+        "job_id": job_id,
+        "domain": domain,
+        "status": status,
+        "duration_seconds": get("duration_seconds"),
+        "data_quality_score": get("data_quality_score"),
+        "error": get("error"),
+        "timestamp": get("timestamp"),
+        "result_url": f"/api/v1/scrape/{job_id}"
+    }
 
 
 class WebhookService:
@@ -39,6 +112,35 @@ class WebhookService:
         self.running = False
         self.streaming_pull_future = None
         
+        # Deliveries run on one long-lived event loop in a background thread,
+        # so the pooled HTTP client's connections survive between messages
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        
+        # The Pub/Sub callback only enqueues (message, delivery) pairs; _worker
+        # sends from this queue and acks each message once its webhook is settled
+        self._queue: Optional[asyncio.Queue] = None
+        
+        # Keyed HMAC state is set up once and copied for each delivery
+        secret = get_settings().webhook_signing_secret
+        self._signer = hmac.new(secret.encode(), digestmod=hashlib.sha256) if secret else None
+        
+        # Per-host rate limiters and circuit breakers, only touched on the delivery loop
+        self._limiters: dict[str, AsyncLimiter] = {}
+        self._breakers: dict[str, dict] = {}
+        
+        # user_id -> webhook URL (or None when the user has none). Pub/Sub runs
+        # callbacks on a thread pool, so access goes through the lock.
+        self._user_webhook_cache = TTLCache(maxsize=10_000, ttl=USER_WEBHOOK_CACHE_TTL)
+        self._cache_lock = threading.Lock()
+        
+        # (job_id, webhook_url) keys queued or being sent, and recently delivered
+        # ones, so an at-least-once redelivery doesn't POST the same job twice
+        self._inflight: set[tuple[str, str]] = set()
+        self._recent = TTLCache(maxsize=10_000, ttl=DELIVERED_TTL)
+        self._dedup_lock = threading.Lock()
+        
         logger.info("🔔 WebhookService initialized")
     
     def callback(self, message: pubsub_v1.subscriber.message.Message) -> None:
@@ -48,9 +150,15 @@ class WebhookService:
         Args:
             message: Pub/Sub message containing completion data
         """
+        if not self.running:
+            # Shutting down: the delivery loop may already be stopped, and
+            # call_soon_threadsafe wouldn't say so; give the message back
+            message.nack()
+            return
+        
         try:
-            # Parse message data
-            data = json.loads(message.data.decode("utf-8"))
+            # Parse message data (orjson takes the raw bytes, no decode step)
+            data = orjson.loads(message.data)
             job_id = data.get("job_id")
             user_id = data.get("user_id")
             status = data.get("status")
@@ -58,43 +166,219 @@ class WebhookService:
             
             logger.info(f"📨 Received completion notification for job {job_id}: {status}")
             
-            # Get job data to check for webhook URL
-            job_data = self.job_queue.get_job_status(job_id)
-            
-            if not job_data:
-                logger.warning(f"Job {job_id} not found in database")
-                message.ack()
-                return
-            
-            webhook_url = job_data.get("webhook_url")
+            # The worker copies the job's webhook URL into the message; only
+            # messages from older publishers need the job read back
+            if "webhook_url" in data:
+                webhook_url = data["webhook_url"]
+            else:
+                job_data = self.job_queue.get_job_status(job_id)
+                
+                if not job_data:
+                    logger.warning(f"Job {job_id} not found in database")
+                    message.ack()
+                    return
+                
+                webhook_url = job_data.get("webhook_url")
             
             if not webhook_url:
                 # No webhook configured, check user settings
-                user_ref = self.db.collection("users").document(user_id)
-                user_doc = user_ref.get()
-                
-                if user_doc.exists:
-                    user_data = user_doc.to_dict()
-                    webhook_url = user_data.get("webhook_url")
+                webhook_url = self._lookup_user_webhook(user_id)
             
             if webhook_url:
-                # Send webhook
-                asyncio.run(self.send_webhook(
-                    webhook_url=webhook_url,
-                    job_id=job_id,
-                    domain=domain,
-                    status=status,
-                    data=data
-                ))
+                key = (job_id, webhook_url)
+                with self._dedup_lock:
+                    if key in self._inflight or key in self._recent:
+                        logger.info(f"🔁 Duplicate notification for job {job_id}, webhook already handled")
+                        message.ack()
+                        return
+                    self._inflight.add(key)
+                
+                # Hand off to the delivery worker, which acks the message
+                # once the webhook is sent or given up on
+                try:
+                    self._loop.call_soon_threadsafe(self._queue.put_nowait, (message, {
+                        "webhook_url": webhook_url,
+                        "job_id": job_id,
+                        "domain": domain,
+                        "status": status,
+                        "data": data
+                    }))
+                except Exception:
+                    self._finish_delivery(key, delivered=False)
+                    raise
             else:
                 logger.debug(f"No webhook URL configured for job {job_id}")
-            
-            message.ack()
+                message.ack()
             
         except Exception as e:
             logger.error(f"💥 Error processing webhook notification: {e}", exc_info=True)
             message.nack()
     
+    def _lookup_user_webhook(self, user_id: str) -> Optional[str]:
+        """
+        Get a user's default webhook URL, cached for USER_WEBHOOK_CACHE_TTL seconds.
+        
+        Users without a webhook are cached too, so they don't cost a
+        Firestore read on every completion.
+        
+        Args:
+            user_id: User identifier
+            
+        Returns:
+            Webhook URL or None if the user hasn't configured one
+        """
+        with self._cache_lock:
+            if user_id in self._user_webhook_cache:
+                return self._user_webhook_cache[user_id]
+        
+        webhook_url = None
+        # Only the webhook_url field is fetched and read, not the whole profile
+        user_doc = self.db.collection("users").document(user_id).get(field_paths=["webhook_url"])
+        if user_doc.exists:
+            try:
+                webhook_url = user_doc.get("webhook_url")
+            except KeyError:
+                # DocumentSnapshot.get raises rather than returning None for absent fields
+                pass
+        
+        with self._cache_lock:
+            self._user_webhook_cache[user_id] = webhook_url
+        return webhook_url
+    
+    def invalidate_user_webhook(self, user_id: str) -> None:
+        """Forget a cached webhook URL, e.g. after the user updates their profile."""
+        with self._cache_lock:
+            self._user_webhook_cache.pop(user_id, None)
+    
+    def _finish_delivery(self, key: tuple[str, str], delivered: bool) -> None:
+        """
+        Release a delivery's dedup key.
+        
+        Delivered keys are remembered for DELIVERED_TTL seconds so redeliveries
+        are skipped. Other keys are just dropped: a delivery cut off by shutdown
+        is nacked, and its redelivery has to get through.
+        """
+        with self._dedup_lock:
+            self._inflight.discard(key)
+            if delivered:
+                self._recent[key] = True
+    
+    def _hand_back(self, message: pubsub_v1.subscriber.message.Message, delivery: dict) -> None:
+        """Nack a delivery that never started, so another instance sends it."""
+        self._finish_delivery((delivery["job_id"], delivery["webhook_url"]), delivered=False)
+        message.nack()
+    
+    async def _worker(self) -> None:
+        """Drain the delivery queue, keeping up to WEBHOOK_CONCURRENCY deliveries in flight."""
+        semaphore = asyncio.Semaphore(WEBHOOK_CONCURRENCY)
+        in_flight = set()
+        
+        async def deliver(message: pubsub_v1.subscriber.message.Message, delivery: dict) -> None:
+            delivered = False
+            try:
+                delivered = await self.send_webhook(**delivery)
+            except CircuitOpen as e:
+                # Never attempted: Pub/Sub redelivers it, with backoff, once
+                # the host has had its cooldown
+                logger.warning(f"🚫 {e}, nacking webhook for job {delivery['job_id']}")
+                message.nack()
+            except BaseException:
+                # Cut off (shutdown): hand the message back for redelivery
+                message.nack()
+                raise
+            else:
+                # Sent, or attempted until retries ran out; a failed webhook
+                # is dropped here, the attempts are in the log
+                message.ack()
+            finally:
+                self._finish_delivery((delivery["job_id"], delivery["webhook_url"]), delivered)
+                semaphore.release()
+                self._queue.task_done()
+        
+        while True:
+            message, delivery = await self._queue.get()
+            # Each delivery holds only its own slot while it retries, so one
+            # slow endpoint can't hold up the deliveries queued behind it
+            try:
+                await semaphore.acquire()
+            except asyncio.CancelledError:
+                self._hand_back(message, delivery)
+                raise
+            task = asyncio.create_task(deliver(message, delivery))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+    
+    async def _shutdown(self) -> None:
+        """Flush queued deliveries, then stop the worker and close the client."""
+        # Give queued webhooks a chance to go out; anything left is nacked
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=10)
+        except TimeoutError:
+            logger.warning(f"⚠️  {self._queue.qsize()} webhook(s) still queued at shutdown, nacking for redelivery")
+        
+        # Cancelled deliveries nack their own messages
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
+        while not self._queue.empty():
+            self._hand_back(*self._queue.get_nowait())
+        
+        # The client belongs to this loop, so it has to be closed here
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared HTTP client, creating it on first use.
+        
+        HTTP/2 lets bursts of deliveries to one host (Zapier, n8n, ...) share
+        a single connection; hosts without it are spoken to over HTTP/1.1.
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=64,
+                    keepalive_expiry=60
+                )
+            )
+        return self._http
+    
+    async def _post_with_retry(
+        self,
+        client: httpx.AsyncClient,
+        limiter: AsyncLimiter,
+        webhook_url: str,
+        body: bytes,
+        headers: dict
+    ) -> httpx.Response:
+        """
+        POST a webhook, retrying transport errors and 5xx responses.
+        
+        4xx responses are returned as-is: they mean the endpoint is
+        misconfigured and repeating the request won't help.
+        
+        Raises:
+            httpx.TransportError or httpx.HTTPStatusError from the last attempt
+        """
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(WEBHOOK_MAX_ATTEMPTS),
+            wait=wait_exponential_jitter(initial=1, max=30),
+            retry=retry_if_exception_type((httpx.TransportError, httpx.HTTPStatusError)),
+            reraise=True
+        ):
+            with attempt:
+                async with limiter:
+                    response = await client.post(webhook_url, content=body, headers=headers)
+                if response.status_code >= 500:
+                    response.raise_for_status()
+        return response
+    
     async def send_webhook(
         self,
         webhook_url: str,
@@ -102,7 +386,7 @@ class WebhookService:
         domain: str,
         status: str,
         data: dict
-    ) -> None:
+    ) -> bool:
         """
         Send webhook HTTP POST to user's configured URL.
         
@@ -112,41 +396,72 @@ class WebhookService:
             domain: Company domain
             status: Job status (completed, failed)
             data: Complete job data
+            
+        Returns:
+            True if the endpoint answered with a 2xx
+            
+        Raises:
+            CircuitOpen: The host's circuit is open, so nothing was sent
         """
+        host = urlparse(webhook_url).netloc
+        breaker = self._breakers.setdefault(host, {"fails": 0, "open_until": 0.0})
+        if breaker["open_until"] > time.monotonic():
+            raise CircuitOpen(f"Circuit open for {host}")
+        
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = self._limiters[host] = AsyncLimiter(HOST_RATE_LIMIT, 1)
+        
+        delivered = False
         try:
-            payload = {
-                "event": "scrape.completed",
-                "job_id": job_id,
-                "domain": domain,
-                "status": status,
-                "duration_seconds": data.get("duration_seconds"),
-                "data_quality_score": data.get("data_quality_score"),
-                "error": data.get("error"),
-                "timestamp": data.get("timestamp"),
-                "result_url": f"/api/v1/scrape/{job_id}"
-            }
+            headers = _STATIC_HEADERS | {"X-Krawlr-Job-Id": job_id}
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    webhook_url,
-                    json=payload,
-                    headers={
-                        "Content-Type": "application/json",
-                        "User-Agent": "Krawlr-Webhook/1.0",
-                        "X-Krawlr-Event": "scrape.completed",
-                        "X-Krawlr-Job-Id": job_id
-                    }
-                )
-                
-                if response.status_code >= 200 and response.status_code < 300:
-                    logger.info(f"✅ Webhook sent successfully to {webhook_url} for job {job_id}")
-                else:
-                    logger.warning(f"⚠️  Webhook returned {response.status_code} for job {job_id}")
+            # Encode once so the signature covers exactly the bytes sent
+            body = orjson.dumps(_make_payload(job_id, domain, status, data))
+            if self._signer is not None:
+                signature = self._signer.copy()
+                signature.update(body)
+                headers["X-Krawlr-Signature"] = f"sha256={signature.hexdigest()}"
+            
+            client = await self._get_client()
+            response = await asyncio.wait_for(
+                self._post_with_retry(client, limiter, webhook_url, body, headers),
+                timeout=WEBHOOK_DEADLINE
+            )
+            
+            logger.debug(f"Webhook for job {job_id} used {response.http_version}")
+            
+            if response.status_code >= 200 and response.status_code < 300:
+                delivered = True
+                logger.info(f"✅ Webhook sent successfully to {webhook_url} for job {job_id}")
+            else:
+                logger.warning(f"⚠️  Webhook returned {response.status_code} for job {job_id}")
                     
         except httpx.TimeoutException:
             logger.error(f"⏰ Webhook timeout for {webhook_url} (job {job_id})")
+        except httpx.HTTPStatusError as e:
+            logger.error(f"❌ Webhook returned {e.response.status_code} for job {job_id} after {WEBHOOK_MAX_ATTEMPTS} attempts")
+        except TimeoutError:
+            logger.error(f"⏰ Gave up on webhook to {webhook_url} after {WEBHOOK_DEADLINE}s (job {job_id})")
         except Exception as e:
             logger.error(f"❌ Failed to send webhook to {webhook_url}: {e}")
+        finally:
+            self._record_delivery(host, breaker, delivered)
+        
+        return delivered
+    
+    def _record_delivery(self, host: str, breaker: dict, delivered: bool) -> None:
+        """Update a host's circuit breaker after a delivery attempt."""
+        if delivered:
+            breaker["fails"] = 0
+            return
+        
+        # The count is left as is when the circuit opens, so the first failure
+        # after the cooldown opens it again straight away
+        breaker["fails"] += 1
+        if breaker["fails"] >= BREAKER_THRESHOLD:
+            breaker["open_until"] = time.monotonic() + BREAKER_COOLDOWN
+            logger.warning(f"🚫 {breaker['fails']} failed webhooks in a row to {host}, pausing for {BREAKER_COOLDOWN}s")
     
     def start(self):
         """Start the webhook service."""
@@ -155,52 +470,114 @@ class WebhookService:
         
         self.running = True
         
+        # Start the delivery loop before any message can arrive
+        self._loop = new_event_loop()
+        logger.info(f"🔁 Delivery event loop: {type(self._loop).__module__}.{type(self._loop).__name__}")
+        if hasattr(asyncio, "eager_task_factory"):
+            # Python 3.12+: deliveries that finish without blocking (duplicate
+            # skips, open circuits) complete without a loop round-trip
+            self._loop.set_task_factory(asyncio.eager_task_factory)
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="webhook-delivery",
+            daemon=True
+        )
+        self._loop_thread.start()
+        
+        self._queue = asyncio.Queue()
+        asyncio.run_coroutine_threadsafe(self._worker(), self._loop)
+        
         # Subscribe to scrape-completed topic
         self.streaming_pull_future = self.pubsub.subscribe_to_scrape_completed(
             callback=self.callback,
-            subscription_name="scrape-completed-webhook"
+            subscription_name="scrape-completed-webhook",
+            flow_control=pubsub_v1.types.FlowControl(
+                max_messages=MAX_OUTSTANDING_MESSAGES,
+                max_bytes=MAX_OUTSTANDING_BYTES
+            ),
+            scheduler=ThreadScheduler(
+                executor=ThreadPoolExecutor(
+                    max_workers=CALLBACK_WORKERS,
+                    thread_name_prefix="webhook-callback"
+                )
+            )
         )
         
         logger.info("✅ WebhookService is running!")
         logger.info("💡 Press Ctrl+C to stop gracefully...")
         
         try:
-            # Block and listen for messages
-            self.streaming_pull_future.result()
+            # Listen for messages until request_stop() or the stream fails;
+            # polled, since the signal handler can't safely wake a wait
+            while self.running:
+                try:
+                    self.streaming_pull_future.result(timeout=1)
+                    break
+                except TimeoutError:
+                    pass
         except KeyboardInterrupt:
             logger.info("⚠️  Received interrupt signal, shutting down gracefully...")
-            self.stop()
         except Exception as e:
             logger.error(f"💥 WebhookService error: {e}", exc_info=True)
+        finally:
             self.stop()
     
+    def request_stop(self, sig: Optional[int] = None) -> None:
+        """
+        Stop taking notifications; start() then flushes queued webhooks and cleans up.
+        
+        Only clears the running flag, so it is safe to call from a signal
+        handler. A second request exits immediately.
+        
+        Args:
+            sig: Signal that triggered the shutdown, if any
+        """
+        if not self.running:
+            logger.warning("⚠️  Shutdown already in progress, exiting now")
+            sys.exit(1)
+        
+        logger.info(f"Received signal {sig}, flushing queued webhooks before shutting down...")
+        self.running = False
+    
     def stop(self):
         """Stop the service gracefully."""
         logger.info("🛑 Stopping WebhookService...")
         
+        # New notifications are nacked from here on
         self.running = False
         
-        if self.streaming_pull_future:
+        # Flush queued webhooks while the stream is still open
+        if self._loop and self._loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=30)
+            except Exception as e:
+                logger.warning(f"⚠️  Error flushing webhooks: {e}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=10)
+            if not self._loop_thread.is_alive():
+                self._loop.close()
+        
+        if self.streaming_pull_future and not self.streaming_pull_future.done():
             self.streaming_pull_future.cancel()
             logger.info("✅ Cancelled subscription")
         
         logger.info("👋 WebhookService stopped")
 
 
-def signal_handler(sig, frame):
-    """Handle shutdown signals."""
-    logger.info(f"Received signal {sig}, shutting down...")
-    sys.exit(0)
-
-
 def main():
     """Main entry point for webhook service."""
+    # Create service
+    service = WebhookService()
+    
+    def signal_handler(sig, frame):
+        """Handle shutdown signals."""
+        service.request_stop(sig)
+    
     # Setup signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
-    # Create and start service
-    service = WebhookService()
+    # Start service
     service.start()
 
 
@@ -12,15 +12,26 @@ For production:
 """
 
 import asyncio
+import functools
 import logging
 import signal
 import sys
-import json
+import threading
 import time
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
 from google.cloud import pubsub_v1
+from google.cloud.pubsub_v1.subscriber.scheduler import ThreadScheduler
+
+# Jobs run on uvloop when it's installed (it isn't available on Windows)
+try:
+    import uvloop
+    new_event_loop = uvloop.new_event_loop
+except ImportError:
+    new_event_loop = asyncio.new_event_loop
 
 # Configure logging
 logging.basicConfig(
@@ -33,6 +44,97 @@ logger = logging.getLogger(__name__)
 from app.services.pubsub import get_pubsub_client, get_job_queue
 from app.services.scraping.unified_orchestrator import UnifiedOrchestrator  # Use real orchestrator
 from app.services.scraping.firestore_service import firestore_service
+from app.services.utils.http_pool import open_pool, close_pool
+
+# Jobs leased from Pub/Sub at once; a message stays leased until its job
+# finishes on the job loop. Every job runs a multi-minute scrape, so prefetching more than can be worked
+# on only lets their leases expire.
+JOB_CONCURRENCY = 6
+MAX_OUTSTANDING_BYTES = 10 * 1024 * 1024
+
+# Parallel streaming pulls on the subscription. Each gets its own gRPC stream
+# and an equal share of the job and byte limits above.
+PULL_STREAMS = 2
+
+# The orchestrator's scraper timeout (seconds). AI enrichment, saving and the
+# job status writes and publishes all run after it.
+SCRAPE_TIMEOUT = 300
+
+# A lease is held for at most this long, well past the worst-case end-to-end
+# job time, so a slow job is never redelivered to another worker mid-run
+MAX_LEASE_DURATION = 900
+
+# The client keeps extending each lease until the message is acked. Each
+# extension lasts between these bounds (seconds), so a crashed worker's job is
+# redelivered within ACK_EXTENSION_MAX instead of the subscription's 10 minutes.
+ACK_EXTENSION_MIN = 60
+ACK_EXTENSION_MAX = 300
+
+# On shutdown, running jobs get this long (seconds) to finish before they are
+# cancelled and their messages nacked; platforms kill the process ~30s after SIGTERM
+SHUTDOWN_GRACE = 20
+
+# Deliveries of a failing job before Pub/Sub parks it on the dead-letter topic
+MAX_DELIVERY_ATTEMPTS = 5
+
+# Fields read from each scrape job message, in unpacking order
+_JOB_FIELDS = ("job_id", "domain", "user_id", "url", "company_name", "webhook_url")
+
+# Progress reported by every job: (stage, percent, job message, progress event message)
+PROGRESS_STAGES = (
+    ("profile", 10, "Scraping company profile...",
+     "Scraping company profile from Wikipedia, Crunchbase, etc."),
+    ("website", 30, "Analyzing website content...",
+     "Analyzing website structure and extracting metadata"),
+    ("financial", 50, "Fetching financial data...",
+     "Gathering financial data from EDGAR and PitchBook"),
+    ("enrichment", 80, "Enriching data with AI...",
+     "AI-powered data enrichment and cleaning"),
+    ("saving", 95, "Saving to database...",
+     "Saving results to Firestore"),
+    ("completed", 100, "Scraping completed successfully!",
+     "All data scraped, enriched, and saved successfully"),
+)
+# Stages sent as the orchestrator starts, after it returns, and at the end.
+# It runs the profile, website and financial scrapers in parallel and enriches
+# the result itself, so only the first stage is known to be reached up front.
+_SCRAPE_STAGES = PROGRESS_STAGES[:1]
+_POST_SCRAPE_STAGES = PROGRESS_STAGES[1:5]
+_COMPLETED_STAGE = PROGRESS_STAGES[5]
+
+
+class PoisonMessage(ValueError):
+    """A job message that can never be processed, however often it's redelivered."""
+
+
+def _parse_job(raw: bytes) -> dict:
+    """
+    Decode a scrape job message and check it names a job and a domain.
+    
+    Args:
+        raw: Message payload
+        
+    Returns:
+        The job data
+        
+    Raises:
+        PoisonMessage: If the payload isn't a usable job
+    """
+    try:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
+        raise PoisonMessage(f"invalid JSON: {e}") from e
+    
+    if not isinstance(data, dict):
+        raise PoisonMessage(f"expected a JSON object, got {type(data).__name__}")
+    for field in ("job_id", "domain"):
+        if not data.get(field) or not isinstance(data[field], str):
+            raise PoisonMessage(f"missing or invalid {field!r}")
+    return data
+
+
+class JobFailed(RuntimeError):
+    """A job that failed on this delivery; its message is nacked for redelivery."""
 
 
 class ScrapeWorker:
@@ -43,113 +145,225 @@ class ScrapeWorker:
         self.pubsub = get_pubsub_client()
         self.job_queue = get_job_queue()
         # Initialize with longer timeout (5 minutes)
-        self.orchestrator = UnifiedOrchestrator(max_workers=6, timeout=300)
+        self.orchestrator = UnifiedOrchestrator(max_workers=6, timeout=SCRAPE_TIMEOUT)
         self.running = False
-        self.streaming_pull_future = None
+        self.streaming_pull_futures = []
+        
+        # Jobs and publishes run on one long-lived event loop in a background
+        # thread, so clients and connection pools are reused across messages
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        # Jobs scheduled on the loop whose messages are not yet acked; added
+        # from callback threads and removed from the loop thread
+        self._jobs: set[Future] = set()
+        self._jobs_lock = threading.Lock()
         
         logger.info("🚀 ScrapeWorker initialized with 5-minute timeout")
     
+    def _run(self, coro):
+        """
+        Run a coroutine on the worker's event loop and wait for its result.
+        
+        Called from Pub/Sub callback threads.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    def request_stop(self, sig: Optional[int] = None) -> None:
+        """
+        Stop taking new jobs; start() then waits for in-flight jobs and cleans up.
+        
+        Only clears the running flag, so it is safe to call from a signal
+        handler. A second request exits immediately.
+        
+        Args:
+            sig: Signal that triggered the shutdown, if any
+        """
+        if not self.running:
+            logger.warning("⚠️  Shutdown already in progress, exiting now")
+            sys.exit(1)
+        
+        logger.info(f"Received signal {sig}, finishing in-flight jobs before shutting down...")
+        self.running = False
+    
     def callback(self, message: pubsub_v1.subscriber.message.Message) -> None:
         """
-        Process incoming scrape job messages.
+        Hand an incoming scrape job message to the job loop.
+        
+        Returns as soon as the job is scheduled; the message is acked or
+        nacked when the job finishes, and its lease is extended until then.
         
         Args:
             message: Pub/Sub message containing job data
         """
+        if not self.running:
+            # Shutting down: give the message back for another worker
+            message.nack()
+            return
+        
         try:
-            # Parse message data
-            data = json.loads(message.data.decode("utf-8"))
-            job_id = data.get("job_id")
-            domain = data.get("domain")
-            user_id = data.get("user_id")
-            
-            logger.info(f"📨 Received job {job_id} for domain {domain}")
+            # Parse and validate message data before touching the job
+            data = _parse_job(message.data)
+        except PoisonMessage as e:
+            self._dead_letter(message, e)
+            return
+        
+        job = asyncio.run_coroutine_threadsafe(
+            self._process(data, message.delivery_attempt),
+            self._loop
+        )
+        with self._jobs_lock:
+            self._jobs.add(job)
+        job.add_done_callback(functools.partial(self._settle, message))
+    
+    def _settle(self, message: pubsub_v1.subscriber.message.Message, job: Future) -> None:
+        """
+        Ack or nack a message once its job has finished.
+        
+        Args:
+            message: The job's Pub/Sub message
+            job: Finished job future
+        """
+        with self._jobs_lock:
+            self._jobs.discard(job)
+        if job.cancelled() or job.exception() is not None:
+            # Pub/Sub redelivers it, or dead-letters it after the last attempt
+            message.nack()
+        else:
+            message.ack()
+    
+    def _dead_letter(self, message: pubsub_v1.subscriber.message.Message, error: PoisonMessage) -> None:
+        """
+        Park a malformed message on the dead-letter topic and ack it.
+        
+        Args:
+            message: The rejected Pub/Sub message
+            error: Why it was rejected
+        """
+        # Redelivery can't fix a malformed message
+        logger.error("☠️  Rejecting malformed message %s: %s", message.message_id, error)
+        try:
+            self._run(self.pubsub.publish_dead_letter(
+                message.data,
+                str(error),
+                dict(message.attributes)
+            ))
+        except Exception as dlq_error:
+            # Keep the message rather than lose it
+            logger.error("💥 Could not dead-letter message %s: %s", message.message_id, dlq_error)
+            message.nack()
+            return
+        message.ack()
+    
+    async def _process(self, data: dict, delivery_attempt: Optional[int]) -> None:
+        """
+        Run a scrape job and record its outcome.
+        
+        A failed job raises JobFailed so its message is nacked: Pub/Sub
+        redelivers it until MAX_DELIVERY_ATTEMPTS, then moves it to the
+        dead-letter topic.
+        
+        Args:
+            data: Validated job data
+            delivery_attempt: Pub/Sub delivery count, or None if the
+                subscription has no dead-letter policy
+        """
+        job_id, domain, user_id, url, company_name, webhook_url = map(data.get, _JOB_FIELDS)
+        start_time = time.perf_counter()
+        
+        try:
+            logger.info("📨 Received job %s for domain %s (attempt %s)", job_id, domain, delivery_attempt)
             
-            # Update job status to processing
-            self.job_queue.update_job_status(
+            # Update job status to processing (Firestore calls block, so they
+            # run in a thread to keep other jobs on the loop moving)
+            await asyncio.to_thread(
+                self.job_queue.update_job_status,
                 job_id=job_id,
                 status="processing"
             )
             
             # Publish progress: Starting
-            asyncio.run(self.pubsub.publish_scrape_progress(
+            await self.pubsub.publish_scrape_progress(
                 job_id=job_id,
                 stage="starting",
                 progress_percent=0,
                 message="Worker picked up job, initializing scrapers..."
-            ))
+            )
             
             # Run the scraping job
-            start_time = time.time()
-            result = asyncio.run(self.run_scraping_job(
+            result = await self.run_scraping_job(
                 job_id=job_id,
                 domain=domain,
-                url=data.get("url"),
-                company_name=data.get("company_name"),
+                url=url,
+                company_name=company_name,
                 user_id=user_id
-            ))
-            duration = time.time() - start_time
+            )
+            duration = time.perf_counter() - start_time
             
             if result and not result.get("error"):
                 # Success - mark as completed
-                self.job_queue.mark_job_completed(
+                data_quality_score = (result.get("metadata") or {}).get("data_quality_score")
+                await asyncio.to_thread(
+                    self.job_queue.mark_job_completed,
                     job_id=job_id,
                     result=result,
                     duration_seconds=duration,
-                    data_quality_score=result.get("metadata", {}).get("data_quality_score")
+                    data_quality_score=data_quality_score
                 )
                 
                 # Publish completion notification
-                asyncio.run(self.pubsub.publish_scrape_completed(
+                await self.pubsub.publish_scrape_completed(
                     job_id=job_id,
                     domain=domain,
                     user_id=user_id,
                     status="completed",
                     duration_seconds=duration,
-                    data_quality_score=result.get("metadata", {}).get("data_quality_score")
-                ))
-                
-                logger.info(f"✅ Job {job_id} completed successfully in {duration:.2f}s")
-                message.ack()
-                
-            else:
-                # Failed - mark as failed
-                error = result.get("error", "Unknown error") if result else "Scraping returned no result"
-                self.job_queue.mark_job_failed(
-                    job_id=job_id,
-                    error=error,
-                    retry=False  # Don't auto-retry for now
+                    data_quality_score=data_quality_score,
+                    webhook_url=webhook_url
                 )
                 
+                logger.info("✅ Job %s completed successfully in %.2fs", job_id, duration)
+                return
+            
+            error = result.get("error", "Unknown error") if result else "Scraping returned no result"
+            logger.error("❌ Job %s failed: %s", job_id, error)
+            
+        except Exception as e:
+            logger.error("💥 Error processing job %s: %s", job_id, e, exc_info=True)
+            error = str(e)
+        
+        # Without a dead-letter policy there are no redeliveries to count on
+        final_attempt = delivery_attempt is None or delivery_attempt >= MAX_DELIVERY_ATTEMPTS
+        try:
+            await asyncio.to_thread(
+                self.job_queue.mark_job_failed,
+                job_id=job_id,
+                error=error,
+                retry=not final_attempt
+            )
+            if final_attempt:
                 # Publish failure notification
-                asyncio.run(self.pubsub.publish_scrape_completed(
+                await self.pubsub.publish_scrape_completed(
                     job_id=job_id,
                     domain=domain,
                     user_id=user_id,
                     status="failed",
-                    duration_seconds=duration,
-                    error=error
-                ))
-                
-                logger.error(f"❌ Job {job_id} failed: {error}")
-                message.ack()  # Ack anyway to prevent infinite retries
-                
+                    duration_seconds=time.perf_counter() - start_time,
+                    error=error,
+                    webhook_url=webhook_url
+                )
         except Exception as e:
-            logger.error(f"💥 Error processing message: {e}", exc_info=True)
-            
-            # Try to mark job as failed if we have job_id
-            try:
-                if 'job_id' in locals():
-                    self.job_queue.mark_job_failed(
-                        job_id=job_id,
-                        error=str(e),
-                        retry=False
-                    )
-            except:
-                pass
-            
-            # Nack the message to retry (Pub/Sub will retry with exponential backoff)
-            message.nack()
+            logger.warning("⚠️  Could not record failure of job %s: %s", job_id, e)
+        
+        if final_attempt and delivery_attempt is None:
+            # Nothing would ever stop the redeliveries, so the job ends here
+            return
+        raise JobFailed(error)
     
     async def run_scraping_job(
         self,
@@ -172,117 +386,113 @@ class ScrapeWorker:
         Returns:
             Scraping result dict
         """
+        # (stage, percent, job message, progress event message) waiting to be sent
+        progress = []
+        target_url = url if url else "https://" + domain
+        
         try:
-            # Progress: Profile scraping (10%)
-            self.job_queue.update_job_progress(
-                job_id=job_id,
-                stage="profile",
-                progress_percent=10,
-                message="Scraping company profile..."
-            )
-            await self.pubsub.publish_scrape_progress(
-                job_id=job_id,
-                stage="profile",
-                progress_percent=10,
-                message="Scraping company profile from Wikipedia, Crunchbase, etc."
-            )
-            
-            # Progress: Website analysis (30%)
-            self.job_queue.update_job_progress(
-                job_id=job_id,
-                stage="website",
-                progress_percent=30,
-                message="Analyzing website content..."
-            )
-            await self.pubsub.publish_scrape_progress(
-                job_id=job_id,
-                stage="website",
-                progress_percent=30,
-                message="Analyzing website structure and extracting metadata"
-            )
-            
-            # Progress: Financial data (50%)
-            self.job_queue.update_job_progress(
-                job_id=job_id,
-                stage="financial",
-                progress_percent=50,
-                message="Fetching financial data..."
-            )
-            await self.pubsub.publish_scrape_progress(
-                job_id=job_id,
-                stage="financial",
-                progress_percent=50,
-                message="Gathering financial data from EDGAR and PitchBook"
-            )
+            # Progress: Scrapers starting
+            progress.extend(_SCRAPE_STAGES)
+            await self._flush_progress(job_id, progress)
             
             # Run unified orchestrator
             result = await self.orchestrator.get_complete_company_intelligence(
-                website_url=url or f"https://{domain}",
+                website_url=target_url,
                 company_name=company_name,
                 user_id=user_id,
                 scrape_id=job_id
             )
             
-            # Progress: AI enrichment (80%)
-            self.job_queue.update_job_progress(
-                job_id=job_id,
-                stage="enrichment",
-                progress_percent=80,
-                message="Enriching data with AI..."
-            )
-            await self.pubsub.publish_scrape_progress(
-                job_id=job_id,
-                stage="enrichment",
-                progress_percent=80,
-                message="AI-powered data enrichment and cleaning"
-            )
+            # Log result summary (skipped entirely when INFO is filtered out)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Scrape result keys: %s", list(result))
+                logger.info("Company name: %s", result.get('company_name', 'N/A'))
+                logger.info("Domain: %s", result.get('domain', 'N/A'))
             
-            # Progress: Saving (95%)
-            self.job_queue.update_job_progress(
-                job_id=job_id,
-                stage="saving",
-                progress_percent=95,
-                message="Saving to database..."
+            # Progress: Website, financial data, AI enrichment done; saving -
+            # sent while the result is saved to cache
+            progress.extend(_POST_SCRAPE_STAGES)
+            saved, flushed = await asyncio.gather(
+                firestore_service.save_company_data(domain, result),
+                self._flush_progress(job_id, progress),
+                return_exceptions=True
             )
-            await self.pubsub.publish_scrape_progress(
-                job_id=job_id,
-                stage="saving",
-                progress_percent=95,
-                message="Saving results to Firestore"
-            )
-            
-            # Log result summary
-            logger.info(f"Scrape result keys: {list(result.keys())}")
-            logger.info(f"Company name: {result.get('company_name', 'N/A')}")
-            logger.info(f"Domain: {result.get('domain', 'N/A')}")
-            
-            # Save to cache
-            await firestore_service.save_company_data(domain, result)
+            if isinstance(flushed, Exception):
+                logger.warning("⚠️  Progress update failed for job %s: %s", job_id, flushed)
+                progress.clear()
+            if isinstance(saved, Exception):
+                # The job fails without its saved result
+                raise saved
             
             # Progress: Complete (100%)
-            self.job_queue.update_job_progress(
-                job_id=job_id,
-                stage="completed",
-                progress_percent=100,
-                message="Scraping completed successfully!"
-            )
-            await self.pubsub.publish_scrape_progress(
-                job_id=job_id,
-                stage="completed",
-                progress_percent=100,
-                message="All data scraped, enriched, and saved successfully"
-            )
+            progress.append(_COMPLETED_STAGE)
+            await self._flush_progress(job_id, progress)
             
             return result
             
         except Exception as e:
-            logger.error(f"Error in scraping job {job_id}: {e}", exc_info=True)
+            logger.error("Error in scraping job %s (%s): %s", job_id, target_url, e, exc_info=True)
             return {
                 "error": str(e),
                 "job_id": job_id,
                 "domain": domain
             }
     
+    async def _flush_progress(self, job_id: str, progress: list) -> None:
+        """
+        Send queued progress updates and clear the list.
+        
+        The job document only keeps the current stage, so it gets a single
+        write for the latest update; every update is still published for
+        real-time listeners, as one batch.
+        
+        Args:
+            job_id: Job identifier
+            progress: (stage, percent, job message, event message) tuples
+        """
+        if not progress:
+            return
+        
+        stage, percent, job_message, _ = progress[-1]
+        await asyncio.to_thread(
+            self.job_queue.update_job_progress,
+            job_id=job_id,
+            stage=stage,
+            progress_percent=percent,
+            message=job_message
+        )
+        await self.pubsub.publish_scrape_progress_batch(
+            job_id,
+            [(stage, percent, message) for stage, percent, _, message in progress]
+        )
+        progress.clear()
+    
+    async def _warmup(self) -> None:
+        """
+        Open the Pub/Sub and Firestore connections before the first job needs them.
+        
+        The channel handshakes and credential fetches otherwise land inside
+        the first job's time budget. Failures are logged and ignored; the
+        jobs will simply connect on their own.
+        """
+        warmups = {
+            "Pub/Sub": lambda: self.pubsub.publisher.get_topic(
+                request={"topic": self.pubsub.scrape_progress_topic}
+            ),
+            # Reading a document that doesn't exist is enough to open the channel
+            "Firestore": lambda: self.job_queue.db.collection(
+                self.job_queue.jobs_collection
+            ).document("_warmup").get()
+        }
+        results = await asyncio.gather(
+            *(asyncio.to_thread(warmup) for warmup in warmups.values()),
+            return_exceptions=True
+        )
+        for name, result in zip(warmups, results):
+            if isinstance(result, Exception):
+                logger.warning("⚠️  %s warm-up failed: %s", name, result)
+        logger.info("🔥 Warm-up done")
+    
     def start(self):
         """Start the worker to listen for jobs."""
         logger.info("🔥 Starting ScrapeWorker...")
@@ -290,52 +500,126 @@ class ScrapeWorker:
         
         self.running = True
         
-        # Subscribe to scrape-jobs topic
-        self.streaming_pull_future = self.pubsub.subscribe_to_scrape_jobs(
-            callback=self.callback,
-            subscription_name="scrape-jobs-worker"
+        # Start the job loop before any message can arrive
+        self._loop = new_event_loop()
+        if hasattr(asyncio, "eager_task_factory"):
+            # Python 3.12+: tasks run inline until they first block
+            self._loop.set_task_factory(asyncio.eager_task_factory)
+        logger.info(f"🔁 Job event loop: {type(self._loop).__module__}.{type(self._loop).__name__}")
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="worker-loop",
+            daemon=True
         )
+        self._loop_thread.start()
+        
+        # Scrapers on this loop share one pooled HTTP client across jobs
+        self._run(open_pool())
+        self._run(self._warmup())
+        
+        # Subscribe to scrape-jobs topic, one streaming pull per stream
+        jobs_per_stream = max(1, JOB_CONCURRENCY // PULL_STREAMS)
+        for stream in range(PULL_STREAMS):
+            self.streaming_pull_futures.append(self.pubsub.subscribe_to_scrape_jobs(
+                callback=self.callback,
+                subscription_name="scrape-jobs-worker",
+                flow_control=pubsub_v1.types.FlowControl(
+                    max_messages=jobs_per_stream,
+                    max_bytes=MAX_OUTSTANDING_BYTES // PULL_STREAMS,
+                    max_lease_duration=MAX_LEASE_DURATION,
+                    min_duration_per_ack_extension=ACK_EXTENSION_MIN,
+                    max_duration_per_ack_extension=ACK_EXTENSION_MAX
+                ),
+                max_delivery_attempts=MAX_DELIVERY_ATTEMPTS,
+                # A scheduler is shut down with its stream, so each needs its own
+                scheduler=ThreadScheduler(
+                    executor=ThreadPoolExecutor(
+                        max_workers=jobs_per_stream,
+                        thread_name_prefix=f"scrape-worker-{stream}"
+                    )
+                ),
+                # Once cancelled, the future resolves only after running callbacks return
+                await_callbacks_on_shutdown=True
+            ))
         
         logger.info("✅ Worker is running and listening for jobs!")
         logger.info("💡 Press Ctrl+C to stop gracefully...")
         
         try:
-            # Block and listen for messages
-            self.streaming_pull_future.result()
+            # Listen for messages until request_stop() or a stream fails;
+            # polled, since the signal handler can't safely wake a wait
+            while self.running:
+                done, _ = wait(self.streaming_pull_futures, timeout=1, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    future.result()
+                if done:
+                    break
         except KeyboardInterrupt:
             logger.info("⚠️  Received interrupt signal, shutting down gracefully...")
-            self.stop()
         except Exception as e:
             logger.error(f"💥 Worker error: {e}", exc_info=True)
+        finally:
             self.stop()
     
     def stop(self):
         """Stop the worker gracefully."""
         logger.info("🛑 Stopping ScrapeWorker...")
         
+        # New messages are nacked from here on
         self.running = False
         
-        if self.streaming_pull_future:
-            self.streaming_pull_future.cancel()
+        # Finish running jobs while the streams are still open to ack them
+        with self._jobs_lock:
+            running = list(self._jobs)
+        if running:
+            logger.info(f"⏳ Waiting up to {SHUTDOWN_GRACE}s for {len(running)} running job(s) to finish...")
+            _, unfinished = wait(running, timeout=SHUTDOWN_GRACE)
+            if unfinished:
+                # Cancelled jobs nack their messages for another worker
+                logger.warning(f"⚠️  Cancelling {len(unfinished)} unfinished job(s)")
+                for job in unfinished:
+                    job.cancel()
+                wait(unfinished, timeout=5)
+        
+        pending = [future for future in self.streaming_pull_futures if not future.done()]
+        for future in pending:
+            future.cancel()
+        if pending:
+            wait(pending)
             logger.info("✅ Cancelled subscription")
         
+        if self._loop and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(close_pool(), self._loop).result(timeout=10)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=10)
+            if not self._loop_thread.is_alive():
+                self._loop.close()
+        
+        # Send any progress messages still batched in the publisher, then
+        # close the gRPC channels
+        try:
+            self.pubsub.publisher.stop()
+            self.pubsub.subscriber.close()
+        except Exception as e:
+            logger.warning(f"⚠️  Error closing Pub/Sub clients: {e}")
+        
         logger.info("👋 Worker stopped")
 
 
-def signal_handler(sig, frame):
-    """Handle shutdown signals."""
-    logger.info(f"Received signal {sig}, shutting down...")
-    sys.exit(0)
-
-
 def main():
     """Main entry point for worker."""
+    # Create worker
+    worker = ScrapeWorker()
+    
+    def signal_handler(sig, frame):
+        """Handle shutdown signals."""
+        worker.request_stop(sig)
+    
     # Setup signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
-    # Create and start worker
-    worker = ScrapeWorker()
+    # Start worker
     worker.start()
 
 